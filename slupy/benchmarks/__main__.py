@@ -0,0 +1,94 @@
+"""
+Benchmark suite of `slupy.data_wrangler`.
+
+Usage:
+```
+python -m slupy.benchmarks --sizes 1000 10000 100000 1000000
+python -m slupy.benchmarks --save-baseline baseline.json
+python -m slupy.benchmarks --baseline baseline.json --threshold 0.25
+python -m slupy.benchmarks --list
+```
+"""
+
+import argparse
+import platform
+import sys
+from typing import List, Optional
+
+from slupy.benchmarks.suite import (
+    compute_scaling_exponent,
+    find_regressions,
+    get_benchmark_names,
+    load_timings,
+    run_benchmarks,
+    save_timings,
+)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m slupy.benchmarks", description="Benchmark suite of `slupy.data_wrangler`")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Numbers of rows")
+    parser.add_argument("--benchmarks", nargs="+", default=None, help="Names of the benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per benchmark (the best time is kept)")
+    parser.add_argument("--num-fields", type=int, default=8, help="Number of fields per row")
+    parser.add_argument("--cardinality", type=int, default=50, help="Number of distinct values of the categorical fields")
+    parser.add_argument("--null-rate", type=float, default=0.05, help="Probability of a value being null")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the data generator")
+    parser.add_argument("--save-baseline", metavar="FILEPATH", default=None, help="Saves the timings as a baseline (JSON)")
+    parser.add_argument("--baseline", metavar="FILEPATH", default=None, help="Compares the timings with this baseline (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown over the baseline (0.2 means 20%%)")
+    parser.add_argument("--list", action="store_true", help="Lists the names of the benchmarks, and exits")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the benchmarks. Returns the exit code (1 if there are regressions over the baseline; 0 otherwise)."""
+    args = parse_args(argv)
+    if args.list:
+        print("\n".join(get_benchmark_names()))
+        return 0
+
+    timings = run_benchmarks(
+        sizes=args.sizes,
+        names=args.benchmarks,
+        repeat=args.repeat,
+        num_fields=args.num_fields,
+        cardinality=args.cardinality,
+        null_rate=args.null_rate,
+        seed=args.seed,
+        log=print,
+    )
+
+    print("\nScaling exponents (time ~ num_rows ** k):")
+    for name, timings_by_size in timings.items():
+        exponent = compute_scaling_exponent(timings_by_size)
+        print(f"{name:<32} {'n/a' if exponent is None else f'{exponent:.2f}':>6}")
+
+    if args.save_baseline:
+        metadata = {
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "num_fields": args.num_fields,
+            "cardinality": args.cardinality,
+            "null_rate": args.null_rate,
+            "seed": args.seed,
+        }
+        save_timings(timings, filepath=args.save_baseline, metadata=metadata)
+        print(f"\nSaved baseline to '{args.save_baseline}'")
+
+    if args.baseline:
+        regressions = find_regressions(
+            timings=timings,
+            baseline=load_timings(filepath=args.baseline),
+            threshold=args.threshold,
+        )
+        if regressions:
+            print(f"\nRegressions over the baseline (threshold: {args.threshold * 100:.0f}%):")
+            print("\n".join(regressions))
+            return 1
+        print("\nNo regressions over the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
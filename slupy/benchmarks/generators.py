@@ -0,0 +1,63 @@
+import random
+import string
+from typing import Any, Callable, Dict, List, Optional
+
+FIELD_KINDS = ("category", "integer", "decimal", "text")
+
+
+def _make_text(rng: random.Random, /) -> str:
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(rng.randint(2, 6))]
+    return " ".join(words)
+
+
+def get_field_names(*, num_fields: int) -> List[str]:
+    """
+    Returns the names of the fields of the generated rows. The first field is always 'id', and the other fields cycle
+    through the kinds `['category', 'integer', 'decimal', 'text']` (eg: 'category_1', 'integer_2', ...).
+    """
+    assert num_fields >= 1, "Param `num_fields` must be >= 1"
+    field_names = ["id"]
+    for idx in range(1, num_fields):
+        kind = FIELD_KINDS[(idx - 1) % len(FIELD_KINDS)]
+        field_names.append(f"{kind}_{idx}")
+    return field_names
+
+
+def generate_rows(
+        *,
+        num_rows: int,
+        num_fields: Optional[int] = 8,
+        cardinality: Optional[int] = 50,
+        null_rate: Optional[float] = 0.0,
+        seed: Optional[int] = 0,
+    ) -> List[Dict[str, Any]]:
+    """
+    Returns a list of synthetic rows (dictionaries) that is reproducible for a given `seed`.
+
+    Parameters:
+        - num_rows (int): Number of rows.
+        - num_fields (int): Number of fields per row (refer `get_field_names()`).
+        - cardinality (int): Number of distinct values of the 'category' and 'integer' fields.
+        - null_rate (float): Probability of each value (other than 'id') being `None`.
+        - seed (int): Seed of the random number generator.
+    """
+    assert num_rows >= 0, "Param `num_rows` must be >= 0"
+    assert cardinality >= 1, "Param `cardinality` must be >= 1"
+    assert 0 <= null_rate <= 1, "Param `null_rate` must be in the range [0, 1]"
+    rng = random.Random(seed)
+    categories = [f"category-{idx:04d}" for idx in range(cardinality)]
+    value_makers: Dict[str, Callable[[], Any]] = {
+        "category": lambda: rng.choice(categories),
+        "integer": lambda: rng.randrange(cardinality),
+        "decimal": lambda: round(rng.uniform(-1000, 1000), 2),
+        "text": lambda: _make_text(rng),
+    }
+    field_names = get_field_names(num_fields=num_fields)
+    makers = [(field_name, value_makers[field_name.split("_")[0]]) for field_name in field_names[1:]]
+    rows = []
+    for idx in range(num_rows):
+        row = {"id": idx}
+        for field_name, make_value in makers:
+            row[field_name] = None if null_rate and rng.random() < null_rate else make_value()
+        rows.append(row)
+    return rows
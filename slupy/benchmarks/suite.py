@@ -0,0 +1,486 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import gc
+import json
+import math
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from slupy.benchmarks.generators import generate_rows
+from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.deduplication import deduplicate_stream
+from slupy.data_wrangler.expressions import col
+from slupy.data_wrangler.streaming import AsyncDatasetStream
+from slupy.data_wrangler.utils import multi_key_sort
+
+Timings = Dict[str, Dict[int, float]]  # Maps name of benchmark -> number of rows -> seconds
+
+
+@dataclass
+class Benchmark:
+    """
+    Operation to be timed.
+
+    Attributes:
+        - name (str): Name of the benchmark.
+        - func (Callable): Operation to be timed. Takes in the result of `setup`.
+        - setup (Callable): Takes in the `Dataset` of generated rows, and returns the input of `func` (not timed).
+        By default, `func` takes in the `Dataset` itself.
+        - max_rows (int): The benchmark is skipped for larger numbers of rows (eg: for operations that take quadratic time).
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[Dataset], Any]] = None
+    max_rows: Optional[int] = None
+
+
+def _make_next_snapshot(dataset: Dataset, /) -> Dataset:
+    """Returns a copy of the dataset where 1% of the rows are changed, 1% are removed and 1% are added"""
+    rows = [dict(row) for idx, row in enumerate(dataset) if idx % 100 != 1]
+    for row in rows[::100]:
+        row["integer_2"] = -1
+    num_rows = len(dataset)
+    rows.extend({**row, "id": num_rows + idx} for idx, row in enumerate(dataset.data[::100]))
+    return Dataset(rows)
+
+
+def _write_to_sqlite(dataset: Dataset, /) -> None:
+    with tempfile.TemporaryDirectory() as dirpath:
+        dataset.to_sqlite(os.path.join(dirpath, "benchmark.db"), "rows").close()
+
+
+def _make_sqlite_dataset(dataset: Dataset, /) -> tuple:
+    """Returns tuple of (temporary directory, `SQLiteDataset`), where the directory is removed once it's collected"""
+    directory = tempfile.TemporaryDirectory()
+    return directory, dataset.to_sqlite(os.path.join(directory.name, "benchmark.db"), "rows")
+
+
+def _nest_rows(dataset: Dataset, /) -> Dataset:
+    """Returns a dataset whose rows are nested 3 levels deep (having the same leaves as the given rows)"""
+    return Dataset([
+        {
+            "id": row["id"],
+            "category": {"primary": row["category_1"], "secondary": row["category_5"]},
+            "metrics": {
+                "integers": {"first": row["integer_2"], "second": row["integer_6"]},
+                "decimals": {"first": row["decimal_3"], "second": row["decimal_7"]},
+            },
+            "text": row["text_4"],
+        } for row in dataset
+    ])
+
+
+def _add_timestamps(dataset: Dataset, /) -> Dataset:
+    """Returns a copy of the dataset having the field 'timestamp' (one row per minute, starting from 2024-01-01)"""
+    origin = datetime(2024, 1, 1)
+    return Dataset([{**row, "timestamp": origin + timedelta(minutes=row["id"])} for row in dataset])
+
+
+def _make_upsert_inputs(dataset: Dataset, /) -> tuple:
+    """Returns tuple of (copy of the dataset, indexed on 'id'; batch of 1000 rows where half of the ids already exist)"""
+    num_rows = len(dataset)
+    batch = [{"id": num_rows - 500 + idx, "integer_2": -1} for idx in range(1000)]
+    return dataset.copy().upsert([], key=["id"], inplace=True), batch
+
+
+def _warm_up_result_cache(dataset: Dataset, call: Callable[[Dataset], Any], /) -> Dataset:
+    """Enables the result cache of the dataset, and caches the result of the given call"""
+    call(dataset.enable_result_cache())
+    return dataset
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark(name="copy", func=lambda dataset: dataset.copy()),
+    Benchmark(name="iterate", func=lambda dataset: [row["id"] for row in dataset]),
+    Benchmark(name="iter_tuples", func=lambda dataset: list(dataset.iter_tuples(fields=["id", "category_1"]))),
+    Benchmark(name="get_unique_fields", func=lambda dataset: dataset.get_unique_fields()),
+    Benchmark(name="get_datatypes_by_field", func=lambda dataset: dataset.get_datatypes_by_field()),
+    Benchmark(name="value_counts", func=lambda dataset: dataset.value_counts()),
+    Benchmark(
+        name="value_counts_unencoded",
+        setup=lambda dataset: dataset.keep_fields(fields=["category_1"]),
+        func=lambda dataset: dataset.value_counts(),
+    ),
+    Benchmark(
+        name="value_counts_encoded",
+        setup=lambda dataset: dataset.keep_fields(fields=["category_1"]).encode_categoricals(fields=["category_1"], inplace=True),
+        func=lambda dataset: dataset.value_counts(),
+    ),
+    Benchmark(
+        name="value_counts_cached",
+        setup=lambda dataset: _warm_up_result_cache(dataset, lambda dataset: dataset.value_counts()),
+        func=lambda dataset: dataset.value_counts(),
+    ),
+    Benchmark(
+        name="filter_rows",
+        func=lambda dataset: dataset.filter_rows(
+            func=lambda row: row["integer_2"] is not None and row["integer_2"] > 10 and row["category_1"] != "category-0000",
+        ),
+    ),
+    Benchmark(
+        name="async_stream",
+        func=lambda dataset: asyncio.run(
+            AsyncDatasetStream(dataset.data, deep_copy=True)
+            .filter_rows(func=col("integer_2").is_not_null() & (col("integer_2") > 10))
+            .compute_field(field="id_doubled", func=col("id") * 2)
+            .to_dataset()
+        ),
+    ),
+    Benchmark(
+        name="filter_rows_expression",
+        func=lambda dataset: dataset.filter_rows(
+            func=col("integer_2").is_not_null() & (col("integer_2") > 10) & (col("category_1") != "category-0000"),
+        ),
+    ),
+    Benchmark(
+        name="compute_field",
+        func=lambda dataset: dataset.compute_field(field="id_doubled", func=lambda row: row["id"] * 2),
+    ),
+    Benchmark(
+        name="compute_field_expression",
+        func=lambda dataset: dataset.compute_field(field="id_doubled", func=col("id") * 2),
+    ),
+    Benchmark(
+        name="compute_field_batch",
+        func=lambda dataset: dataset.compute_field_batch(
+            field="id_doubled",
+            func=lambda batch: [value * 2 for value in batch["id"]],
+            batch_size=1000,
+            columns=["id"],
+        ),
+    ),
+    Benchmark(
+        name="filter_rows_batch",
+        func=lambda dataset: dataset.filter_rows_batch(
+            func=lambda batch: [value is not None and value > 10 for value in batch["integer_2"]],
+            batch_size=1000,
+            columns=["integer_2"],
+        ),
+    ),
+    Benchmark(name="get_values_by_field", func=lambda dataset: dataset.get_values_by_field(field="category_1")),
+    Benchmark(name="set_defaults_for_fields", func=lambda dataset: dataset.set_defaults_for_fields(fields=["new_field"])),
+    Benchmark(
+        name="compute_fields",
+        func=lambda dataset: dataset.compute_fields(funcs={
+            "doubled": col("id") * 2,
+            "incremented": lambda row: row["doubled"] + 1,
+            "category_upper": lambda row: (row["category_1"] or "").upper(),
+        }),
+    ),
+    Benchmark(name="keep_fields", func=lambda dataset: dataset.keep_fields(fields=["id", "category_1"])),
+    Benchmark(name="drop_fields", func=lambda dataset: dataset.drop_fields(fields=["text_4"])),
+    Benchmark(
+        name="reorder_fields",
+        setup=lambda dataset: (dataset, dataset.get_unique_fields()[::-1]),
+        func=lambda inputs: inputs[0].reorder_fields(reordered_fields=inputs[1]),
+    ),
+    Benchmark(name="concatenate", func=lambda dataset: dataset.concatenate(datasets=[dataset])),
+    Benchmark(
+        name="upsert",
+        setup=_make_upsert_inputs,
+        func=lambda inputs: inputs[0].upsert(inputs[1], key=["id"], on_conflict="update_fields", inplace=True),
+    ),
+    Benchmark(
+        name="diff",
+        setup=lambda dataset: (dataset, _make_next_snapshot(dataset)),
+        func=lambda inputs: inputs[0].diff(inputs[1], key=["id"], compare=["category_1", "integer_2", "decimal_3"]),
+    ),
+    Benchmark(
+        name="fingerprints",
+        setup=lambda dataset: dataset.data,
+        func=lambda rows: Dataset(rows).fingerprints(),  # new instance per run, so that the cache is not hit
+    ),
+    Benchmark(
+        name="fingerprints_builtin_subset",
+        setup=lambda dataset: dataset.data,
+        func=lambda rows: Dataset(rows).fingerprints(subset=["id", "category_1"], algorithm="builtin"),
+    ),
+    # The rows are not modified by `inplace=True` (new rows are built), so each run starts from the same rows
+    Benchmark(
+        name="flatten",
+        setup=lambda dataset: _nest_rows(dataset).data,
+        func=lambda rows: Dataset(rows).flatten(inplace=True),
+    ),
+    Benchmark(
+        name="unflatten",
+        setup=lambda dataset: _nest_rows(dataset).flatten(inplace=True).data,
+        func=lambda rows: Dataset(rows).unflatten(inplace=True),
+    ),
+    Benchmark(
+        name="resample_hourly",
+        setup=_add_timestamps,
+        func=lambda dataset: dataset.resample(
+            time_field="timestamp",
+            offset_kwargs={"hours": 1},
+            aggregations={"num_rows": ("id", "size"), "total": ("integer_2", "sum")},
+        ),
+    ),
+    Benchmark(
+        name="resample_monthly",
+        setup=_add_timestamps,
+        func=lambda dataset: dataset.resample(
+            time_field="timestamp",
+            offset_kwargs={"months": 1},
+            aggregations={"num_rows": ("id", "size"), "total": ("integer_2", "sum")},
+        ),
+    ),
+    Benchmark(name="to_sqlite", func=_write_to_sqlite),
+    Benchmark(
+        name="sqlite_filter_order_by",
+        setup=_make_sqlite_dataset,
+        func=lambda inputs: list(
+            inputs[1]
+            .filter_rows(func=col("integer_2").is_not_null() & (col("integer_2") > 10))
+            .order_by(fields=["category_1"], ascending=[True])
+            .keep_fields(fields=["id", "category_1"])
+        ),
+    ),
+    Benchmark(
+        name="sqlite_value_counts",
+        setup=_make_sqlite_dataset,
+        func=lambda inputs: inputs[1].keep_fields(fields=["category_1", "integer_2"]).value_counts(),
+    ),
+    Benchmark(name="fill_nulls", func=lambda dataset: dataset.fill_nulls(value=0)),
+    Benchmark(name="drop_nulls", func=lambda dataset: dataset.drop_nulls(subset=["category_1", "integer_2"])),
+    Benchmark(
+        name="drop_nulls_clean_inplace",
+        setup=lambda dataset: dataset.fill_nulls(value=0),
+        func=lambda dataset: dataset.drop_nulls(inplace=True),
+    ),
+    Benchmark(name="null_counts", func=lambda dataset: dataset.null_counts()),
+    Benchmark(
+        name="order_by",
+        func=lambda dataset: dataset.order_by(fields=["category_1", "decimal_3"], ascending=[True, False]),
+    ),
+    Benchmark(
+        name="order_by_cached",
+        setup=lambda dataset: _warm_up_result_cache(
+            dataset,
+            lambda dataset: dataset.order_by(fields=["category_1"], ascending=[True]),
+        ),
+        func=lambda dataset: dataset.order_by(fields=["category_1"], ascending=[True]),
+    ),
+    Benchmark(
+        name="multi_key_sort",
+        setup=lambda dataset: dataset.fill_nulls(value=0).data,
+        func=lambda rows: multi_key_sort(rows, columns=["integer_2", "decimal_3"], ascending=[False, True]),
+    ),
+    Benchmark(
+        name="rank_by",
+        func=lambda dataset: dataset.rank_by(
+            fields=["category_1"],
+            ascending=[True],
+            rank_field_name="rank",
+            rank_strategy="dense_rank",
+        ),
+    ),
+    Benchmark(
+        name="drop_duplicates",
+        func=lambda dataset: dataset.drop_duplicates(subset=["category_1", "integer_2"]),
+    ),
+    Benchmark(
+        name="keep_duplicates",
+        func=lambda dataset: dataset.keep_duplicates(subset=["category_1", "integer_2"]),
+    ),
+    Benchmark(
+        name="find_duplicate_indices",
+        func=lambda dataset: dataset.find_duplicate_indices(subset=["category_1", "integer_2"]),
+    ),
+    Benchmark(
+        name="deduplicate_stream_exact",
+        func=lambda dataset: sum(1 for _ in deduplicate_stream(iter(dataset), subset=["category_1", "integer_2"])),
+    ),
+    Benchmark(
+        name="deduplicate_stream_bloom",
+        func=lambda dataset: sum(1 for _ in deduplicate_stream(iter(dataset), mode="bloom")),
+    ),
+    Benchmark(
+        name="find_duplicate_indices_encoded",
+        setup=lambda dataset: dataset.encode_categoricals(fields=["category_1", "integer_2"]),
+        func=lambda dataset: dataset.find_duplicate_indices(subset=["category_1", "integer_2"]),
+    ),
+    Benchmark(
+        name="find_near_duplicate_indices",
+        func=lambda dataset: dataset.find_near_duplicate_indices(fields=["text_4"]),
+    ),
+    Benchmark(name="encode_categoricals", func=lambda dataset: dataset.encode_categoricals(fields=["category_1"])),
+    Benchmark(
+        name="group_by",
+        func=lambda dataset: dataset.group_by(
+            fields=["category_1"],
+            aggregations={"num_rows": ("id", "size"), "total": ("integer_2", "sum"), "average": ("decimal_3", "mean")},
+        ),
+    ),
+    Benchmark(
+        name="pivot",
+        func=lambda dataset: dataset.pivot(index=["category_1"], columns="integer_2", values="decimal_3", agg="sum"),
+    ),
+    Benchmark(
+        name="melt",
+        func=lambda dataset: dataset.melt(id_fields=["id"], value_fields=["category_1", "integer_2"]),
+    ),
+    Benchmark(name="sample", func=lambda dataset: dataset.sample(n=100, seed=0)),
+    Benchmark(name="memory_usage_sampled", func=lambda dataset: dataset.memory_usage(sample_size=1000)),
+    # Sending a dataset to worker processes: pickling vs shared memory (both sides of the transfer)
+    Benchmark(
+        name="pickle_roundtrip",
+        func=lambda dataset: pickle.loads(pickle.dumps(dataset.data, protocol=pickle.HIGHEST_PROTOCOL)),
+    ),
+    Benchmark(
+        name="pickle_dataset_roundtrip",
+        func=lambda dataset: pickle.loads(pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL)).data,
+    ),
+    Benchmark(name="to_shared_memory", func=lambda dataset: dataset.to_shared_memory().release()),
+    Benchmark(
+        name="attach_shared_memory",
+        setup=lambda dataset: dataset.to_shared_memory(),
+        func=lambda segment: Dataset.attach_shared_memory(segment.name),
+    ),
+]
+
+
+def get_benchmark_names() -> List[str]:
+    return [benchmark.name for benchmark in BENCHMARKS]
+
+
+def time_call(func: Callable[[], Any], /, *, repeat: Optional[int] = 3) -> float:
+    """Returns the best time (in seconds) out of `repeat` calls of `func`. The garbage collector is disabled while timing."""
+    assert repeat >= 1, "Param `repeat` must be >= 1"
+    best = math.inf
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def run_benchmarks(
+        *,
+        sizes: List[int],
+        names: Optional[List[str]] = None,
+        repeat: Optional[int] = 3,
+        num_fields: Optional[int] = 8,
+        cardinality: Optional[int] = 50,
+        null_rate: Optional[float] = 0.05,
+        seed: Optional[int] = 0,
+        log: Optional[Callable[[str], None]] = None,
+    ) -> Timings:
+    """
+    Times each benchmark (refer `BENCHMARKS`) for each of the given numbers of rows, on synthetic rows
+    (refer `slupy.benchmarks.generators.generate_rows()`).
+
+    Parameters:
+        - sizes (List[int]): Numbers of rows.
+        - names (List[str]): Names of the benchmarks to run. By default, runs all the benchmarks.
+        - repeat (int): Number of times each benchmark is run (the best time is kept).
+        - log (Callable): Takes in a message of progress (eg: `print`).
+    """
+    assert num_fields >= 5, "Param `num_fields` must be >= 5, as the benchmarks use the first 5 fields"
+    names = names or get_benchmark_names()
+    unknown_names = set(names).difference(get_benchmark_names())
+    assert not unknown_names, f"Unknown benchmarks: {sorted(unknown_names)}"
+    benchmarks = [benchmark for benchmark in BENCHMARKS if benchmark.name in names]
+    timings: Timings = {benchmark.name: {} for benchmark in benchmarks}
+    for num_rows in sorted(sizes):
+        rows = generate_rows(
+            num_rows=num_rows,
+            num_fields=num_fields,
+            cardinality=cardinality,
+            null_rate=null_rate,
+            seed=seed,
+        )
+        for benchmark in benchmarks:
+            if benchmark.max_rows is not None and num_rows > benchmark.max_rows:
+                continue
+            dataset = Dataset(rows)
+            input_ = benchmark.setup(dataset) if benchmark.setup else dataset
+            seconds = time_call(lambda: benchmark.func(input_), repeat=repeat)
+            timings[benchmark.name][num_rows] = seconds
+            if log:
+                log(f"{benchmark.name:<32} {num_rows:>10,} rows {seconds:>12.6f}s")
+    return timings
+
+
+def compute_scaling_exponent(timings_by_size: Dict[int, float], /) -> Optional[float]:
+    """
+    Returns the exponent `k` of the best fit of `time = c * (num_rows ** k)` (slope of the least-squares line in log-log
+    space), eg: ~1 for linear operations, ~2 for quadratic operations.
+    Returns `None` if there are fewer than 2 sizes having a positive time.
+    """
+    points = [
+        (math.log(num_rows), math.log(seconds))
+        for num_rows, seconds in timings_by_size.items()
+        if num_rows > 0 and seconds > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance_x == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance_x
+
+
+def find_regressions(
+        *,
+        timings: Timings,
+        baseline: Timings,
+        threshold: Optional[float] = 0.2,
+        min_seconds: Optional[float] = 0.001,
+    ) -> List[str]:
+    """
+    Returns messages describing each benchmark (and number of rows) that is slower than the baseline by more than the
+    given `threshold` (eg: `threshold=0.2` allows being up to 20% slower). Timings where the baseline is under `min_seconds`
+    are ignored, as they're too noisy.
+    """
+    regressions = []
+    for name, timings_by_size in timings.items():
+        for num_rows, seconds in timings_by_size.items():
+            baseline_seconds = baseline.get(name, {}).get(num_rows)
+            if baseline_seconds is None or baseline_seconds < min_seconds:
+                continue
+            if seconds > baseline_seconds * (1 + threshold):
+                regressions.append(
+                    f"{name} ({num_rows:,} rows): {seconds:.6f}s vs baseline {baseline_seconds:.6f}s"
+                    f" ({(seconds / baseline_seconds - 1) * 100:+.1f}%)"
+                )
+    return regressions
+
+
+def save_timings(timings: Timings, /, *, filepath: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+    """Saves the timings (eg: as a baseline) to a JSON file"""
+    data = {
+        "metadata": metadata or {},
+        "timings": {
+            name: {str(num_rows): seconds for num_rows, seconds in timings_by_size.items()}
+            for name, timings_by_size in timings.items()
+        },
+    }
+    with open(file=filepath, mode="w") as fp:
+        json.dump(data, fp, indent=4)
+
+
+def load_timings(*, filepath: str) -> Timings:
+    """Loads the timings saved via `save_timings()`"""
+    with open(file=filepath, mode="r") as fp:
+        data = json.load(fp)
+    return {
+        name: {int(num_rows): seconds for num_rows, seconds in timings_by_size.items()}
+        for name, timings_by_size in data["timings"].items()
+    }
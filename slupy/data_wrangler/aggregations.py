@@ -0,0 +1,224 @@
+from typing import Any, Callable, Dict, List, Union
+
+
+class Aggregator:
+    """
+    Aggregates a stream of values via a state.
+    The state is created via `create()`, updated with each value via `update()`, and converted to the aggregated value
+    via `finalize()`. States built over separate parts of the values can be combined via `merge()`.
+    """
+
+    name = ""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def create(self) -> Any:
+        raise NotImplementedError()
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        raise NotImplementedError()
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        raise NotImplementedError()
+
+    def finalize(self, state: Any, /) -> Any:
+        return state
+
+
+class SizeAggregator(Aggregator):
+    """Number of values (including `None`)"""
+
+    name = "size"
+
+    def create(self) -> int:
+        return 0
+
+    def update(self, state: int, value: Any, /) -> int:
+        return state + 1
+
+    def merge(self, state_1: int, state_2: int, /) -> int:
+        return state_1 + state_2
+
+
+class CountAggregator(SizeAggregator):
+    """Number of values that are not `None`"""
+
+    name = "count"
+
+    def update(self, state: int, value: Any, /) -> int:
+        return state if value is None else state + 1
+
+
+class SumAggregator(Aggregator):
+    """Sum of the values that are not `None`"""
+
+    name = "sum"
+
+    def create(self) -> Any:
+        return 0
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        return state if value is None else state + value
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        return state_1 + state_2
+
+
+class MeanAggregator(Aggregator):
+    """Mean of the values that are not `None` (is `None` if there are no such values)"""
+
+    name = "mean"
+
+    def create(self) -> List[Any]:
+        return [0, 0]  # [sum, count]
+
+    def update(self, state: List[Any], value: Any, /) -> List[Any]:
+        if value is not None:
+            state[0] += value
+            state[1] += 1
+        return state
+
+    def merge(self, state_1: List[Any], state_2: List[Any], /) -> List[Any]:
+        return [state_1[0] + state_2[0], state_1[1] + state_2[1]]
+
+    def finalize(self, state: List[Any], /) -> Any:
+        return state[0] / state[1] if state[1] else None
+
+
+class MinAggregator(Aggregator):
+    """Minimum of the values that are not `None` (is `None` if there are no such values)"""
+
+    name = "min"
+
+    def create(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        if value is None or (state is not None and not value < state):
+            return state
+        return value
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        return self.update(state_1, state_2)
+
+
+class MaxAggregator(Aggregator):
+    """Maximum of the values that are not `None` (is `None` if there are no such values)"""
+
+    name = "max"
+
+    def create(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        if value is None or (state is not None and not value > state):
+            return state
+        return value
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        return self.update(state_1, state_2)
+
+
+class _Unset:
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __reduce__(self) -> str:
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+class FirstAggregator(Aggregator):
+    """First value"""
+
+    name = "first"
+
+    def create(self) -> Any:
+        return UNSET
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        return value if state is UNSET else state
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        return state_2 if state_1 is UNSET else state_1
+
+    def finalize(self, state: Any, /) -> Any:
+        return None if state is UNSET else state
+
+
+class LastAggregator(FirstAggregator):
+    """Last value"""
+
+    name = "last"
+
+    def update(self, state: Any, value: Any, /) -> Any:
+        return value
+
+    def merge(self, state_1: Any, state_2: Any, /) -> Any:
+        return state_1 if state_2 is UNSET else state_2
+
+
+class ListAggregator(Aggregator):
+    """List of all the values"""
+
+    name = "list"
+
+    def create(self) -> List[Any]:
+        return []
+
+    def update(self, state: List[Any], value: Any, /) -> List[Any]:
+        state.append(value)
+        return state
+
+    def merge(self, state_1: List[Any], state_2: List[Any], /) -> List[Any]:
+        return state_1 + state_2
+
+
+class CallableAggregator(ListAggregator):
+    """Collects all the values, and aggregates them via the given function (which takes in the list of values)"""
+
+    def __init__(self, func: Callable[[List[Any]], Any], /) -> None:
+        self.func = func
+        self.name = getattr(func, "__name__", "callable")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(func={self.name})"
+
+    def finalize(self, state: List[Any], /) -> Any:
+        return self.func(state)
+
+
+AGGREGATORS: Dict[str, Aggregator] = {
+    aggregator.name: aggregator
+    for aggregator in [
+        SizeAggregator(),
+        CountAggregator(),
+        SumAggregator(),
+        MeanAggregator(),
+        MinAggregator(),
+        MaxAggregator(),
+        FirstAggregator(),
+        LastAggregator(),
+        ListAggregator(),
+    ]
+}
+
+AggregatorLike = Union[str, Callable[[List[Any]], Any], Aggregator]
+
+
+def get_aggregator(agg: AggregatorLike, /) -> Aggregator:
+    """
+    Returns the aggregator for the given `agg`, which can be the name of a built-in aggregator
+    (one of `['size', 'count', 'sum', 'mean', 'min', 'max', 'first', 'last', 'list']`), a function that takes in the list
+    of values, or an `Aggregator` instance.
+    """
+    if isinstance(agg, Aggregator):
+        return agg
+    if isinstance(agg, str):
+        assert agg in AGGREGATORS, f"Param `agg` must be one of {list(AGGREGATORS.keys())}"
+        return AGGREGATORS[agg]
+    assert callable(agg), "Param `agg` must be a string, a callable or an instance of `Aggregator`"
+    return CallableAggregator(agg)
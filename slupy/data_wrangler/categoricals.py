@@ -0,0 +1,88 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping
+
+
+class CategoricalEncoding:
+    """
+    Dictionary-encoding of the values of a field.
+    Each distinct value is stored once in `categories`, and each row is represented by a small integer in `codes`
+    (the position of its value in `categories`). Rows that don't have the field are encoded as `None`, and are counted
+    in `num_missing`.
+    """
+
+    __slots__ = ("categories", "codes", "num_missing", "_code_by_key")
+
+    def __init__(
+            self,
+            *,
+            categories: List[Any],
+            codes: array,
+            code_by_key: Dict[Any, int],
+            num_missing: int = 0,
+        ) -> None:
+        self.categories = categories
+        self.codes = codes
+        self.num_missing = num_missing
+        self._code_by_key = code_by_key
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_categories={len(self.categories)}, num_codes={len(self.codes)},"
+            f" num_missing={self.num_missing})"
+        )
+
+    def get_code(self, value: Any, /, *, default: int = -1) -> int:
+        """Returns the code of the given `value` (or `default` if the value is not one of the categories)"""
+        try:
+            return self._code_by_key.get(_get_category_key(value), default)
+        except TypeError:  # unhashable values can never be categories
+            return default
+
+
+def _get_category_key(value: Any, /) -> Any:
+    # Values that are equal but of different types (eg: 1, 1.0, True) must not share a category
+    return value if type(value) is str else (type(value), value)
+
+
+def _get_typecode_for_num_categories(num_categories: int, /) -> str:
+    if num_categories <= 2 ** 8:
+        return "B"
+    if num_categories <= 2 ** 16:
+        return "H"
+    return "I"
+
+
+def encode_values(values: Iterable[Any], /) -> CategoricalEncoding:
+    """
+    Dictionary-encodes the given `values` (which must be hashable).
+    The first occurrence of each distinct value becomes its category (all the other occurrences can then be replaced by
+    the category, so that each distinct value is stored only once).
+    """
+    categories: List[Any] = []
+    code_by_key: Dict[Any, int] = {}
+    codes_list: List[int] = []
+    for value in values:
+        key = _get_category_key(value)
+        code = code_by_key.get(key)
+        if code is None:
+            code = len(categories)
+            code_by_key[key] = code
+            categories.append(value)
+        codes_list.append(code)
+    codes = array(_get_typecode_for_num_categories(len(categories)), codes_list)
+    return CategoricalEncoding(categories=categories, codes=codes, code_by_key=code_by_key)
+
+
+def encode_field(rows: Iterable[Mapping[str, Any]], /, *, field: str) -> CategoricalEncoding:
+    """
+    Dictionary-encodes the values of the given `field` (refer `encode_values()`). Rows that don't have the field are
+    encoded as `None` (like `slupy.data_wrangler.dataset.Dataset.value_counts()` counts them).
+    """
+    missing = object()
+    values = [row.get(field, missing) for row in rows]
+    num_missing = sum(value is missing for value in values)
+    if num_missing:
+        values = [None if value is missing else value for value in values]
+    encoding = encode_values(values)
+    encoding.num_missing = num_missing
+    return encoding
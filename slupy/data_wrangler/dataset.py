@@ -1,12 +1,38 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
+import copy
+from datetime import date, datetime
+from functools import reduce
+from itertools import compress, islice
+import operator
+import pickle
+from operator import itemgetter
 from pprint import pprint
-from typing import Any, Callable, Dict, List, Literal, Optional, Type
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from slupy.core import checks
-from slupy.core.helpers import make_deep_copy
+from slupy.core.helpers import compute_partitions, make_deep_copy
+from slupy.data_wrangler.aggregations import UNSET, AggregatorLike, get_aggregator
+from slupy.data_wrangler.categoricals import CategoricalEncoding, encode_field
+from slupy.data_wrangler.columnar import Buffer, Header, decode_rows, encode_rows
+from slupy.data_wrangler.diffing import DatasetDiff, diff_rows
+from slupy.data_wrangler.expressions import Expression, compile_assignments, get_string_lookup
+from slupy.data_wrangler.fingerprints import FingerprintAlgorithm, compute_fingerprints
+from slupy.data_wrangler.flattening import flatten_rows, unflatten_rows
+from slupy.data_wrangler.grouping import group_rows
+from slupy.data_wrangler.indexing import KeyIndex
+from slupy.data_wrangler.memory import MemoryUsage, compute_memory_usage
+from slupy.data_wrangler.near_duplicates import find_near_duplicate_groups
+from slupy.data_wrangler.nulls import NullStats, bitmap_to_keep_mask, compute_null_stats
+from slupy.data_wrangler.records import Record, Schema
+from slupy.data_wrangler.resampling import CALENDAR_OFFSETS, FIXED_WIDTH_OFFSETS, resample_rows
+from slupy.data_wrangler.result_cache import CacheStats, ResultCache, cached_result
+from slupy.data_wrangler.sampling import reservoir_sample, stratified_reservoir_sample
+from slupy.data_wrangler.shared_memory import SharedSegment, load_shared_rows, share_rows
+from slupy.data_wrangler.sqlite import SQLiteDataset, connect, read_rows, write_rows
+from slupy.data_wrangler.tracing import trace_public_methods
 from slupy.data_wrangler.utils import (
     drop_indices,
     keep_indices,
@@ -14,8 +40,16 @@ from slupy.data_wrangler.utils import (
 )
 
 
+ROW_TYPES = (dict, Record)
+_NUMERIC_TYPES = (int, float, bool, type(None))
+
+
+@trace_public_methods
 class Dataset:
-    """Class that represents a dataset (collection of data as a list of dictionaries)"""
+    """
+    Class that represents a dataset (collection of data as a list of dictionaries).
+    The rows can also be compact records (see `Dataset.from_records()`), which behave like dictionaries.
+    """
 
     def __init__(
             self,
@@ -33,36 +67,173 @@ class Dataset:
             - autofill (bool): If `autofill=True`, checks if the existing unique fields are present in each dictionary
             in the list. If not present, sets their default value to `None`. Does this operation inplace.
         """
-        assert checks.is_list_of_instances_of_type(data, type_=dict, allow_empty=True), (
+        assert checks.is_list_of_instances_of_type(data, type_=ROW_TYPES, allow_empty=True), (
             "Param `data` must be a list of dictionaries"
         )
         self._data = make_deep_copy(data) if deep_copy else data
+        self._pending_columns: Optional[Tuple[Header, List[Buffer]]] = None  # Columns (of unpickled rows) not yet decoded
+        self._categorical_fields: List[str] = []
+        self._categorical_encodings: Dict[str, CategoricalEncoding] = {}
+        self._fingerprints: Dict[Tuple[Optional[Tuple[str, ...]], str], List[Any]] = {}
+        self._key_indexes: Dict[Tuple[str, ...], KeyIndex] = {}  # Maps key fields -> index (refer `Dataset.upsert()`)
+        self._null_stats: Optional[NullStats] = None  # Refer `Dataset.null_counts()`
+        self._version = 0  # Incremented whenever the rows are modified via the `Dataset` methods
+        self._result_cache: Optional[ResultCache] = None
         if autofill:
             self = self.autofill_missing_fields(inplace=True)
 
+    @classmethod
+    def from_records(
+            cls,
+            records: Iterable[Sequence[Any]],
+            /,
+            *,
+            fields: List[str],
+        ) -> Dataset:
+        """
+        Creates a dataset in compact mode, where each row is a `slupy.data_wrangler.records.Record` (having the values
+        of a row, and sharing the given `fields` with all the other rows) instead of a dictionary.
+        Uses 2-4x less memory per row than dictionaries, and never builds a dictionary.
+
+        Parameters:
+            - records (iterable): Iterable of tuples/lists, each having the values in the same order as `fields`.
+            - fields (List[str]): The fields of each row.
+        """
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        schema = Schema(tuple(fields))
+        num_fields = len(fields)
+        data = []
+        for idx, values in enumerate(records):
+            if len(values) != num_fields:
+                raise ValueError(
+                    f"Expected {num_fields} values (as per `fields`), but found {len(values)} values on row number {idx + 1}"
+                )
+            data.append(Record(schema, list(values)))
+        return cls(data)
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}()"
 
     def __len__(self) -> int:
+        if self._pending_columns is not None:
+            return self._pending_columns[0]["num_rows"]
         return len(self.data)
 
-    def __getitem__(self, idx: int) -> Dict[str, Any]:
+    def __reduce_ex__(self, protocol: int) -> Any:
+        """
+        Pickles the rows column by column (refer `slupy.data_wrangler.columnar.encode_rows()`), so that numeric and
+        encoded columns travel as contiguous buffers instead of one object per value. With protocol 5, the buffers are
+        given as `pickle.PickleBuffer` objects, so they can be sent out-of-band (without being copied into the pickle).
+        The rows are only rebuilt once they're accessed on the receiving side.
+
+        Only used for compact records, and for rows whose values are numbers (or belong to the fields encoded via
+        `Dataset.encode_categoricals()`), as other values (eg: free text) are pickled faster as usual.
+        """
+        if self._pending_columns is not None:
+            header, buffers = self._pending_columns
+        else:
+            encoded = encode_rows(self._data) if self._is_worth_pickling_by_column() else None
+            if encoded is None:
+                return object.__reduce_ex__(self, protocol)
+            header, buffers = encoded
+        if protocol >= 5:
+            buffers = [pickle.PickleBuffer(buffer) for buffer in buffers]
+        else:
+            buffers = [memoryview(buffer).cast("B").tobytes() for buffer in buffers]
+        return _rebuild_dataset, (header, buffers, list(self._categorical_fields))
+
+    def _is_worth_pickling_by_column(self) -> bool:
+        if not self._data:
+            return False
+        first_row = self._data[0]
+        if type(first_row) is Record:
+            return True
+        return all(
+            type(value) in _NUMERIC_TYPES or field in self._categorical_fields for field, value in first_row.items()
+        )
+
+    def __copy__(self) -> Dataset:
+        instance = self.__class__.__new__(self.__class__)
+        instance.__dict__.update(self.__dict__)
+        return instance
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dataset:
+        instance = self.__class__.__new__(self.__class__)
+        memo[id(self)] = instance
+        self.data  # The rows are decoded (if pending), so that they're copied like any other rows
+        for name, value in self.__dict__.items():
+            setattr(instance, name, copy.deepcopy(value, memo))
+        return instance
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Dict[str, Any], DatasetView]:
+        """
+        Returns the row at the given index. If a slice is given, returns a `DatasetView` (a lightweight window over
+        the rows of this dataset). The rows are never copied.
+        """
+        if isinstance(idx, slice):
+            return DatasetView(self.data, rows_range=range(len(self.data))[idx])
         return self.data[idx]
 
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.data)
+
+    def iter_tuples(self, *, fields: List[str]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields a tuple of values (in the order of the given `fields`) for each row.
+        Faster than iterating over the rows when only a few fields are needed.
+        """
+        return _iter_tuples(iter(self.data), fields=fields)
+
     def copy(self) -> Dataset:
         """Returns deep-copy of `self`"""
         return make_deep_copy(self)
 
     @property
     def data(self) -> List[Dict[str, Any]]:
+        if self._pending_columns is not None:
+            self._data = decode_rows(*self._pending_columns)
+            self._pending_columns = None
         return self._data
 
     @data.setter
     def data(self, value: List[Dict[str, Any]]) -> None:
-        assert checks.is_list_of_instances_of_type(value, type_=dict, allow_empty=True), (
+        assert checks.is_list_of_instances_of_type(value, type_=ROW_TYPES, allow_empty=True), (
             "Param `data` must be a list of dictionaries"
         )
         self._data = value
+        self._pending_columns = None
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """
+        Discards everything that is derived from the rows (eg: categorical codes, fingerprints, key indexes, null stats).
+        Must be called whenever the rows are modified in-place.
+        """
+        self._categorical_encodings = {}
+        self._fingerprints = {}
+        self._key_indexes = {}
+        self._null_stats = None
+        self._version += 1
+
+    def _set_filtered_data(self, value: List[Dict[str, Any]], /) -> None:
+        """
+        Sets the rows to a subset of the current rows (in the same order, and not modified), eg: after an in-place filter.
+        Unlike setting `self.data`, the key indexes are rebuilt over the remaining rows instead of being discarded.
+        """
+        key_indexes = self._key_indexes
+        self.data = value
+        for key_index in key_indexes.values():
+            key_index.rebuild(value)
+        self._key_indexes = key_indexes
+
+    def _get_key_index(self, fields: Tuple[str, ...], /) -> KeyIndex:
+        """Returns the index of the given key fields (building it, if it's not found or it's stale)"""
+        key_index = self._key_indexes.get(fields)
+        if key_index is None or key_index.num_rows != len(self.data):
+            key_index = self._key_indexes[fields] = KeyIndex(self.data, fields=fields)
+        return key_index
 
     def data_copy(self) -> List[Dict[str, Any]]:
         """Returns deep-copy of `self.data`"""
@@ -88,6 +259,16 @@ class Dataset:
             If `break_at='first_full'`, returns early with all the indices of the first set of duplicates identified (if any).
             - subset (List[str]): List of keys to consider in each dictionary in the list.
         """
+        if subset and all(field in self._categorical_fields for field in subset):
+            encodings = [self._get_categorical_encoding(field) for field in subset]
+            # Rows that don't have a field must raise a KeyError as usual, instead of comparing equal to `None`
+            if all(_has_self_equal_categories(encoding) and not encoding.num_missing for encoding in encodings):
+                keys = zip(*[map(_get_equality_codes(encoding).__getitem__, encoding.codes) for encoding in encodings])
+                return _find_duplicate_indices_by_keys(keys, break_at=break_at)
+        try:
+            return _find_duplicate_indices_by_keys(_get_hashable_keys(self.data, subset=subset), break_at=break_at)
+        except TypeError:  # unhashable values (eg: lists), which are compared pairwise instead
+            pass
         indices = []
         indices_involved_in_duplicates = set()
         for idx, dict_obj in enumerate(self.data):
@@ -111,6 +292,59 @@ class Dataset:
                     return indices
         return indices
 
+    def find_near_duplicate_indices(
+            self,
+            *,
+            fields: List[str],
+            threshold: Optional[float] = 0.8,
+            num_perm: Optional[int] = 128,
+            shingle_size: Optional[int] = 3,
+            false_positive_weight: Optional[float] = 0.5,
+            false_negative_weight: Optional[float] = 0.5,
+            seed: Optional[int] = 0,
+        ) -> List[List[int]]:
+        """
+        Used to find the indices of the rows whose text is nearly the same (eg: differs only by whitespace, punctuation,
+        casing or a few characters). Same output format as `Dataset.find_duplicate_indices()`.
+
+        The text of a row is made by joining the values of the given `fields` (ignoring nulls), and is normalized
+        (lower-cased, without punctuation). Rows are near-duplicates if the Jaccard similarity of the character shingles
+        of their texts is >= `threshold` (and groups are transitive).
+        Uses MinHash signatures and LSH banding to find candidate pairs, which are then verified exactly, so it runs in
+        near-linear time (refer `slupy.data_wrangler.near_duplicates.find_near_duplicate_groups()`).
+
+        Parameters:
+            - fields (List[str]): Fields having the text to compare.
+            - threshold (float): Minimum Jaccard similarity. Must be in the range (0, 1].
+            - num_perm (int): Number of hash functions of the MinHash signatures. Higher values miss fewer near-duplicates,
+            but are slower.
+            - shingle_size (int): Number of characters per shingle.
+            - false_positive_weight (float): Weight of false positives (candidates that fail the verification) when
+            choosing the LSH bands. Higher values are faster.
+            - false_negative_weight (float): Weight of false negatives (near-duplicates that never become candidates) when
+            choosing the LSH bands. Higher values miss fewer near-duplicates.
+            - seed (int): Seed of the hash functions.
+        """
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        texts = []
+        for dict_obj in self.data:
+            try:
+                values = [dict_obj[field] for field in fields]
+            except KeyError as exc:
+                raise KeyError(f"Key {exc} from fields is not found")
+            texts.append(" ".join(str(value) for value in values if value is not None))
+        return find_near_duplicate_groups(
+            texts,
+            threshold=threshold,
+            num_perm=num_perm,
+            shingle_size=shingle_size,
+            false_positive_weight=false_positive_weight,
+            false_negative_weight=false_negative_weight,
+            seed=seed,
+        )
+
     def _is_equal(
             self,
             d1: Dict[str, Any],
@@ -131,6 +365,56 @@ class Dataset:
                 return False
         return True
 
+    def fingerprints(
+            self,
+            *,
+            subset: Optional[List[str]] = None,
+            algorithm: Optional[FingerprintAlgorithm] = "blake2b",
+        ) -> List[Any]:
+        """
+        Returns the fingerprint of each row (or of the given `subset` of its fields), where rows that are equal have
+        the same fingerprint (refer `slupy.data_wrangler.fingerprints.compute_fingerprint()`).
+
+        The fingerprints are cached per `subset` and `algorithm`, and the cache is discarded whenever the rows are
+        modified through the `Dataset` methods. Like `Dataset.encode_categoricals()`, the cache cannot see modifications
+        made outside of the `Dataset` methods (eg: `dataset[0][field] = value`), so assign `dataset.data` after any
+        such modification.
+
+        Parameters:
+            - subset (List[str]): List of keys to consider in each dictionary in the list.
+            - algorithm (str): If `algorithm='blake2b'`, returns 16-byte digests that are stable across processes.
+            If `algorithm='builtin'`, returns (much faster) integer hashes that are only stable within the current process.
+        """
+        assert algorithm in ("blake2b", "builtin"), "Param `algorithm` must be one of ['blake2b', 'builtin']"
+        cache_key = (tuple(subset) if subset else None, algorithm)
+        fingerprints = self._fingerprints.get(cache_key)
+        if fingerprints is None or len(fingerprints) != len(self):
+            fingerprints = compute_fingerprints(self.data, subset=subset, algorithm=algorithm)
+            self._fingerprints[cache_key] = fingerprints
+        return list(fingerprints)
+
+    def add_fingerprint_field(
+            self,
+            *,
+            field: Optional[str] = "fingerprint",
+            subset: Optional[List[str]] = None,
+            algorithm: Optional[FingerprintAlgorithm] = "blake2b",
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Adds the given `field` having the fingerprint of each row (refer `Dataset.fingerprints()`), which can be used as
+        a key by other operations (eg: `Dataset.diff(key=[field])`, `Dataset.group_by()` or
+        `Dataset.drop_duplicates(subset=[field])`). The fingerprints are computed before the field is added.
+        """
+        assert checks.is_valid_object_of_type(field, type_=str, allow_empty=False), "Param `field` must be a non-empty string"
+        fingerprints = self.fingerprints(subset=subset, algorithm=algorithm)
+        list_obj = self.data if inplace else self.data_copy()
+        for dict_obj, fingerprint in zip(list_obj, fingerprints):
+            dict_obj[field] = fingerprint
+        if inplace:
+            self._invalidate_caches()
+        return self if inplace else Dataset(list_obj)
+
     def has_duplicates(
             self,
             *,
@@ -162,6 +446,8 @@ class Dataset:
             elif keep == "none":
                 indices_to_drop.extend(sub_indices)
         list_obj = drop_indices(list_obj, indices=indices_to_drop)
+        if inplace:
+            self._set_filtered_data(list_obj)
         return self if inplace else Dataset(list_obj)
 
     def keep_duplicates(
@@ -175,7 +461,7 @@ class Dataset:
         duplicate_indices = self.find_duplicate_indices(subset=subset)
         if not duplicate_indices:
             if inplace:
-                self.data = []
+                self._set_filtered_data([])
             return self if inplace else Dataset([])
         indices_to_keep = []
         for sub_indices in duplicate_indices:
@@ -187,6 +473,8 @@ class Dataset:
                 indices_to_keep.extend(sub_indices)
         list_obj = self.data if inplace else self.data_copy()
         list_obj = keep_indices(list_obj, indices=indices_to_keep)
+        if inplace:
+            self._set_filtered_data(list_obj)
         return self if inplace else Dataset(list_obj)
 
     def yield_values_by_field(self, *, field: str) -> Iterator[Any]:
@@ -202,6 +490,7 @@ class Dataset:
         """Returns a list of values for the given field"""
         return list(self.yield_values_by_field(field=field))
 
+    @cached_result(copy_result=lambda result: {field: set(datatypes) for field, datatypes in result.items()})
     def get_datatypes_by_field(self) -> Dict[str, set[Type]]:
         """Returns dictionary having keys = fields, and values = set of all the unique types present in said field"""
         datatypes_by_field: Dict[str, set[Type]] = {}
@@ -212,6 +501,7 @@ class Dataset:
                 datatypes_by_field[field].add(datatype)
         return datatypes_by_field
 
+    @cached_result(copy_result=list)
     def get_unique_fields(self) -> List[str]:
         """Returns list of all the unique fields that are present (sorted in ascending order)"""
         unique_fields = set()
@@ -236,23 +526,98 @@ class Dataset:
         for dict_obj in list_obj:
             for field in fields:
                 dict_obj.setdefault(field, None)
+        if inplace:
+            self._invalidate_caches()
         return self if inplace else Dataset(list_obj)
 
     def compute_field(
             self,
             *,
             field: str,
-            func: Callable[[Dict[str, Any]], Any],
+            func: Union[Callable[[Dict[str, Any]], Any], Expression],
             inplace: Optional[bool] = False,
         ) -> Dataset:
         """
         Applies the given function `func` to each dictionary in the list, and stores the result of `func` in the key `field` of each dictionary.
         The `func` takes in the dictionary (row) as a parameter.
+        The `func` can also be an expression (see `slupy.data_wrangler.expressions`), which is much faster than a function.
         """
         list_obj = self.data if inplace else self.data_copy()
-        for dict_obj in list_obj:
-            computed_value = func(dict_obj)
-            dict_obj[field] = computed_value
+        if isinstance(func, Expression):
+            func.compile_assignment()(list_obj, field)
+        else:
+            for dict_obj in list_obj:
+                computed_value = func(dict_obj)
+                dict_obj[field] = computed_value
+        if inplace:
+            self._invalidate_caches()
+        return self if inplace else Dataset(list_obj)
+
+    def compute_fields(
+            self,
+            *,
+            funcs: Dict[str, Union[Callable[[Dict[str, Any]], Any], Expression]],
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Same as calling `Dataset.compute_field()` once per item of `funcs` (in the order of `funcs`), except that all
+        the fields are computed in a single pass over the rows (and a single copy of the rows, if `inplace=False`).
+        Since the fields of each row are computed in order, each function can use the fields computed before it.
+
+        Parameters:
+            - funcs (dict): Dictionary having keys = fields in which the computed values are stored, and values = function
+            that takes in the row (or expression, see `slupy.data_wrangler.expressions`).
+
+        Example:
+        ```
+        >>> Dataset([{"price": 10, "quantity": 2}]).compute_fields(funcs={
+            "subtotal": col("price") * col("quantity"),
+            "total": lambda row: row["subtotal"] * 1.5,
+        }).data
+        [{"price": 10, "quantity": 2, "subtotal": 20, "total": 30.0}]
+        ```
+        """
+        assert isinstance(funcs, dict) and funcs, "Param `funcs` must be a non-empty dictionary"
+        assert checks.is_list_of_instances_of_type(list(funcs.keys()), type_=str, allow_empty=False), (
+            "Param `funcs` must have keys of type 'str'"
+        )
+        assert all(isinstance(func, Expression) or callable(func) for func in funcs.values()), (
+            "Param `funcs` must have values that are callables or expressions"
+        )
+        list_obj = self.data if inplace else self.data_copy()
+        compile_assignments(funcs)(list_obj)
+        if inplace:
+            self._invalidate_caches()
+        return self if inplace else Dataset(list_obj)
+
+    def compute_field_batch(
+            self,
+            *,
+            field: str,
+            func: Callable[[Any], List[Any]],
+            batch_size: int,
+            columns: Optional[List[str]] = None,
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Same as `Dataset.compute_field()`, except that the given function `func` is called once per batch of rows
+        (instead of once per row), so that its fixed cost per call (eg: loading a model) is paid once per batch.
+
+        Parameters:
+            - field (str): The field in which the computed values are stored.
+            - func (Callable): Takes in a batch, and returns a list of computed values (one per row in the batch).
+            - batch_size (int): Maximum number of rows per batch.
+            - columns (List[str]): If given, `func` takes in a dictionary having keys = these columns, and values = list
+            of values of said column in the batch (instead of a list of rows).
+        """
+        list_obj = self.data if inplace else self.data_copy()
+        for batch_rows, batch in _yield_batches(list_obj, batch_size=batch_size, columns=columns):
+            computed_values = func(batch)
+            _validate_batch_result(computed_values, batch_rows=batch_rows)
+            for dict_obj, computed_value in zip(batch_rows, computed_values):
+                dict_obj[field] = computed_value
+        if inplace:
+            self._invalidate_caches()
         return self if inplace else Dataset(list_obj)
 
     def keep_fields(
@@ -287,6 +652,8 @@ class Dataset:
         for dict_obj in list_obj:
             for field in fields:
                 dict_obj.pop(field, None)
+        if inplace:
+            self._invalidate_caches()
         return self if inplace else Dataset(list_obj)
 
     def _has_all_unique_existing_fields_in_any_order(self, *, reordered_fields: List[str]) -> bool:
@@ -322,6 +689,53 @@ class Dataset:
 
         return self if inplace else Dataset(list_obj)
 
+    def flatten(
+            self,
+            *,
+            sep: Optional[str] = ".",
+            max_depth: Optional[int] = None,
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Flattens the nested dictionaries of each row into fields joined by `sep` (eg: `{"a": {"b": 1}}` becomes
+        `{"a.b": 1}`), so that the nested values can be used like any other field (eg: by `order_by()`).
+        Rows having the same shape share a compiled plan, so only the first row of each shape is fully traversed.
+        Raises `ValueError` if flattening results in duplicate fields (eg: `{"a.b": 1, "a": {"b": 2}}`).
+
+        Parameters:
+            - sep (str): Separator used to join the keys.
+            - max_depth (int): Maximum number of levels of nesting to flatten (by default, all the levels).
+        """
+        assert checks.is_valid_object_of_type(sep, type_=str, allow_empty=False), "Param `sep` must be a non-empty string"
+        assert max_depth is None or checks.is_positive_integer(max_depth), "Param `max_depth` must be a positive integer"
+        list_obj = flatten_rows(self.data, sep=sep, max_depth=max_depth)
+        if inplace:
+            self.data = list_obj
+        return self if inplace else Dataset(make_deep_copy(list_obj))
+
+    def unflatten(
+            self,
+            *,
+            sep: Optional[str] = ".",
+            max_depth: Optional[int] = None,
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Splits the fields containing `sep` into nested dictionaries (eg: `{"a.b": 1}` becomes `{"a": {"b": 1}}`).
+        Reverts `flatten()`, if no field of the original rows contains `sep`.
+        Raises `ValueError` if a field clashes with another field after unflattening (eg: `{"a": 1, "a.b": 2}`).
+
+        Parameters:
+            - sep (str): Separator at which the fields are split.
+            - max_depth (int): Maximum number of splits per field (by default, the fields are split at each `sep`).
+        """
+        assert checks.is_valid_object_of_type(sep, type_=str, allow_empty=False), "Param `sep` must be a non-empty string"
+        assert max_depth is None or checks.is_positive_integer(max_depth), "Param `max_depth` must be a positive integer"
+        list_obj = unflatten_rows(self.data, sep=sep, max_depth=max_depth)
+        if inplace:
+            self.data = list_obj
+        return self if inplace else Dataset(make_deep_copy(list_obj))
+
     def fill_nulls(
             self,
             *,
@@ -329,7 +743,33 @@ class Dataset:
             subset: Optional[List[str]] = None,
             inplace: Optional[bool] = False,
         ) -> Dataset:
-        """Fills all values that are `None` with `value`"""
+        """
+        Fills all values that are `None` with `value`.
+        Finds the nulls in a single pass (refer `Dataset.null_counts()`), and then only visits the rows having nulls.
+        """
+        null_stats = self._get_null_stats()
+        if subset and not all(null_stats.is_field_in_all_rows(key) for key in subset):
+            return self._fill_nulls_by_scanning(value=value, subset=subset, inplace=inplace)
+        if not null_stats.fields_having_nulls:
+            return self if inplace else Dataset(self.data_copy())
+        list_obj = self.data if inplace else self.data_copy()
+        keys = subset if subset else null_stats.fields_having_nulls
+        has_filled_nulls = False
+        for key in keys:
+            for idx in null_stats.get_null_indices(key):
+                list_obj[idx][key] = value
+                has_filled_nulls = True
+        if inplace and has_filled_nulls:
+            self._invalidate_caches()
+        return self if inplace else Dataset(list_obj)
+
+    def _fill_nulls_by_scanning(
+            self,
+            *,
+            value: Any,
+            subset: Optional[List[str]] = None,
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
         list_obj = self.data if inplace else self.data_copy()
         for dict_obj in list_obj:
             keys = subset if subset else list(dict_obj.keys())
@@ -340,6 +780,8 @@ class Dataset:
                     raise KeyError(f"Key '{key}' from subset is not found")
                 if existing_value is None:
                     dict_obj[key] = value
+        if inplace:
+            self._invalidate_caches()
         return self if inplace else Dataset(list_obj)
 
     def autofill_missing_fields(
@@ -378,24 +820,67 @@ class Dataset:
             subset: Optional[List[str]] = None,
             inplace: Optional[bool] = False,
         ) -> Dataset:
-        """Drops rows having value as `None` in any of the given `subset` of fields"""
-        instance = self.filter_rows(
-            func=lambda dict_obj: not self._has_nulls(dict_obj=dict_obj, subset=subset),
-            inplace=inplace,
-        )
-        return instance
+        """
+        Drops rows having value as `None` in any of the given `subset` of fields.
+        The rows to drop are found by OR-ing the null bitmaps of the fields (refer `Dataset.null_counts()`), so only the
+        rows that are kept get copied. The null statistics are cached, so this is a no-op on data without nulls
+        (with `inplace=True`).
+        """
+        null_stats = self._get_null_stats()
+        if subset and not all(null_stats.is_field_in_all_rows(key) for key in subset):
+            return self.filter_rows(
+                func=lambda dict_obj: not self._has_nulls(dict_obj=dict_obj, subset=subset),
+                inplace=inplace,
+            )
+        if not null_stats.fields_having_nulls:
+            return self if inplace else Dataset(self.data_copy())
+        bitmap = null_stats.get_combined_bitmap(subset if subset else null_stats.fields_having_nulls)
+        if not bitmap:
+            return self if inplace else Dataset(self.data_copy())
+        list_obj_filtered = list(compress(self.data, bitmap_to_keep_mask(bitmap, num_rows=len(self.data))))
+        if inplace:
+            self._set_filtered_data(list_obj_filtered)
+        return self if inplace else Dataset(make_deep_copy(list_obj_filtered))
+
+    def null_counts(self) -> Dict[str, int]:
+        """
+        Returns dictionary having keys = fields, and values = number of rows where the field is `None`.
+
+        The null statistics (also used by `Dataset.fill_nulls()` and `Dataset.drop_nulls()`) are computed in a single
+        pass, and cached until the rows are modified through the `Dataset` methods. Like `Dataset.fingerprints()`, the
+        cache cannot see modifications made outside of the `Dataset` methods (eg: `dataset[0][field] = None`), so assign
+        `dataset.data` after any such modification.
+        """
+        return self._get_null_stats().get_null_counts()
+
+    def _get_null_stats(self) -> NullStats:
+        """Returns the cached null statistics of the rows (computing them, if they're not found or they're stale)"""
+        null_stats = self._null_stats
+        if null_stats is None or null_stats.num_rows != len(self):
+            null_stats = self._null_stats = compute_null_stats(self.data)
+        return null_stats
 
     def filter_rows(
             self,
             *,
-            func: Callable[[Dict[str, Any]], bool],
+            func: Union[Callable[[Dict[str, Any]], bool], Expression],
             inplace: Optional[bool] = False,
         ) -> Dataset:
         """
         Applies the given function `func` to each dictionary (row) in the list, and expects the `func` to return a boolean.
         If the result is `True` then keeps the row; otherwise removes the row.
         The `func` takes in the dictionary (row) as a parameter.
+
+        The `func` can also be an expression (see `slupy.data_wrangler.expressions`), which is much faster than a function.
+        With an expression, only the rows that are kept get copied; and equality/membership checks of strings on the fields
+        encoded via `Dataset.encode_categoricals()` are answered from the integer codes.
         """
+        if isinstance(func, Expression):
+            list_obj_filtered = self._filter_rows_by_expression(func)
+            if inplace:
+                self._set_filtered_data(list_obj_filtered)
+            return self if inplace else Dataset(make_deep_copy(list_obj_filtered))
+
         list_obj = self.data if inplace else self.data_copy()
         list_obj_filtered: List[Dict[str, Any]] = []
         for dict_obj in list_obj:
@@ -405,12 +890,80 @@ class Dataset:
                 list_obj_filtered.append(dict_obj)
 
         if inplace:
-            self.data = list_obj_filtered
+            self._set_filtered_data(list_obj_filtered)
         else:
             list_obj = list_obj_filtered
 
         return self if inplace else Dataset(list_obj)
 
+    def filter_rows_batch(
+            self,
+            *,
+            func: Callable[[Any], List[bool]],
+            batch_size: int,
+            columns: Optional[List[str]] = None,
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Same as `Dataset.filter_rows()`, except that the given function `func` is called once per batch of rows
+        (instead of once per row), so that its fixed cost per call (eg: loading a model) is paid once per batch.
+
+        Parameters:
+            - func (Callable): Takes in a batch, and returns a list of booleans (one per row in the batch).
+            If the boolean is `True` then keeps the row; otherwise removes the row.
+            - batch_size (int): Maximum number of rows per batch.
+            - columns (List[str]): If given, `func` takes in a dictionary having keys = these columns, and values = list
+            of values of said column in the batch (instead of a list of rows).
+        """
+        list_obj = self.data if inplace else self.data_copy()
+        list_obj_filtered: List[Dict[str, Any]] = []
+        for batch_rows, batch in _yield_batches(list_obj, batch_size=batch_size, columns=columns):
+            should_keep_rows: List[bool] = func(batch)
+            _validate_batch_result(should_keep_rows, batch_rows=batch_rows)
+            assert all(isinstance(should_keep_row, bool) for should_keep_row in should_keep_rows), (
+                "Result of `func` must be a list of booleans"
+            )
+            list_obj_filtered.extend(compress(batch_rows, should_keep_rows))
+
+        if inplace:
+            self._set_filtered_data(list_obj_filtered)
+        else:
+            list_obj = list_obj_filtered
+
+        return self if inplace else Dataset(list_obj)
+
+    def _filter_rows_by_expression(self, expression: Expression, /) -> List[Dict[str, Any]]:
+        """Returns a new list having the rows (not copied) for which the given expression is truthy"""
+        conjuncts = expression.get_conjuncts()
+        conjuncts_remaining: List[Expression] = []
+        selectors = None
+        for conjunct in conjuncts:
+            string_lookup = get_string_lookup(conjunct)
+            if string_lookup is None or string_lookup[0] not in self._categorical_fields:
+                conjuncts_remaining.append(conjunct)
+                continue
+            field, strings, negate = string_lookup
+            encoding = self._get_categorical_encoding(field)
+            if encoding.num_missing:  # Rows that don't have the field must raise a KeyError as usual
+                conjuncts_remaining.append(conjunct)
+                continue
+            codes = {encoding.get_code(string) for string in strings}
+            codes.discard(-1)
+            matches = map(codes.__contains__, encoding.codes)
+            if negate:
+                matches = map(operator.not_, matches)
+            selectors = matches if selectors is None else map(operator.and_, selectors, matches)
+
+        rows = self.data
+        if selectors is not None:
+            rows = list(compress(rows, selectors))
+        if len(conjuncts_remaining) == len(conjuncts):
+            return expression.compile_filter()(rows)
+        if conjuncts_remaining:
+            return reduce(operator.and_, conjuncts_remaining).compile_filter()(rows)
+        return rows
+
+    @cached_result(copy_result=lambda result: Dataset(list(result.data)))
     def order_by(
             self,
             *,
@@ -545,21 +1098,589 @@ class Dataset:
 
         return self if inplace else Dataset(list_obj)
 
+    def upsert(
+            self,
+            rows: Union[List[Dict[str, Any]], Dataset],
+            /,
+            *,
+            key: List[str],
+            on_conflict: Literal["replace", "update_fields", "keep"] = "replace",
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Inserts the given rows, except for the rows whose `key` is already found in the dataset (which are merged into
+        the existing row as per `on_conflict`). The given `rows` are never modified. New rows are appended in order.
+
+        The rows are found by key via an index, which is built on the first call (in linear time) and kept up-to-date
+        by the upserts and by the in-place filters, so each upsert of a batch takes time proportional to the batch size
+        (with `inplace=True`). The values of the `key` fields must be unique within the dataset.
+
+        Parameters:
+            - rows (list | Dataset): The rows to insert/merge (processed in order, so that a later row having the same
+            key as an earlier row is merged into it).
+            - key (List[str]): Fields whose values identify a row.
+            - on_conflict (str): Options: ['replace', 'update_fields', 'keep']. If `on_conflict='replace'`, the existing
+            row is replaced by the given row. If `on_conflict='update_fields'`, the existing row is updated with the
+            fields of the given row. If `on_conflict='keep'`, the existing row is kept as is.
+        """
+        assert checks.is_list_of_instances_of_type(key, type_=str, allow_empty=False), (
+            "Param `key` must be a non-empty list of strings"
+        )
+        assert on_conflict in ("replace", "update_fields", "keep"), (
+            "Param `on_conflict` must be one of ['replace', 'update_fields', 'keep']"
+        )
+        if isinstance(rows, Dataset):
+            rows = rows.data
+        assert checks.is_list_of_instances_of_type(rows, type_=ROW_TYPES, allow_empty=True), (
+            "Param `rows` must be a list of dictionaries"
+        )
+        dataset = self if inplace else self.copy()
+        key_index = dataset._get_key_index(tuple(key))
+        get_key, position_by_key = key_index.get_key, key_index.position_by_key
+        list_obj = dataset.data
+        for idx, dict_obj in enumerate(make_deep_copy(rows)):
+            try:
+                row_key = get_key(dict_obj)
+            except KeyError as error:
+                raise KeyError(f"Key '{error.args[0]}' from `key` is not found on row number {idx + 1} of `rows`")
+            position = position_by_key.get(row_key)
+            if position is None:
+                position_by_key[row_key] = len(list_obj)
+                list_obj.append(dict_obj)
+            elif on_conflict == "replace":
+                list_obj[position] = dict_obj
+            elif on_conflict == "update_fields":
+                list_obj[position].update(dict_obj)
+        key_index.num_rows = len(list_obj)
+        # The other key indexes are discarded, as the keys of the replaced/updated rows may have changed
+        dataset._invalidate_caches()
+        dataset._key_indexes = {key_index.fields: key_index}
+        return dataset
+
+    def diff(
+            self,
+            other: Dataset,
+            /,
+            *,
+            key: List[str],
+            compare: Optional[List[str]] = None,
+        ) -> DatasetDiff:
+        """
+        Compares the current dataset (the old snapshot) with the `other` dataset (the new snapshot), matching their rows by
+        the values of the `key` fields. Returns the added, removed and changed rows, along with the changes of each field
+        (refer `slupy.data_wrangler.diffing.DatasetDiff`). The rows are not copied.
+
+        Takes linear time: the rows of each dataset are indexed by key, and the rows whose compared values are equal are
+        skipped after a single comparison.
+
+        Parameters:
+            - other (Dataset): The new snapshot.
+            - key (List[str]): Fields that identify a row. Their values must be hashable, and unique within each dataset
+            (otherwise raises `ValueError`).
+            - compare (List[str]): Fields to compare. By default, compares the entire rows.
+        """
+        assert isinstance(other, Dataset), "Param `other` must be of type `slupy.data_wrangler.dataset.Dataset`"
+        assert checks.is_list_of_instances_of_type(key, type_=str, allow_empty=False), (
+            "Param `key` must be a non-empty list of strings"
+        )
+        assert compare is None or checks.is_list_of_instances_of_type(compare, type_=str, allow_empty=False), (
+            "Param `compare` must be a non-empty list of strings"
+        )
+        return diff_rows(self.data, other.data, key=key, compare=compare)
+
+    @cached_result(copy_result=lambda result: {field: Counter(counter) for field, counter in result.items()})
     def value_counts(self) -> Dict[str, Counter]:
         """
         Returns dictionary having keys = fields, and values = `collections.Counter` objects having the value-counts
         of all the values in said field.
         """
         result: Dict[str, Counter] = {}
-        dataset_copy = self.copy()
-        dataset_copy.autofill_missing_fields(inplace=True)
-        existing_fields = dataset_copy.get_unique_fields()
+        existing_fields = self.get_unique_fields()
         for field in existing_fields:
-            values = dataset_copy.yield_values_by_field(field=field)
-            counter = Counter(values)
+            if field in self._categorical_fields:
+                encoding = self._get_categorical_encoding(field)
+                counter = Counter()
+                for code, count in Counter(encoding.codes).items():
+                    counter[encoding.categories[code]] += count  # Categories that are equal (eg: 1, 1.0, True) are counted together
+            else:
+                counter = Counter(dict_obj.get(field) for dict_obj in self.data)  # Missing fields are counted as `None`
             result[field] = counter
         return result
 
+    def group_by(
+            self,
+            *,
+            fields: List[str],
+            aggregations: Dict[str, Tuple[str, AggregatorLike]],
+            num_workers: Optional[int] = 1,
+            strategy: Literal["merge", "shuffle"] = "merge",
+            min_rows_per_worker: Optional[int] = 10_000,
+        ) -> Dataset:
+        """
+        Returns a new `Dataset` having one row per group (of rows having the same values for the given `fields`), in the
+        order of the first row of each group. Each row has the values of the group `fields`, followed by the aggregated
+        values. The values are not copied.
+
+        With `num_workers > 1`, the rows are aggregated by a pool of processes (the rows are inherited by the workers
+        where processes can be forked, instead of being pickled), and the results are the same as with `num_workers=1`
+        (except for sums/means of floats, which may differ by rounding, as float addition is not associative).
+
+        Parameters:
+            - fields (List[str]): Fields to group by.
+            - aggregations (dict): Dictionary having keys = output fields, and values = tuple of (input field, agg),
+            where `agg` is as per `slupy.data_wrangler.aggregations.get_aggregator()`. Aggregators must be picklable when
+            processes cannot be forked.
+            - num_workers (int): Number of worker processes (eg: `os.cpu_count()`).
+            - strategy (str): Options: ['merge', 'shuffle']. If `strategy='merge'`, each worker aggregates a contiguous
+            partition of the rows, and the partial states are merged (best when there are few groups).
+            If `strategy='shuffle'`, the rows are hash-partitioned by group, so each group is aggregated by a single
+            worker and nothing needs to be merged (best when there are many groups). Each worker scans all the rows to find
+            its own groups; where processes cannot be forked, the rows are hash-partitioned serially by this process
+            instead, which limits the speedup.
+            - min_rows_per_worker (int): Fewer workers are used if there are fewer rows than this per worker
+            (as starting a worker has a fixed cost).
+
+        Example:
+        ```
+        >>> Dataset([
+            {"team": "A", "points": 10},
+            {"team": "B", "points": 5},
+            {"team": "A", "points": 20},
+        ]).group_by(fields=["team"], aggregations={"total": ("points", "sum"), "games": ("points", "size")}).data
+        [
+            {"team": "A", "total": 30, "games": 2},
+            {"team": "B", "total": 5, "games": 1},
+        ]
+        ```
+        """
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        assert isinstance(aggregations, dict) and aggregations, "Param `aggregations` must be a non-empty dictionary"
+        assert checks.is_positive_integer(num_workers), "Param `num_workers` must be a positive integer"
+        assert strategy in ("merge", "shuffle"), "Param `strategy` must be one of ['merge', 'shuffle']"
+        assert checks.is_positive_integer(min_rows_per_worker), "Param `min_rows_per_worker` must be a positive integer"
+        clashing_fields = set(aggregations.keys()).intersection(fields)
+        assert not clashing_fields, f"The output fields of `aggregations` must not clash with `fields`: {sorted(clashing_fields)}"
+        specs = [
+            (output_field, input_field, get_aggregator(agg))
+            for output_field, (input_field, agg) in aggregations.items()
+        ]
+        list_obj = group_rows(
+            self.data,
+            fields=fields,
+            specs=specs,
+            num_workers=num_workers,
+            strategy=strategy,
+            min_rows_per_worker=min_rows_per_worker,
+        )
+        return Dataset(list_obj)
+
+    def pivot(
+            self,
+            *,
+            index: List[str],
+            columns: str,
+            values: str,
+            agg: AggregatorLike = "first",
+            fill_value: Any = None,
+        ) -> Dataset:
+        """
+        Reshapes the dataset from long to wide format, in a single pass over the rows.
+        Returns a new `Dataset` having one row per distinct combination of the `index` fields, and one field per distinct
+        value of the `columns` field (converted to a string), which has the `values` aggregated via `agg`.
+        The values are not copied.
+
+        Parameters:
+            - index (List[str]): Fields that identify each row of the output.
+            - columns (str): Field whose distinct values become the new fields.
+            - values (str): Field whose values are aggregated.
+            - agg (str | Callable | Aggregator): Refer `slupy.data_wrangler.aggregations.get_aggregator()`.
+            - fill_value (Any): Value for the combinations of `index` and `columns` that have no rows.
+
+        Example:
+        ```
+        >>> Dataset([
+            {"day": "mon", "metric": "clicks", "value": 10},
+            {"day": "mon", "metric": "views", "value": 100},
+            {"day": "tue", "metric": "clicks", "value": 20},
+        ]).pivot(index=["day"], columns="metric", values="value", agg="sum").data
+        [
+            {"day": "mon", "clicks": 10, "views": 100},
+            {"day": "tue", "clicks": 20, "views": None},
+        ]
+        ```
+        """
+        assert checks.is_list_of_instances_of_type(index, type_=str, allow_empty=False), (
+            "Param `index` must be a non-empty list of strings"
+        )
+        aggregator = get_aggregator(agg)
+        create, update = aggregator.create, aggregator.update
+        get_index_key = itemgetter(*index)
+        get_column_and_value = itemgetter(columns, values)
+        states_by_index_key: Dict[Any, Dict[Any, Any]] = {}
+        column_names: Dict[Any, str] = {}
+        for dict_obj in self.data:
+            index_key = get_index_key(dict_obj)
+            column_value, value = get_column_and_value(dict_obj)
+            states = states_by_index_key.get(index_key)
+            if states is None:
+                states = states_by_index_key[index_key] = {}
+            if column_value not in column_names:
+                column_names[column_value] = str(column_value)
+            state = states.get(column_value, UNSET)
+            states[column_value] = update(create() if state is UNSET else state, value)
+
+        pivoted_fields = list(column_names.values())
+        assert len(set(pivoted_fields)) == len(pivoted_fields), "The values of the `columns` field must be distinct as strings"
+        assert not set(pivoted_fields).intersection(index), "The values of the `columns` field must not clash with the `index` fields"
+        row_template = dict.fromkeys(index + pivoted_fields, fill_value)
+        finalize = aggregator.finalize
+        list_obj: List[Dict[str, Any]] = [None] * len(states_by_index_key)
+        for idx, (index_key, states) in enumerate(states_by_index_key.items()):
+            dict_obj = row_template.copy()
+            dict_obj.update(zip(index, (index_key,) if len(index) == 1 else index_key))
+            for column_value, state in states.items():
+                dict_obj[column_names[column_value]] = finalize(state)
+            list_obj[idx] = dict_obj
+        return Dataset(list_obj)
+
+    def resample(
+            self,
+            *,
+            time_field: str,
+            offset_kwargs: Dict[str, int],
+            aggregations: Dict[str, Tuple[str, AggregatorLike]],
+            origin: Optional[Union[datetime, date]] = None,
+            include_empty_buckets: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Returns a new `Dataset` having one row per time bucket (in chronological order), where the buckets are consecutive
+        intervals of the width given by `offset_kwargs`, starting at `origin`. Each row has the start of the bucket in the
+        `time_field`, followed by the aggregated values of the rows within the bucket. The values are not copied.
+        The rows are aggregated in a single pass (the rows whose `time_field` is `None`, or before `origin`, are ignored).
+
+        Parameters:
+            - time_field (str): Field having date objects (or datetime objects). The values must not mix both types.
+            - offset_kwargs (dict): Width of each bucket, as a dictionary having exactly one offset (eg: `{"hours": 1}`).
+            Calendar offsets (`years` and `months`) follow `slupy.dates.time_travel.TimeTravel.add()`, where the start of
+            each bucket is computed from `origin` (eg: monthly buckets from Jan 31 start on Feb 29, Mar 31, Apr 30).
+            - aggregations (dict): Refer `Dataset.group_by()`.
+            - origin (date | datetime): Start of the first bucket (of the same type as the values). By default, the
+            earliest value rounded down to the unit of the offset (eg: to the start of its hour for `{"hours": 1}`,
+            to the first day of its month for `{"months": 1}`, to the Monday of its week for `{"weeks": 1}`).
+            - include_empty_buckets (bool): If `include_empty_buckets=True`, the buckets having no rows (between the first
+            and the last bucket having rows) are also returned, with the aggregated values of zero rows
+            (eg: 0 for 'size' and 'sum', `None` for 'mean').
+
+        Example:
+        ```
+        >>> Dataset([
+            {"at": datetime(2024, 1, 1, 10, 15), "amount": 10},
+            {"at": datetime(2024, 1, 1, 10, 45), "amount": 20},
+            {"at": datetime(2024, 1, 1, 12, 5), "amount": 5},
+        ]).resample(
+            time_field="at",
+            offset_kwargs={"hours": 1},
+            aggregations={"total": ("amount", "sum")},
+            origin=datetime(2024, 1, 1),
+            include_empty_buckets=True,
+        ).data
+        [
+            {"at": datetime(2024, 1, 1, 10, 0), "total": 30},
+            {"at": datetime(2024, 1, 1, 11, 0), "total": 0},
+            {"at": datetime(2024, 1, 1, 12, 0), "total": 5},
+        ]
+        ```
+        """
+        assert checks.is_valid_object_of_type(time_field, type_=str, allow_empty=False), (
+            "Param `time_field` must be a non-empty string"
+        )
+        assert isinstance(offset_kwargs, dict) and len(offset_kwargs) == 1, "Only 1 offset can be used at a time"
+        offset_name, offset_value = next(iter(offset_kwargs.items()))
+        assert offset_name in CALENDAR_OFFSETS + FIXED_WIDTH_OFFSETS, (
+            f"Param `offset_kwargs` must use one of {list(CALENDAR_OFFSETS + FIXED_WIDTH_OFFSETS)}"
+        )
+        assert checks.is_positive_integer(offset_value), "The offset in `offset_kwargs` must be a positive integer"
+        assert isinstance(aggregations, dict) and aggregations, "Param `aggregations` must be a non-empty dictionary"
+        assert time_field not in aggregations, "The output fields of `aggregations` must not clash with `time_field`"
+        assert checks.is_boolean(include_empty_buckets), "Param `include_empty_buckets` must be of type 'bool'"
+        specs = [
+            (output_field, input_field, get_aggregator(agg))
+            for output_field, (input_field, agg) in aggregations.items()
+        ]
+        list_obj = resample_rows(
+            self.data,
+            time_field=time_field,
+            offset_kwargs=offset_kwargs,
+            specs=specs,
+            origin=origin,
+            include_empty_buckets=include_empty_buckets,
+        )
+        return Dataset(list_obj)
+
+    def melt(
+            self,
+            *,
+            id_fields: List[str],
+            value_fields: Optional[List[str]] = None,
+            variable_field: Optional[str] = "variable",
+            value_field: Optional[str] = "value",
+        ) -> Dataset:
+        """
+        Reshapes the dataset from wide to long format (the inverse of `Dataset.pivot()`), in a single pass over the rows.
+        Returns a new `Dataset` having one row per combination of row and field in `value_fields`. The values are not copied.
+
+        Parameters:
+            - id_fields (List[str]): Fields that are kept as they are.
+            - value_fields (List[str]): Fields that are unpivoted. By default, all the fields that are not in `id_fields`.
+            - variable_field (str): Name of the field having the name of the unpivoted field.
+            - value_field (str): Name of the field having the value of the unpivoted field.
+        """
+        assert checks.is_list_of_instances_of_type(id_fields, type_=str, allow_empty=True), (
+            "Param `id_fields` must be a list of strings"
+        )
+        if value_fields is None:
+            value_fields = [field for field in self.get_unique_fields() if field not in id_fields]
+        assert checks.is_list_of_instances_of_type(value_fields, type_=str, allow_empty=True), (
+            "Param `value_fields` must be a list of strings"
+        )
+        assert variable_field != value_field and not {variable_field, value_field}.intersection(id_fields), (
+            "Params `variable_field` and `value_field` must be distinct, and must not be one of the `id_fields`"
+        )
+        row_template = dict.fromkeys(id_fields + [variable_field, value_field])
+        list_obj: List[Dict[str, Any]] = [None] * (len(self.data) * len(value_fields))
+        position = 0
+        for idx, dict_obj in enumerate(self.data):
+            try:
+                dict_obj_ids = row_template.copy()
+                for field in id_fields:
+                    dict_obj_ids[field] = dict_obj[field]
+                for field in value_fields:
+                    dict_obj_new = dict_obj_ids.copy()
+                    dict_obj_new[variable_field] = field
+                    dict_obj_new[value_field] = dict_obj[field]
+                    list_obj[position] = dict_obj_new
+                    position += 1
+            except KeyError as exc:
+                raise KeyError(f"Field '{exc.args[0]}' is not found on row number {idx + 1}")
+        return Dataset(list_obj)
+
+    def enable_result_cache(self, *, maxsize: Optional[int] = 128) -> Dataset:
+        """
+        Caches the results of `get_unique_fields()`, `get_datatypes_by_field()`, `value_counts()` and `order_by()` per
+        arguments (keeping the `maxsize` most recently used results), so that repeated calls on an unchanged dataset
+        only copy the cached result. Returns the same instance.
+
+        The cached results are discarded whenever the rows are modified via the `Dataset` methods (or `dataset.data`
+        is assigned). Like `Dataset.encode_categoricals()`, the cache cannot see modifications made outside of the
+        `Dataset` methods (eg: `dataset[0][field] = value`), so call `Dataset.clear_result_cache()` after any such
+        modification.
+        """
+        assert checks.is_positive_integer(maxsize), "Param `maxsize` must be a positive integer"
+        self._result_cache = ResultCache(maxsize=maxsize)
+        return self
+
+    def disable_result_cache(self) -> Dataset:
+        """Discards the result cache (refer `Dataset.enable_result_cache()`). Returns the same instance."""
+        self._result_cache = None
+        return self
+
+    def clear_result_cache(self) -> None:
+        """Discards the cached results (the hit/miss statistics are kept)"""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def get_result_cache_stats(self) -> CacheStats:
+        """Returns the hit/miss statistics of the result cache (refer `Dataset.enable_result_cache()`)"""
+        assert self._result_cache is not None, "The result cache is not enabled (refer `Dataset.enable_result_cache()`)"
+        return self._result_cache.get_stats()
+
+    def _get_cache_version(self) -> Tuple[int, int]:
+        # The number of rows is part of the version, to also catch rows appended to `dataset.data` from outside
+        return (self._version, len(self))
+
+    def encode_categoricals(
+            self,
+            *,
+            fields: List[str],
+            inplace: Optional[bool] = False,
+        ) -> Dataset:
+        """
+        Dictionary-encodes the given fields (meant for fields having few distinct values, like a country or a status).
+        Each distinct value of a field is stored only once (and shared by all the rows having said value), and the
+        dataset keeps a small integer code per row. The rows still have the actual values, so reading them is unchanged.
+
+        Duplicate detection and value-counts over the encoded fields compare the integer codes instead of the values.
+        Modifying the rows in-place through the `Dataset` methods keeps the encoding up to date. The encoding cannot see
+        modifications made outside of the `Dataset` methods (eg: `dataset[0][field] = value`, sorting `dataset.data`, or
+        modifying the list that was given to the constructor), so call this method again after any such modification.
+
+        Parameters:
+            - fields (List[str]): The fields to encode. Their values must be hashable. Rows that don't have a field are
+            encoded as `None` (like `Dataset.value_counts()` counts them), but are left without said field.
+        """
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        instance = self if inplace else Dataset(self.data_copy())
+        for field in fields:
+            if field not in instance._categorical_fields:
+                instance._categorical_fields.append(field)
+            instance._categorical_encodings.pop(field, None)
+            instance._get_categorical_encoding(field)
+        return instance
+
+    def get_categorical_encoding(self, *, field: str) -> CategoricalEncoding:
+        """Returns the encoding (categories and codes) of a field encoded via `Dataset.encode_categoricals()`"""
+        assert field in self._categorical_fields, f"Field '{field}' is not encoded as a categorical"
+        return self._get_categorical_encoding(field)
+
+    def _get_categorical_encoding(self, field: str, /) -> CategoricalEncoding:
+        """Returns the encoding of the given categorical field. Re-encodes the field if the rows have been modified."""
+        encoding = self._categorical_encodings.get(field)
+        if encoding is not None:
+            return encoding
+        try:
+            encoding = encode_field(self.data, field=field)
+        except TypeError:
+            raise TypeError(f"Field '{field}' has unhashable values, so it cannot be encoded as a categorical")
+        categories = encoding.categories
+        for dict_obj, code in zip(self.data, encoding.codes):
+            if encoding.num_missing and field not in dict_obj:
+                continue  # The field is not added to the rows that don't have it
+            dict_obj[field] = categories[code]
+        self._categorical_encodings[field] = encoding
+        return encoding
+
+    def sample(
+            self,
+            *,
+            n: Optional[int] = None,
+            frac: Optional[float] = None,
+            seed: Optional[int] = None,
+            stratify_by: Optional[List[str]] = None,
+        ) -> Dataset:
+        """
+        Returns a new `Dataset` having a uniform random sample of the rows (in their original order).
+        Uses reservoir sampling (refer `slupy.data_wrangler.sampling`), so it takes O(n) time and O(k) memory.
+        The sample is reproducible for a given `seed`.
+
+        Parameters:
+            - n (int): Number of rows to sample (per group, if `stratify_by` is given).
+            - frac (float): Fraction of rows to sample (per group, if `stratify_by` is given). Must be in the range [0, 1].
+            - seed (int): Seed of the random number generator.
+            - stratify_by (List[str]): If given, samples the rows of each group (of rows having the same values for said fields) separately.
+        """
+        assert sum([n is not None, frac is not None]) == 1, "Expected exactly one of the following params: ['n', 'frac']"
+        assert n is None or checks.is_non_negative_integer(n), "Param `n` must be a non-negative integer"
+        assert frac is None or (checks.is_number(frac) and 0 <= frac <= 1), "Param `frac` must be a number in the range [0, 1]"
+        if stratify_by is None:
+            k = n if n is not None else round(frac * len(self.data))
+            list_obj = reservoir_sample(self.data, k=k, seed=seed)
+            return Dataset(make_deep_copy(list_obj))
+
+        assert checks.is_list_of_instances_of_type(stratify_by, type_=str, allow_empty=False), (
+            "Param `stratify_by` must be a non-empty list of strings"
+        )
+        get_group = itemgetter(*stratify_by)
+        if n is not None:
+            list_obj = stratified_reservoir_sample(self.data, key=get_group, k=n, seed=seed)
+        else:
+            group_sizes = Counter(map(get_group, self.data))
+            k_by_group = {group: round(frac * group_size) for group, group_size in group_sizes.items()}
+            list_obj = stratified_reservoir_sample(self.data, key=get_group, k_by_group=k_by_group, seed=seed)
+        return Dataset(make_deep_copy(list_obj))
+
+    def memory_usage(
+            self,
+            *,
+            deep: Optional[bool] = True,
+            sample_size: Optional[int] = None,
+        ) -> MemoryUsage:
+        """
+        Returns the memory used by the dataset (in bytes), per field and per container (refer
+        `slupy.data_wrangler.memory.MemoryUsage`). Objects that are shared by many rows (eg: values encoded via
+        `Dataset.encode_categoricals()`) are counted only once.
+
+        Parameters:
+            - deep (bool): If `deep=True`, includes the objects contained in the values (eg: items of lists or nested
+            dictionaries). Otherwise, only counts the value objects themselves.
+            - sample_size (int): If given, only measures these many rows (evenly spaced), and extrapolates to all the rows.
+            Cheap enough to be used on datasets having millions of rows.
+        """
+        return compute_memory_usage(self.data, deep=deep, sample_size=sample_size)
+
+    def to_shared_memory(self) -> SharedSegment:
+        """
+        Copies the rows into a new shared memory segment, so that worker processes can attach to it by name (refer
+        `Dataset.attach_shared_memory()`) instead of receiving the pickled rows.
+        Returns the handle of the segment (refer `slupy.data_wrangler.shared_memory.SharedSegment`), which unlinks it
+        once released. Workers can also read the numeric columns without copying them
+        (refer `slupy.data_wrangler.shared_memory.attach()`).
+
+        >>> with dataset.to_shared_memory() as segment:
+        >>>     results = pool.map(work, [segment.name] * num_tasks)  # where `work` calls `Dataset.attach_shared_memory(name)`
+        """
+        return share_rows(self.data)
+
+    @classmethod
+    def attach_shared_memory(cls, name: str, /) -> Dataset:
+        """
+        Returns a dataset having the rows of the shared memory segment of the given `name` (created via
+        `Dataset.to_shared_memory()`). The segment is mapped read-only, and is never unlinked by this process.
+        """
+        return cls(load_shared_rows(name))
+
+    def to_sqlite(
+            self,
+            path: str,
+            table: str,
+            /,
+            *,
+            if_exists: Literal["fail", "replace", "append"] = "fail",
+            batch_size: Optional[int] = 100_000,
+        ) -> SQLiteDataset:
+        """
+        Writes the rows into the given table of an SQLite database (refer `slupy.data_wrangler.sqlite.write_rows()`),
+        and returns an `SQLiteDataset` that reads from said table.
+
+        Values of types that SQLite does not support (eg: lists, datetimes) are stored as pickles, so that every value
+        is read back as it was written. A field that is missing from a row is written as NULL (and read as `None`).
+
+        Parameters:
+            - path (str): Path of the SQLite database (created if it doesn't exist).
+            - table (str): Name of the table.
+            - if_exists (str): What to do if the table already exists. Options: ['fail', 'replace', 'append'].
+            - batch_size (int): Number of rows inserted per batch (all the batches are inserted in a single transaction).
+        """
+        connection = connect(path)
+        try:
+            write_rows(connection, table, self.data, if_exists=if_exists, batch_size=batch_size)
+        finally:
+            connection.close()
+        return SQLiteDataset(path, table)
+
+    @classmethod
+    def from_sqlite(
+            cls,
+            path: str,
+            query: str,
+            /,
+            *,
+            params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        ) -> Dataset:
+        """
+        Creates a dataset having the rows returned by the given query (with the given `params`) on the SQLite database
+        at the given path. The values of the columns of tables written via `Dataset.to_sqlite()` are converted back to
+        their types.
+        """
+        connection = connect(path)
+        try:
+            return cls(list(read_rows(connection, query, params=params or ())))
+        finally:
+            connection.close()
+
     def pretty_print(self) -> None:
         """Pretty prints the value of `self.data`"""
         pprint(
@@ -568,3 +1689,157 @@ class Dataset:
             underscore_numbers=False,
         )
 
+
+
+def _rebuild_dataset(header: Header, buffers: List[Buffer], categorical_fields: List[str], /) -> Dataset:
+    """Rebuilds a dataset pickled via `Dataset.__reduce_ex__()`. Its rows are decoded once they're first accessed"""
+    dataset = Dataset([])
+    dataset._data = None
+    dataset._pending_columns = (header, buffers)
+    dataset._categorical_fields = categorical_fields
+    return dataset
+
+
+def _iter_tuples(rows: Iterator[Dict[str, Any]], /, *, fields: List[str]) -> Iterator[Tuple[Any, ...]]:
+    assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+        "Param `fields` must be a non-empty list of strings"
+    )
+    getter = itemgetter(*fields)
+    if len(fields) == 1:
+        return zip(map(getter, rows))
+    return map(getter, rows)
+
+
+class DatasetView(Sequence):
+    """
+    Read-only window over the rows of a `Dataset` (returned when a `Dataset` is sliced).
+    Creating a view is O(1), and the rows are never copied.
+    """
+
+    __slots__ = ("_rows", "_rows_range")
+
+    def __init__(self, rows: List[Dict[str, Any]], /, *, rows_range: range) -> None:
+        self._rows = rows
+        self._rows_range = rows_range
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __len__(self) -> int:
+        return len(self._rows_range)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Dict[str, Any], DatasetView]:
+        if isinstance(idx, slice):
+            return DatasetView(self._rows, rows_range=self._rows_range[idx])
+        return self._rows[self._rows_range[idx]]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rows_range = self._rows_range
+        if rows_range.start == 0 and rows_range.step == 1:
+            return islice(self._rows, rows_range.stop)
+        # Indexing directly (instead of `islice()`, which walks past the first `start` rows) keeps a window at the end
+        # of the rows as cheap as one at the start
+        return map(self._rows.__getitem__, rows_range)
+
+    def iter_tuples(self, *, fields: List[str]) -> Iterator[Tuple[Any, ...]]:
+        """Yields a tuple of values (in the order of the given `fields`) for each row in the view"""
+        return _iter_tuples(iter(self), fields=fields)
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Returns a new list having the rows of the view (the rows themselves are not copied)"""
+        return list(self)
+
+    def to_dataset(self, *, deep_copy: Optional[bool] = False) -> Dataset:
+        """Returns a `Dataset` having the rows of the view"""
+        return Dataset(self.data, deep_copy=deep_copy)
+
+
+def _yield_batches(
+        rows: List[Dict[str, Any]],
+        /,
+        *,
+        batch_size: int,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Any]]:
+    """
+    Yields tuples of `(batch_rows, batch)`, where `batch_rows` is the list of rows in the batch, and `batch` is what gets
+    passed to the user's function (either `batch_rows` itself, or a dictionary of lists of values by column).
+    """
+    assert checks.is_positive_integer(batch_size), "Param `batch_size` must be a positive integer"
+    assert columns is None or checks.is_list_of_instances_of_type(columns, type_=str, allow_empty=False), (
+        "Param `columns` must be a non-empty list of strings"
+    )
+    if not rows:
+        return
+    for start, end in compute_partitions(length=len(rows), partition_size=batch_size):
+        batch_rows = rows[start : end + 1]
+        if columns is None:
+            yield batch_rows, batch_rows
+            continue
+        batch_columns = {}
+        for column in columns:
+            try:
+                batch_columns[column] = [dict_obj[column] for dict_obj in batch_rows]
+            except KeyError:
+                raise KeyError(f"Column '{column}' is not found in the batch of rows {start + 1}-{end + 1}")
+        yield batch_rows, batch_columns
+
+
+def _validate_batch_result(result: Any, /, *, batch_rows: List[Dict[str, Any]]) -> None:
+    assert isinstance(result, list), "Result of `func` must be a list"
+    assert len(result) == len(batch_rows), (
+        f"Result of `func` must have one item per row in the batch. Expected {len(batch_rows)} items, but got {len(result)} items."
+    )
+
+
+def _get_hashable_keys(rows: List[Dict[str, Any]], /, *, subset: Optional[List[str]] = None) -> List[Any]:
+    """
+    Returns a key per row, such that rows are equal (over the given `subset` of fields) if their keys are equal.
+    The keys are hashable, unless the rows have unhashable values (eg: lists).
+    """
+    if not subset:
+        return list(map(frozenset, map(operator.methodcaller("items"), rows)))
+    try:
+        return list(map(itemgetter(*subset), rows))
+    except KeyError as error:
+        raise KeyError(f"Key '{error.args[0]}' from subset is not found")
+
+
+def _has_self_equal_categories(encoding: CategoricalEncoding, /) -> bool:
+    # Eg: NaN is not equal to itself, so rows having NaN are never duplicates (which the codes cannot tell)
+    return all(category == category for category in encoding.categories)
+
+
+def _get_equality_codes(encoding: CategoricalEncoding, /) -> List[int]:
+    """
+    Returns a list that maps each code to the code of the first category that is equal to its category, as categories
+    can be equal while being distinct (eg: 1, 1.0 and True).
+    """
+    code_by_category: Dict[Any, int] = {}
+    return [code_by_category.setdefault(category, code) for code, category in enumerate(encoding.categories)]
+
+
+def _find_duplicate_indices_by_keys(
+        keys: Iterable[Any],
+        /,
+        *,
+        break_at: Optional[Literal["first", "first_full"]] = None,
+    ) -> List[List[int]]:
+    """
+    Same output as `Dataset.find_duplicate_indices()`, where each row is represented by a hashable key (rows are
+    duplicates if their keys are equal). Runs in linear time.
+    """
+    indices_by_key: Dict[Any, List[int]] = {}
+    for idx, key in enumerate(keys):
+        sub_indices = indices_by_key.get(key)
+        if sub_indices is None:
+            indices_by_key[key] = [idx]
+        else:
+            sub_indices.append(idx)
+    indices = [sub_indices for sub_indices in indices_by_key.values() if len(sub_indices) > 1]
+    if indices and break_at == "first":
+        return [indices[0][:2]]
+    if indices and break_at == "first_full":
+        return [indices[0]]
+    return indices
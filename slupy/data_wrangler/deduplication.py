@@ -0,0 +1,336 @@
+from collections import OrderedDict
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Mapping, Optional
+
+from slupy.core import checks
+from slupy.data_wrangler.fingerprints import compute_fingerprint
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter of 16-byte digests (eg: row fingerprints), sized for the given `capacity` and
+    `error_rate` (probability of a false positive once `capacity` items have been added).
+    The bit positions are derived from the digest itself (via enhanced double hashing), so no further hashing is needed.
+    """
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "num_items", "_bits")
+
+    def __init__(self, *, capacity: int, error_rate: float) -> None:
+        assert checks.is_positive_integer(capacity), "Param `capacity` must be a positive integer"
+        assert checks.is_number(error_rate) and 0 < error_rate < 1, "Param `error_rate` must be a number in the range (0, 1)"
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.num_items = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def __len__(self) -> int:
+        return self.num_items
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self._bits
+        for position in self._get_positions(digest):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def is_full(self) -> bool:
+        return self.num_items >= self.capacity
+
+    @property
+    def num_bytes(self) -> int:
+        return len(self._bits)
+
+    def _get_positions(self, digest: bytes, /) -> List[int]:
+        # Enhanced double hashing (Dillinger & Manolios), which avoids the degenerate probe sequences of plain
+        # double hashing when the second hash is a multiple of the number of bits
+        num_bits = self.num_bits
+        position = int.from_bytes(digest[:8], "little") % num_bits
+        step = int.from_bytes(digest[8:16], "little") % num_bits
+        positions = []
+        for idx in range(1, self.num_hashes + 1):
+            positions.append(position)
+            position = (position + step) % num_bits
+            step = (step + idx) % num_bits
+        return positions
+
+    def add(self, digest: bytes, /) -> bool:
+        """Adds the given digest. Returns `True` if it was (probably) already present, and `False` otherwise"""
+        bits = self._bits
+        was_present = True
+        for position in self._get_positions(digest):
+            byte_idx = position >> 3
+            mask = 1 << (position & 7)
+            if not bits[byte_idx] & mask:
+                bits[byte_idx] |= mask
+                was_present = False
+        if not was_present:
+            self.num_items += 1
+        return was_present
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows as items are added, while keeping the overall false positive rate under `error_rate`
+    (as per "Scalable Bloom Filters" by Almeida et al.). Each new filter has `growth_factor` times the capacity of
+    the previous one, and a tighter error rate (by `tightening_ratio`).
+    """
+
+    __slots__ = ("initial_capacity", "error_rate", "growth_factor", "tightening_ratio", "filters")
+
+    def __init__(
+            self,
+            *,
+            initial_capacity: Optional[int] = 100_000,
+            error_rate: Optional[float] = 0.001,
+            growth_factor: Optional[int] = 2,
+            tightening_ratio: Optional[float] = 0.5,
+        ) -> None:
+        assert checks.is_positive_integer(initial_capacity), "Param `initial_capacity` must be a positive integer"
+        assert checks.is_number(error_rate) and 0 < error_rate < 1, "Param `error_rate` must be a number in the range (0, 1)"
+        assert checks.is_positive_integer(growth_factor), "Param `growth_factor` must be a positive integer"
+        assert 0 < tightening_ratio < 1, "Param `tightening_ratio` must be a number in the range (0, 1)"
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.filters: List[BloomFilter] = []
+
+    def __len__(self) -> int:
+        return sum(len(filter_) for filter_ in self.filters)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return any(digest in filter_ for filter_ in reversed(self.filters))
+
+    @property
+    def num_bytes(self) -> int:
+        return sum(filter_.num_bytes for filter_ in self.filters)
+
+    def add(self, digest: bytes, /) -> bool:
+        """Adds the given digest. Returns `True` if it was (probably) already present, and `False` otherwise"""
+        filters = self.filters
+        if any(digest in filter_ for filter_ in filters[:-1]):
+            return True
+        if filters and not filters[-1].is_full:
+            return filters[-1].add(digest)  # checks and adds in one probe
+        if filters and digest in filters[-1]:
+            return True
+        num_filters = len(filters)
+        filters.append(
+            BloomFilter(
+                capacity=self.initial_capacity * (self.growth_factor ** num_filters),
+                error_rate=self.error_rate * (1 - self.tightening_ratio) * (self.tightening_ratio ** num_filters),
+            )
+        )
+        return filters[-1].add(digest)
+
+
+class StreamDeduplicator:
+    """
+    Drops duplicate rows from a stream of rows (of any length), keeping the first occurrence of each row.
+    Rows are compared via their fingerprints over the given `subset` of fields (refer
+    `slupy.data_wrangler.fingerprints.compute_fingerprint()`), so the rows themselves are never kept.
+
+    Modes:
+        - 'exact': Keeps a hash set of the fingerprints (16 bytes each, plus overhead of the set).
+        - 'bloom': Keeps a scalable Bloom filter of the fingerprints, which uses ~2 bytes per row at `error_rate=0.001`.
+        A new row is wrongly dropped as a duplicate with a probability of at most `error_rate`. Duplicates are never kept.
+
+    Expiry:
+        If `window` and/or `ttl` are given, a row is a duplicate only if the same row was seen within the last `window`
+        rows and/or `ttl` seconds, and older fingerprints are discarded, so the memory used stays bounded.
+        In 'exact' mode the expiry is exact. In 'bloom' mode the state is kept in 2 generations of Bloom filters that
+        are rotated every `window / 2` rows (or `ttl / 2` seconds), so fingerprints expire after between half and all
+        of the window.
+
+    Usage:
+    ```
+    deduplicator = StreamDeduplicator(subset=["event_id"], mode="bloom", window=10_000_000)
+    for row in deduplicator.filter(rows):
+        ...
+    ```
+    """
+
+    def __init__(
+            self,
+            *,
+            subset: Optional[List[str]] = None,
+            mode: Literal["exact", "bloom"] = "exact",
+            error_rate: Optional[float] = 0.001,
+            initial_capacity: Optional[int] = 100_000,
+            window: Optional[int] = None,
+            ttl: Optional[float] = None,
+            get_timestamp: Optional[Callable[[Mapping[str, Any]], float]] = None,
+        ) -> None:
+        """
+        Parameters:
+            - subset (List[str]): Fields to compare. By default, compares all the fields.
+            - mode (str): Options: ['exact', 'bloom'].
+            - error_rate (float): False positive rate of the Bloom filters (only for `mode='bloom'`).
+            - initial_capacity (int): Number of rows that the first Bloom filter is sized for (only for `mode='bloom'`).
+            - window (int): Number of most recent rows within which duplicates are looked for.
+            - ttl (float): Number of seconds within which duplicates are looked for.
+            - get_timestamp (Callable): Takes in a row, and returns its timestamp in seconds (eg: event time of the row).
+            Only used along with `ttl`. By default, uses the time at which the row is processed (`time.monotonic()`).
+        """
+        assert mode in ("exact", "bloom"), "Param `mode` must be one of ['exact', 'bloom']"
+        assert window is None or checks.is_positive_integer(window), "Param `window` must be a positive integer"
+        assert ttl is None or checks.is_positive_number(ttl), "Param `ttl` must be a positive number"
+        assert get_timestamp is None or ttl is not None, "Param `get_timestamp` can only be used along with `ttl`"
+        self.subset = subset
+        self.mode = mode
+        self.error_rate = error_rate
+        self.initial_capacity = initial_capacity
+        self.window = window
+        self.ttl = ttl
+        self.get_timestamp = get_timestamp
+        self.num_rows_seen = 0
+        self.num_duplicates = 0
+        self._has_expiry = window is not None or ttl is not None
+        self._seen: set = set()
+        self._last_seen: OrderedDict = OrderedDict()  # fingerprint -> (row number, timestamp) when last seen
+        self._generations: List[ScalableBloomFilter] = []
+        self._generation_start = (0, 0.0)  # row number and timestamp when the current generation started
+        if mode == "bloom":
+            self._generations = [self._make_bloom_filter()]
+
+    def _make_bloom_filter(self) -> ScalableBloomFilter:
+        initial_capacity = self.initial_capacity
+        if self.window is not None:
+            initial_capacity = min(initial_capacity, max(1, self.window // 2))
+        # Each generation is checked, so each one gets half of the allowed error rate
+        error_rate = self.error_rate / 2 if self._has_expiry else self.error_rate
+        return ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
+
+    def _get_timestamp(self, row: Mapping[str, Any], /) -> float:
+        if self.ttl is None:
+            return 0.0
+        return self.get_timestamp(row) if self.get_timestamp else time.monotonic()
+
+    def _is_expired(
+            self,
+            row_number: int,
+            timestamp: float,
+            /,
+            *,
+            current_row_number: int,
+            current_timestamp: float,
+        ) -> bool:
+        if self.window is not None and current_row_number - row_number >= self.window:
+            return True
+        return self.ttl is not None and current_timestamp - timestamp >= self.ttl
+
+    def is_duplicate(self, row: Mapping[str, Any], /) -> bool:
+        """Returns `True` if the given row is a duplicate of a row seen before, and records the row as seen"""
+        fingerprint = compute_fingerprint(row, subset=self.subset)
+        row_number = self.num_rows_seen
+        self.num_rows_seen += 1
+        if self.mode == "exact" and not self._has_expiry:
+            is_duplicate = fingerprint in self._seen
+            if not is_duplicate:
+                self._seen.add(fingerprint)
+        elif self.mode == "exact":
+            is_duplicate = self._check_exact_with_expiry(fingerprint, row_number, self._get_timestamp(row))
+        else:
+            is_duplicate = self._check_bloom(fingerprint, row_number, self._get_timestamp(row))
+        if is_duplicate:
+            self.num_duplicates += 1
+        return is_duplicate
+
+    def _check_exact_with_expiry(self, fingerprint: bytes, row_number: int, timestamp: float, /) -> bool:
+        last_seen = self._last_seen
+        while last_seen:
+            oldest_fingerprint, (oldest_row_number, oldest_timestamp) = next(iter(last_seen.items()))
+            is_expired = self._is_expired(
+                oldest_row_number,
+                oldest_timestamp,
+                current_row_number=row_number,
+                current_timestamp=timestamp,
+            )
+            if not is_expired:
+                break
+            last_seen.popitem(last=False)
+        is_duplicate = fingerprint in last_seen
+        last_seen[fingerprint] = (row_number, timestamp)
+        last_seen.move_to_end(fingerprint)
+        return is_duplicate
+
+    def _count_elapsed_generations(self, row_number: int, timestamp: float, /) -> int:
+        """Returns the number of generations (of half a window each) elapsed since the current generation started"""
+        start_row_number, start_timestamp = self._generation_start
+        num_elapsed = 0
+        if self.window is not None:
+            num_elapsed = max(num_elapsed, (row_number - start_row_number) // max(1, self.window // 2))
+        if self.ttl is not None:
+            num_elapsed = max(num_elapsed, math.floor((timestamp - start_timestamp) / (self.ttl / 2)))
+        return num_elapsed
+
+    def _check_bloom(self, fingerprint: bytes, row_number: int, timestamp: float, /) -> bool:
+        if self._has_expiry:
+            if row_number == 0:
+                self._generation_start = (row_number, timestamp)
+            num_elapsed = self._count_elapsed_generations(row_number, timestamp)
+            if num_elapsed == 1:
+                self._generations = [self._generations[-1], self._make_bloom_filter()]
+            elif num_elapsed > 1:  # even the current generation is older than the window
+                self._generations = [self._make_bloom_filter()]
+            if num_elapsed:
+                self._generation_start = (row_number, timestamp)
+        current_generation = self._generations[-1]
+        is_duplicate = any(fingerprint in generation for generation in self._generations[:-1])
+        # Adding to the current generation (even if seen in an older one) keeps the row alive for the next rotation
+        return current_generation.add(fingerprint) or is_duplicate
+
+    @property
+    def num_fingerprints(self) -> int:
+        """Number of fingerprints currently kept (approximate for `mode='bloom'`)"""
+        if self.mode == "bloom":
+            return sum(len(generation) for generation in self._generations)
+        return len(self._last_seen) if self._has_expiry else len(self._seen)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {
+            "mode": self.mode,
+            "num_rows_seen": self.num_rows_seen,
+            "num_duplicates": self.num_duplicates,
+            "num_fingerprints": self.num_fingerprints,
+        }
+        if self.mode == "bloom":
+            stats["num_bytes_of_bloom_filters"] = sum(generation.num_bytes for generation in self._generations)
+        return stats
+
+    def filter(self, rows: Iterable[Mapping[str, Any]], /) -> Iterator[Mapping[str, Any]]:
+        """Yields the rows that are not duplicates (lazily, so the stream is never held in memory)"""
+        is_duplicate = self.is_duplicate
+        for row in rows:
+            if not is_duplicate(row):
+                yield row
+
+
+def deduplicate_stream(
+        rows: Iterable[Mapping[str, Any]],
+        /,
+        *,
+        subset: Optional[List[str]] = None,
+        mode: Literal["exact", "bloom"] = "exact",
+        error_rate: Optional[float] = 0.001,
+        window: Optional[int] = None,
+        ttl: Optional[float] = None,
+        get_timestamp: Optional[Callable[[Mapping[str, Any]], float]] = None,
+    ) -> Iterator[Mapping[str, Any]]:
+    """
+    Yields the rows (from an iterable of rows of any length) that are not duplicates, keeping the first occurrence of
+    each row. Refer `StreamDeduplicator` for the parameters.
+    """
+    deduplicator = StreamDeduplicator(
+        subset=subset,
+        mode=mode,
+        error_rate=error_rate,
+        window=window,
+        ttl=ttl,
+        get_timestamp=get_timestamp,
+    )
+    return deduplicator.filter(rows)
@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class _Missing:
+    """Type of `MISSING`"""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()  # Value of a field (in the changes of a row) that is not found in the row
+
+
+@dataclass
+class RowChange:
+    """
+    Row whose key is found in both datasets, but whose compared values are different.
+
+    Attributes:
+        - key (Any): Value of the key field (or tuple of values of the key fields).
+        - old_row (dict): The row from the old dataset.
+        - new_row (dict): The row from the new dataset.
+        - changes (dict): Dictionary having keys = fields whose values are different, and values = tuple of
+        (old value, new value). A field that is not found in one of the rows has the value `MISSING`.
+    """
+
+    key: Any
+    old_row: Mapping[str, Any]
+    new_row: Mapping[str, Any]
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+@dataclass
+class DatasetDiff:
+    """
+    Differences between an old and a new dataset, matched by key (refer `Dataset.diff()`). The rows are not copied.
+
+    Attributes:
+        - added (list): Rows of the new dataset whose key is not found in the old dataset (in the order of the new dataset).
+        - removed (list): Rows of the old dataset whose key is not found in the new dataset (in the order of the old dataset).
+        - changed (List[RowChange]): Rows found in both datasets, whose compared values are different (in the order of the
+        old dataset).
+        - num_unchanged (int): Number of rows found in both datasets, whose compared values are the same.
+    """
+
+    added: List[Mapping[str, Any]] = field(default_factory=list)
+    removed: List[Mapping[str, Any]] = field(default_factory=list)
+    changed: List[RowChange] = field(default_factory=list)
+    num_unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _index_by_key(rows: Sequence[Mapping[str, Any]], /, *, get_key: itemgetter, name: str) -> Dict[Any, Mapping[str, Any]]:
+    keys = list(map(get_key, rows))
+    row_by_key = dict(zip(keys, rows))
+    if len(row_by_key) != len(rows):
+        seen = set()
+        for position, key in enumerate(keys):
+            if key in seen:
+                raise ValueError(f"Key {key!r} is found more than once in the {name} rows (at row number {position + 1})")
+            seen.add(key)
+    return row_by_key
+
+
+def get_field_changes(
+        old_row: Mapping[str, Any],
+        new_row: Mapping[str, Any],
+        /,
+        *,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Returns dictionary having keys = fields whose values are different, and values = tuple of (old value, new value).
+    Compares the given `fields`, or all the fields found in either row.
+    """
+    if fields is None:
+        fields = list(old_row)
+        fields.extend(field_ for field_ in new_row if field_ not in old_row)
+    changes = {}
+    for field_ in fields:
+        old_value = old_row.get(field_, MISSING)
+        new_value = new_row.get(field_, MISSING)
+        if old_value is MISSING or new_value is MISSING or old_value != new_value:
+            changes[field_] = (old_value, new_value)
+    return changes
+
+
+def diff_rows(
+        old_rows: Sequence[Mapping[str, Any]],
+        new_rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        key: List[str],
+        compare: Optional[List[str]] = None,
+    ) -> DatasetDiff:
+    """
+    Matches the rows by the values of the `key` fields (which must be unique within each list of rows), and compares
+    the values of the `compare` fields (or the entire rows) of the matched rows. Takes linear time.
+    Refer `slupy.data_wrangler.dataset.Dataset.diff()`.
+    """
+    get_key = itemgetter(*key)
+    old_row_by_key = _index_by_key(old_rows, get_key=get_key, name="old")
+    new_row_by_key = _index_by_key(new_rows, get_key=get_key, name="new")
+    # The compared values of a row act as its fingerprint, so an unchanged row costs one (C-level) comparison
+    get_fingerprint = itemgetter(*compare) if compare else None
+    result = DatasetDiff()
+    for row_key, old_row in old_row_by_key.items():
+        new_row = new_row_by_key.pop(row_key, None)
+        if new_row is None:
+            result.removed.append(old_row)
+        elif (get_fingerprint(old_row) == get_fingerprint(new_row)) if get_fingerprint else (old_row == new_row):
+            result.num_unchanged += 1
+        else:
+            changes = get_field_changes(old_row, new_row, fields=compare)
+            result.changed.append(RowChange(key=row_key, old_row=old_row, new_row=new_row, changes=changes))
+    result.added.extend(new_row_by_key.values())  # Remaining rows, in the order of the new rows
+    return result
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+_SIMPLE_LITERAL_TYPES = (bool, int, float, str, bytes, type(None))
+
+
+class Expression:
+    """
+    Base class of the expressions that can be given to `Dataset.filter_rows()` and `Dataset.compute_field()`
+    instead of a function. Build them via `col()` and `lit()` along with the usual Python operators.
+
+    Since `&`, `|` and `~` bind tighter than comparisons in Python, the comparisons must be wrapped in parentheses.
+
+    Example:
+    ```
+    from slupy.data_wrangler.expressions import col
+
+    dataset.filter_rows(func=(col("amount") > 100) & col("status").isin({"paid", "refunded"}))
+    dataset.compute_field(field="total", func=col("amount") + col("tax"))
+    ```
+
+    Each expression is compiled (once) into a single Python code object that loops over all the rows, so there is no
+    function call per row.
+    """
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self) -> None:
+        self._compiled: Dict[str, Callable] = {}
+
+    def __bool__(self) -> bool:
+        raise TypeError(
+            "An expression has no truth value. Use `&`, `|` and `~` (instead of `and`, `or` and `not`),"
+            " and wrap the comparisons in parentheses."
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_source()})"
+
+    # Comparisons
+    def __eq__(self, other: Any) -> Expression:  # type: ignore[override]
+        return Compare("==", self, _as_expression(other))
+
+    def __ne__(self, other: Any) -> Expression:  # type: ignore[override]
+        return Compare("!=", self, _as_expression(other))
+
+    def __lt__(self, other: Any) -> Expression:
+        return Compare("<", self, _as_expression(other))
+
+    def __le__(self, other: Any) -> Expression:
+        return Compare("<=", self, _as_expression(other))
+
+    def __gt__(self, other: Any) -> Expression:
+        return Compare(">", self, _as_expression(other))
+
+    def __ge__(self, other: Any) -> Expression:
+        return Compare(">=", self, _as_expression(other))
+
+    __hash__ = None
+
+    # Arithmetic
+    def __add__(self, other: Any) -> Expression:
+        return BinaryOperation("+", self, _as_expression(other))
+
+    def __radd__(self, other: Any) -> Expression:
+        return BinaryOperation("+", _as_expression(other), self)
+
+    def __sub__(self, other: Any) -> Expression:
+        return BinaryOperation("-", self, _as_expression(other))
+
+    def __rsub__(self, other: Any) -> Expression:
+        return BinaryOperation("-", _as_expression(other), self)
+
+    def __mul__(self, other: Any) -> Expression:
+        return BinaryOperation("*", self, _as_expression(other))
+
+    def __rmul__(self, other: Any) -> Expression:
+        return BinaryOperation("*", _as_expression(other), self)
+
+    def __truediv__(self, other: Any) -> Expression:
+        return BinaryOperation("/", self, _as_expression(other))
+
+    def __rtruediv__(self, other: Any) -> Expression:
+        return BinaryOperation("/", _as_expression(other), self)
+
+    def __floordiv__(self, other: Any) -> Expression:
+        return BinaryOperation("//", self, _as_expression(other))
+
+    def __rfloordiv__(self, other: Any) -> Expression:
+        return BinaryOperation("//", _as_expression(other), self)
+
+    def __mod__(self, other: Any) -> Expression:
+        return BinaryOperation("%", self, _as_expression(other))
+
+    def __rmod__(self, other: Any) -> Expression:
+        return BinaryOperation("%", _as_expression(other), self)
+
+    def __pow__(self, other: Any) -> Expression:
+        return BinaryOperation("**", self, _as_expression(other))
+
+    def __rpow__(self, other: Any) -> Expression:
+        return BinaryOperation("**", _as_expression(other), self)
+
+    def __neg__(self) -> Expression:
+        return UnaryOperation("-", self)
+
+    # Boolean logic
+    def __and__(self, other: Any) -> Expression:
+        return BooleanOperation("and", self, _as_expression(other))
+
+    def __rand__(self, other: Any) -> Expression:
+        return BooleanOperation("and", _as_expression(other), self)
+
+    def __or__(self, other: Any) -> Expression:
+        return BooleanOperation("or", self, _as_expression(other))
+
+    def __ror__(self, other: Any) -> Expression:
+        return BooleanOperation("or", _as_expression(other), self)
+
+    def __invert__(self) -> Expression:
+        return UnaryOperation("not", self)
+
+    # Other predicates
+    def isin(self, values: Iterable[Any], /) -> Expression:
+        """Checks if the value is one of the given `values`"""
+        return IsIn(self, values)
+
+    def is_null(self) -> Expression:
+        """Checks if the value is `None`"""
+        return IsNull(self, negate=False)
+
+    def is_not_null(self) -> Expression:
+        """Checks if the value is not `None`"""
+        return IsNull(self, negate=True)
+
+    @property
+    def children(self) -> Tuple[Expression, ...]:
+        return ()
+
+    def get_fields(self) -> Set[str]:
+        """Returns the set of fields that are used by the expression"""
+        fields = set()
+        stack: List[Expression] = [self]
+        while stack:
+            expression = stack.pop()
+            if isinstance(expression, Column):
+                fields.add(expression.field)
+            stack.extend(expression.children)
+        return fields
+
+    def get_conjuncts(self) -> List[Expression]:
+        """Splits the expression into the list of expressions that are combined via `&` (at the top level)"""
+        if isinstance(self, BooleanOperation) and self.operator == "and":
+            return self.left.get_conjuncts() + self.right.get_conjuncts()
+        return [self]
+
+    def to_source(self, constants: Optional[List[Any]] = None, /) -> str:
+        """
+        Returns the Python source of the expression, where each row is referred to as `row`.
+        Values that cannot be written as literals are appended to `constants`, and are referred to as `_c<index>`.
+        """
+        return self._to_source([] if constants is None else constants)
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        raise NotImplementedError()
+
+    def compile(self) -> Callable[[Dict[str, Any]], Any]:
+        """Returns a function that takes in a row, and returns the value of the expression for said row"""
+        return self._compile(
+            name="row_function",
+            template="def {name}(row{constants}):\n    return {source}\n",
+        )
+
+    def compile_filter(self) -> Callable[[Iterable[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Returns a function that takes in an iterable of rows, and returns the list of rows for which the expression is truthy"""
+        return self._compile(
+            name="filter_function",
+            template="def {name}(rows{constants}):\n    return [row for row in rows if {source}]\n",
+        )
+
+    def compile_values(self) -> Callable[[Iterable[Dict[str, Any]]], List[Any]]:
+        """Returns a function that takes in an iterable of rows, and returns the list of values of the expression"""
+        return self._compile(
+            name="values_function",
+            template="def {name}(rows{constants}):\n    return [{source} for row in rows]\n",
+        )
+
+    def compile_assignment(self) -> Callable[[Iterable[Dict[str, Any]], str], None]:
+        """Returns a function that takes in an iterable of rows and a field, and sets said field of each row to the value of the expression"""
+        return self._compile(
+            name="assignment_function",
+            template="def {name}(rows, field{constants}):\n    for row in rows:\n        row[field] = {source}\n",
+        )
+
+    def _compile(self, *, name: str, template: str) -> Callable:
+        func = self._compiled.get(name)
+        if func is None:
+            constants: List[Any] = []
+            source_of_expression = self.to_source(constants)
+            # The constants are bound as default arguments, since local variables are faster to look up than globals
+            source = template.format(
+                name=name,
+                source=source_of_expression,
+                constants="".join(f", _c{idx}=_c{idx}" for idx in range(len(constants))),
+            )
+            namespace: Dict[str, Any] = {"__builtins__": {}}
+            namespace.update({f"_c{idx}": constant for idx, constant in enumerate(constants)})
+            exec(compile(source, filename="<slupy expression>", mode="exec"), namespace)
+            func = namespace[name]
+            self._compiled[name] = func
+        return func
+
+
+class Column(Expression):
+    """Value of a field of the row"""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str, /) -> None:
+        super().__init__()
+        assert isinstance(field, str), "Param `field` must be of type 'str'"
+        self.field = field
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        return f"row[{self.field!r}]"
+
+
+class Literal(Expression):
+    """Constant value"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any, /) -> None:
+        super().__init__()
+        self.value = value
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        value = self.value
+        # The `repr()` of NaN and infinities (eg: `inf`) is not a valid literal, so such floats are bound as constants
+        if type(value) in _SIMPLE_LITERAL_TYPES and (type(value) is not float or math.isfinite(value)):
+            return repr(value)
+        constants.append(value)
+        return f"_c{len(constants) - 1}"
+
+
+class _BinaryExpression(Expression):
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, operator: str, left: Expression, right: Expression, /) -> None:
+        super().__init__()
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    @property
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.left, self.right)
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        return f"({self.left._to_source(constants)} {self.operator} {self.right._to_source(constants)})"
+
+
+class Compare(_BinaryExpression):
+    """Comparison of 2 values (`==`, `!=`, `<`, `<=`, `>`, `>=`)"""
+
+    __slots__ = ()
+
+
+class BinaryOperation(_BinaryExpression):
+    """Arithmetic operation on 2 values (`+`, `-`, `*`, `/`, `//`, `%`, `**`)"""
+
+    __slots__ = ()
+
+
+class BooleanOperation(_BinaryExpression):
+    """Logical operation on 2 values (`&` is compiled to `and`, `|` is compiled to `or`)"""
+
+    __slots__ = ()
+
+
+class UnaryOperation(Expression):
+    """Negation (`-`) or logical inversion (`~` is compiled to `not`) of a value"""
+
+    __slots__ = ("operator", "operand")
+
+    def __init__(self, operator: str, operand: Expression, /) -> None:
+        super().__init__()
+        self.operator = operator
+        self.operand = operand
+
+    @property
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.operand,)
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        return f"({self.operator} {self.operand._to_source(constants)})"
+
+
+class IsIn(Expression):
+    """Membership check of a value in a collection of values"""
+
+    __slots__ = ("operand", "values")
+
+    def __init__(self, operand: Expression, values: Iterable[Any], /) -> None:
+        super().__init__()
+        self.operand = operand
+        values = tuple(values)
+        try:
+            self.values = frozenset(values)
+        except TypeError:  # unhashable values
+            self.values = values
+
+    @property
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.operand,)
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        constants.append(self.values)
+        return f"({self.operand._to_source(constants)} in _c{len(constants) - 1})"
+
+
+class IsNull(Expression):
+    """Check of a value being `None` (or not being `None`)"""
+
+    __slots__ = ("operand", "negate")
+
+    def __init__(self, operand: Expression, /, *, negate: bool) -> None:
+        super().__init__()
+        self.operand = operand
+        self.negate = negate
+
+    @property
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.operand,)
+
+    def _to_source(self, constants: List[Any], /) -> str:
+        operator = "is not" if self.negate else "is"
+        return f"({self.operand._to_source(constants)} {operator} None)"
+
+
+def _as_expression(obj: Any, /) -> Expression:
+    return obj if isinstance(obj, Expression) else Literal(obj)
+
+
+def col(field: str, /) -> Column:
+    """Returns an expression that refers to the value of the given field of each row"""
+    return Column(field)
+
+
+def lit(value: Any, /) -> Literal:
+    """Returns an expression that refers to the given constant value"""
+    return Literal(value)
+
+
+def compile_assignments(
+        funcs: Dict[str, Union[Callable[[Dict[str, Any]], Any], Expression]],
+        /,
+    ) -> Callable[[Iterable[Dict[str, Any]]], None]:
+    """
+    Returns a function that takes in an iterable of rows, and sets the given fields of each row (in the order of `funcs`)
+    to the values of their functions/expressions, in a single pass over the rows. Since the fields are set one after the
+    other, each function/expression can use the fields set before it.
+    The expressions are inlined into the loop, and the functions are called once per row.
+    """
+    constants: List[Any] = []
+    lines = []
+    for field, func in funcs.items():
+        if isinstance(func, Expression):
+            source_of_value = func.to_source(constants)
+        else:
+            constants.append(func)
+            source_of_value = f"_c{len(constants) - 1}(row)"
+        lines.append(f"        row[{field!r}] = {source_of_value}\n")
+    source = (
+        f"def assignments_function(rows{''.join(f', _c{idx}=_c{idx}' for idx in range(len(constants)))}):\n"
+        "    for row in rows:\n"
+        f"{''.join(lines)}"
+    )
+    namespace: Dict[str, Any] = {"__builtins__": {}}
+    namespace.update({f"_c{idx}": constant for idx, constant in enumerate(constants)})
+    exec(compile(source, filename="<slupy expression>", mode="exec"), namespace)
+    return namespace["assignments_function"]
+
+
+def get_string_lookup(expression: Expression, /) -> Optional[Tuple[str, Set[str], bool]]:
+    """
+    If the given expression checks whether a field is (or is not) equal to / one of some strings, returns a tuple of
+    `(field, strings, negate)`. Otherwise returns `None`.
+    Used by the `Dataset` to answer such expressions via the codes of fields encoded as categoricals.
+    """
+    if isinstance(expression, Compare) and expression.operator in ("==", "!="):
+        left, right = expression.left, expression.right
+        if isinstance(right, Column) and isinstance(left, Literal):
+            left, right = right, left
+        if isinstance(left, Column) and isinstance(right, Literal) and type(right.value) is str:
+            return (left.field, {right.value}, expression.operator == "!=")
+    if isinstance(expression, IsIn) and isinstance(expression.operand, Column):
+        if isinstance(expression.values, frozenset) and all(type(value) is str for value in expression.values):
+            return (expression.operand.field, set(expression.values), False)
+    return None
@@ -0,0 +1,176 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+Path = Tuple[str, ...]
+RowFunction = Callable[[Mapping[str, Any]], Optional[Dict[str, Any]]]
+
+# Rows having more distinct shapes than this are flattened without compiling a plan for each new shape
+_MAX_PLANS = 64
+
+
+def _is_flattenable(value: Any, /) -> bool:
+    # Empty dictionaries (and dictionaries having non-string keys) are kept as values, so that no information is lost
+    return type(value) is dict and bool(value) and all(type(key) is str for key in value)
+
+
+def _discover_flattened_row(
+        row: Mapping[str, Any],
+        /,
+        *,
+        sep: str,
+        max_depth: Optional[int],
+    ) -> Tuple[Dict[str, Any], List[Tuple[Path, Path]], List[Tuple[str, Path, bool]]]:
+    """
+    Flattens the given row via an explicit stack (without recursion). Returns tuple of (flattened row, nested
+    dictionaries as tuples of (path, keys), leaves as tuples of (flattened key, path, whether the value is a dictionary)),
+    where the paths are relative to the row.
+    """
+    flattened_row: Dict[str, Any] = {}
+    nested: List[Tuple[Path, Path]] = []
+    leaves: List[Tuple[str, Path, bool]] = []
+    # Items are pushed in reverse, so that they're popped in the order of the keys (and the nested keys of a dictionary
+    # take its place among the keys of its parent)
+    # The items are listed first, as the items of compact records (refer `slupy.data_wrangler.records.Record`) are not reversible
+    stack: List[Tuple[str, Any, Path]] = [(key, value, (key,)) for key, value in reversed(list(row.items()))]
+    while stack:
+        flattened_key, value, path = stack.pop()
+        if (max_depth is None or len(path) <= max_depth) and _is_flattenable(value):
+            nested.append((path, tuple(value)))
+            stack.extend(
+                (f"{flattened_key}{sep}{key}", item, path + (key,)) for key, item in reversed(value.items())
+            )
+            continue
+        if flattened_key in flattened_row:
+            raise ValueError(f"Key '{flattened_key}' is found more than once after flattening")
+        flattened_row[flattened_key] = value
+        leaves.append((flattened_key, path, type(value) is dict))
+    return flattened_row, nested, leaves
+
+
+def _compile_flattener(
+        nested: List[Tuple[Path, Path]],
+        leaves: List[Tuple[str, Path, bool]],
+        /,
+        *,
+        max_depth: Optional[int],
+    ) -> RowFunction:
+    """
+    Returns a function that flattens a row of the given shape (with the top-level keys in the same order), or returns
+    `None` if the row has another shape. The function is straight-line code (compiled once per shape).
+    """
+    variable_by_path: Dict[Path, str] = {(): "row"}
+    lines = ["def flatten_row(row):"]
+    for idx, (path, keys) in enumerate(nested):
+        variable = f"_n{idx}"
+        variable_by_path[path] = variable
+        lines.append(f"    {variable} = {variable_by_path[path[:-1]]}[{path[-1]!r}]")
+        lines.append(f"    if type({variable}) is not dict or tuple({variable}) != {keys!r}:")
+        lines.append("        return None")
+    leaf_variables = []
+    for idx, (_, path, _) in enumerate(leaves):
+        leaf_variables.append(f"_v{idx}")
+        lines.append(f"    _v{idx} = {variable_by_path[path[:-1]]}[{path[-1]!r}]")
+    # Leaves within `max_depth` must not be dictionaries that are flattened, for the row to have the same shape
+    checked_variables, checked_dict_variables = [], []
+    for variable, (_, path, is_dict) in zip(leaf_variables, leaves):
+        if max_depth is None or len(path) <= max_depth:
+            (checked_dict_variables if is_dict else checked_variables).append(variable)
+    if checked_variables:
+        lines.append(f"    if dict in ({''.join(f'type({variable}), ' for variable in checked_variables)}):")
+        lines.append("        return None")
+    for variable in checked_dict_variables:
+        lines.append(f"    if _is_flattenable({variable}):")
+        lines.append("        return None")
+    items = ", ".join(f"{key!r}: {variable}" for (key, _, _), variable in zip(leaves, leaf_variables))
+    lines.append(f"    return {{{items}}}")
+    namespace: Dict[str, Any] = {"_is_flattenable": _is_flattenable}
+    exec(compile("\n".join(lines) + "\n", filename="<slupy flattening>", mode="exec"), namespace)
+    return namespace["flatten_row"]
+
+
+def flatten_rows(
+        rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        sep: Optional[str] = ".",
+        max_depth: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+    """
+    Returns new rows, where the nested dictionaries of each row are flattened into keys joined by `sep` (eg:
+    `{"a": {"b": 1}}` becomes `{"a.b": 1}`), up to `max_depth` levels of nesting (by default, all the levels).
+    Empty dictionaries (and dictionaries having non-string keys) are kept as values. The values are not copied.
+
+    The rows are flattened in a single pass, without recursion. The shape of the first row having new top-level keys is
+    compiled into a plan, so that the rows having the same shape skip the discovery of their nested keys.
+    Raises `ValueError` if flattening results in duplicate keys (eg: `{"a.b": 1, "a": {"b": 2}}`).
+    """
+    plans: Dict[Path, List[RowFunction]] = {}
+    num_plans = 0
+    flattened_rows: List[Dict[str, Any]] = []
+    append = flattened_rows.append
+    for row in rows:
+        keys = tuple(row)
+        plans_of_keys = plans.get(keys)
+        if plans_of_keys is not None:
+            for plan in plans_of_keys:
+                flattened_row = plan(row)
+                if flattened_row is not None:
+                    break
+            if flattened_row is not None:
+                append(flattened_row)
+                continue
+        flattened_row, nested, leaves = _discover_flattened_row(row, sep=sep, max_depth=max_depth)
+        append(flattened_row)
+        if num_plans < _MAX_PLANS:
+            plans.setdefault(keys, []).insert(0, _compile_flattener(nested, leaves, max_depth=max_depth))
+            num_plans += 1
+    return flattened_rows
+
+
+def _compile_unflattener(keys: Path, /, *, sep: str, max_depth: Optional[int]) -> RowFunction:
+    """Returns a function that unflattens a row having the given keys (compiled once per tuple of keys)"""
+    variable_by_path: Dict[Path, str] = {(): "_n0"}
+    leaf_paths = set()
+    lines = ["def unflatten_row(row):", "    _n0 = {}"]
+    for key in keys:
+        path = tuple(key.split(sep, -1 if max_depth is None else max_depth)) if type(key) is str else (key,)
+        if path in variable_by_path or any(path[:idx] in leaf_paths for idx in range(1, len(path))):
+            raise ValueError(f"Key '{key}' clashes with another key after unflattening")
+        for idx in range(1, len(path)):
+            prefix = path[:idx]
+            if prefix not in variable_by_path:
+                variable = f"_n{len(variable_by_path)}"
+                variable_by_path[prefix] = variable
+                lines.append(f"    {variable} = {variable_by_path[prefix[:-1]]}[{prefix[-1]!r}] = {{}}")
+        leaf_paths.add(path)
+        lines.append(f"    {variable_by_path[path[:-1]]}[{path[-1]!r}] = row[{key!r}]")
+    lines.append("    return _n0")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines) + "\n", filename="<slupy unflattening>", mode="exec"), namespace)
+    return namespace["unflatten_row"]
+
+
+def unflatten_rows(
+        rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        sep: Optional[str] = ".",
+        max_depth: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+    """
+    Returns new rows, where the keys of each row that contain `sep` are split into nested dictionaries (eg:
+    `{"a.b": 1}` becomes `{"a": {"b": 1}}`), splitting each key at most `max_depth` times (by default, at each `sep`).
+    Reverts `flatten_rows()`, if no key of the original rows contains `sep`. The values are not copied.
+
+    Each distinct tuple of keys is compiled (once) into a plan that builds the nested dictionaries.
+    Raises `ValueError` if a key clashes with another key after unflattening (eg: `{"a": 1, "a.b": 2}`).
+    """
+    plans: Dict[Path, RowFunction] = {}
+    unflattened_rows: List[Dict[str, Any]] = []
+    append = unflattened_rows.append
+    for row in rows:
+        keys = tuple(row)
+        plan = plans.get(keys)
+        if plan is None:
+            plan = plans[keys] = _compile_unflattener(keys, sep=sep, max_depth=max_depth)
+        append(plan(row))
+    return unflattened_rows
@@ -0,0 +1,189 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from operator import itemgetter
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+
+from slupy.core.helpers import compute_partitions
+from slupy.data_wrangler.aggregations import Aggregator
+
+AggregationSpec = Tuple[str, str, Aggregator]  # (output field, input field, aggregator)
+PartialStates = Dict[Any, List[Any]]  # Maps group key -> list of states (one per aggregation)
+
+# Inputs of a worker process, set once by `_init_worker()` when the worker is forked (so that the rows are inherited
+# instead of pickled). Each pool has its own workers, so concurrent calls never share these.
+_worker_inputs: Optional[Tuple[Sequence[Mapping[str, Any]], List[str], List[AggregationSpec]]] = None
+
+
+def aggregate_rows(
+        rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        fields: List[str],
+        specs: List[AggregationSpec],
+        indices: Optional[Sequence[int]] = None,
+    ) -> Tuple[PartialStates, Dict[Any, int]]:
+    """
+    Builds the aggregate states of each group (of rows having the same values for the given `fields`) in a single pass.
+    Returns the states by group key, and the position (within `rows`) of the first row of each group.
+    If `indices` are given, only aggregates the rows at said positions (in that order).
+    """
+    get_key = itemgetter(*fields)
+    getters = [(itemgetter(input_field), aggregator.create, aggregator.update) for _, input_field, aggregator in specs]
+    states_by_key: PartialStates = {}
+    first_index_by_key: Dict[Any, int] = {}
+    positions = range(len(rows)) if indices is None else indices
+    for idx in positions:
+        row = rows[idx]
+        key = get_key(row)
+        states = states_by_key.get(key)
+        if states is None:
+            states = states_by_key[key] = [create() for _, create, _ in getters]
+            first_index_by_key[key] = idx
+        for state_idx, (get_value, _, update) in enumerate(getters):
+            states[state_idx] = update(states[state_idx], get_value(row))
+    return states_by_key, first_index_by_key
+
+
+def merge_partial_states(partials: List[PartialStates], /, *, specs: List[AggregationSpec]) -> PartialStates:
+    """
+    Merges the partial states (built over consecutive partitions of the rows, given in the order of the partitions),
+    so that the groups remain in the order of their first row.
+    """
+    merges = [aggregator.merge for _, _, aggregator in specs]
+    merged: PartialStates = {}
+    for partial in partials:
+        for key, states in partial.items():
+            merged_states = merged.get(key)
+            if merged_states is None:
+                merged[key] = states
+            else:
+                merged[key] = [merge(state_1, state_2) for merge, state_1, state_2 in zip(merges, merged_states, states)]
+    return merged
+
+
+def finalize_groups(
+        states_by_key: PartialStates,
+        /,
+        *,
+        fields: List[str],
+        specs: List[AggregationSpec],
+    ) -> List[Dict[str, Any]]:
+    """Returns one row per group, having the values of the group `fields` followed by the aggregated values"""
+    finalizers = [(output_field, aggregator.finalize) for output_field, _, aggregator in specs]
+    is_single_field = len(fields) == 1
+    rows = []
+    for key, states in states_by_key.items():
+        row = dict(zip(fields, (key,) if is_single_field else key))
+        for (output_field, finalize), state in zip(finalizers, states):
+            row[output_field] = finalize(state)
+        rows.append(row)
+    return rows
+
+
+def _init_worker(rows: Sequence[Mapping[str, Any]], fields: List[str], specs: List[AggregationSpec], /) -> None:
+    global _worker_inputs
+    _worker_inputs = (rows, fields, specs)
+
+
+def _aggregate_inherited_partition(start: int, end: int, /) -> PartialStates:
+    rows, fields, specs = _worker_inputs
+    return aggregate_rows(rows, fields=fields, specs=specs, indices=range(start, end))[0]
+
+
+def _aggregate_inherited_bucket(bucket: int, num_buckets: int, /) -> Tuple[PartialStates, Dict[Any, int]]:
+    # Each worker finds the rows of its own bucket (string hashes are the same in forked processes), so that the
+    # partitioning is done in parallel
+    rows, fields, specs = _worker_inputs
+    get_key = itemgetter(*fields)
+    indices = [idx for idx, row in enumerate(rows) if hash(get_key(row)) % num_buckets == bucket]
+    return aggregate_rows(rows, fields=fields, specs=specs, indices=indices)
+
+
+def _aggregate_partition(
+        rows: List[Mapping[str, Any]],
+        fields: List[str],
+        specs: List[AggregationSpec],
+        /,
+    ) -> PartialStates:
+    return aggregate_rows(rows, fields=fields, specs=specs)[0]
+
+
+def _aggregate_bucket(
+        bucket_rows: List[Mapping[str, Any]],
+        indices: List[int],
+        fields: List[str],
+        specs: List[AggregationSpec],
+        /,
+    ) -> Tuple[PartialStates, Dict[Any, int]]:
+    states_by_key, first_index_by_key = aggregate_rows(bucket_rows, fields=fields, specs=specs)
+    return states_by_key, {key: indices[position] for key, position in first_index_by_key.items()}
+
+
+def _get_fork_context() -> Optional[multiprocessing.context.BaseContext]:
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def group_rows(
+        rows: List[Mapping[str, Any]],
+        /,
+        *,
+        fields: List[str],
+        specs: List[AggregationSpec],
+        num_workers: Optional[int] = 1,
+        strategy: Literal["merge", "shuffle"] = "merge",
+        min_rows_per_worker: Optional[int] = 10_000,
+    ) -> List[Dict[str, Any]]:
+    """
+    Groups the rows by the given `fields`, and aggregates each group as per the `specs`.
+    Refer `slupy.data_wrangler.dataset.Dataset.group_by()`.
+    """
+    num_workers = min(num_workers, len(rows) // min_rows_per_worker) if rows else 1
+    if num_workers <= 1:
+        return finalize_groups(aggregate_rows(rows, fields=fields, specs=specs)[0], fields=fields, specs=specs)
+
+    fork_context = _get_fork_context()
+    if fork_context is not None:
+        # The inputs are given to the workers when they're forked (never pickled, nor stored in this process)
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=fork_context,
+            initializer=_init_worker,
+            initargs=(rows, fields, specs),
+        )
+    else:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+    with executor:
+        if strategy == "merge":
+            partitions = compute_partitions(length=len(rows), num_partitions=num_workers)
+            if fork_context is not None:
+                futures = [executor.submit(_aggregate_inherited_partition, start, end + 1) for start, end in partitions]
+            else:
+                futures = [
+                    executor.submit(_aggregate_partition, rows[start : end + 1], fields, specs)
+                    for start, end in partitions
+                ]
+            states_by_key = merge_partial_states([future.result() for future in futures], specs=specs)
+        else:
+            # Each group goes to exactly one worker, so the partial states need no merging (only re-ordering)
+            if fork_context is not None:
+                futures = [executor.submit(_aggregate_inherited_bucket, bucket, num_workers) for bucket in range(num_workers)]
+            else:
+                # Without forking, the rows are partitioned (serially) by this process, as string hashes differ across
+                # processes, and only the rows of each bucket are pickled
+                get_key = itemgetter(*fields)
+                buckets: List[List[int]] = [[] for _ in range(num_workers)]
+                for idx, row in enumerate(rows):
+                    buckets[hash(get_key(row)) % num_workers].append(idx)
+                futures = [
+                    executor.submit(_aggregate_bucket, [rows[idx] for idx in bucket], bucket, fields, specs)
+                    for bucket in buckets
+                ]
+            groups: List[Tuple[int, Any, List[Any]]] = []
+            for future in futures:
+                bucket_states_by_key, first_index_by_key = future.result()
+                groups.extend((first_index_by_key[key], key, states) for key, states in bucket_states_by_key.items())
+            groups.sort(key=itemgetter(0))
+            states_by_key = {key: states for _, key, states in groups}
+    return finalize_groups(states_by_key, fields=fields, specs=specs)
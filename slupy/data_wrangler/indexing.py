@@ -0,0 +1,37 @@
+from operator import itemgetter
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+
+class KeyIndex:
+    """
+    Maps the values of the key fields of each row (a tuple of values, if there are multiple key fields) to the position
+    of the row, so that a row can be found by its key in constant time. The keys must be unique.
+    Refer `slupy.data_wrangler.dataset.Dataset.upsert()`.
+    """
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]], /, *, fields: Tuple[str, ...]) -> None:
+        assert fields, "Param `fields` must be a non-empty tuple of strings"
+        self.fields = fields
+        self.get_key = itemgetter(*fields)
+        self.position_by_key: Dict[Any, int] = {}
+        self.num_rows = 0  # Number of rows indexed (used to detect rows added/removed without the index being updated)
+        self.rebuild(rows)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(fields={self.fields}, num_rows={self.num_rows})"
+
+    def rebuild(self, rows: Sequence[Mapping[str, Any]], /) -> None:
+        """Indexes the given rows (eg: the rows that are kept after a filter), in linear time"""
+        try:
+            keys = list(map(self.get_key, rows))
+        except KeyError as error:
+            raise KeyError(f"Key '{error.args[0]}' from `key` is not found in all the rows")
+        position_by_key = dict(zip(keys, range(len(keys))))
+        if len(position_by_key) != len(keys):
+            seen = set()
+            for position, key in enumerate(keys):
+                if key in seen:
+                    raise ValueError(f"Key {key!r} is found more than once (at row number {position + 1})")
+                seen.add(key)
+        self.position_by_key = position_by_key
+        self.num_rows = len(keys)
@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+import sys
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from slupy.data_wrangler.records import Record
+
+_ATOMIC_TYPES = frozenset([bool, int, float, complex, str, bytes, type(None)])
+_COLLECTION_TYPES = frozenset([list, tuple, set, frozenset])
+
+
+@dataclass
+class MemoryUsage:
+    """
+    Memory used by a dataset (in bytes).
+
+    Attributes:
+        - by_field (dict): Bytes used by the values of each field, plus its key. Objects that are shared (by many rows or
+        fields) are counted only once.
+        - row_containers (int): Bytes used by the row objects themselves (dictionaries or records).
+        - list_container (int): Bytes used by the list having the rows.
+        - is_estimate (bool): Is `True` if the usage has been extrapolated from a sample of the rows.
+    """
+
+    by_field: Dict[str, int] = field(default_factory=dict)
+    row_containers: int = 0
+    list_container: int = 0
+    is_estimate: bool = False
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_field.values()) + self.row_containers + self.list_container
+
+
+def get_deep_size(obj: Any, /, *, seen: Optional[Set[int]] = None) -> int:
+    """
+    Returns the size (in bytes) of the given object along with all the objects it contains (recursing into
+    dictionaries, lists, tuples, sets and records). Objects whose `id` is in `seen` are skipped, and the `id` of each
+    object that is counted is added to `seen`.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        size += sys.getsizeof(obj)
+        type_ = type(obj)
+        if type_ in _ATOMIC_TYPES:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif type_ in _COLLECTION_TYPES or isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif type_ is Record:
+            stack.append(obj._values)
+            stack.extend(obj.schema.fields)
+    return size
+
+
+def _get_row_container_size(row: Mapping[str, Any], /, *, seen: Set[int]) -> int:
+    if type(row) is Record:
+        size = sys.getsizeof(row) + sys.getsizeof(row._values)
+        schema = row.schema
+        if id(schema) not in seen:  # the schema is shared by many records
+            seen.add(id(schema))
+            size += sys.getsizeof(schema) + sys.getsizeof(schema.fields) + sys.getsizeof(schema.positions)
+        return size
+    return sys.getsizeof(row)
+
+
+def compute_memory_usage(
+        rows: List[Mapping[str, Any]],
+        /,
+        *,
+        deep: Optional[bool] = True,
+        sample_size: Optional[int] = None,
+    ) -> MemoryUsage:
+    """
+    Returns the memory usage of the given rows. Refer `slupy.data_wrangler.dataset.Dataset.memory_usage()`.
+    """
+    assert sample_size is None or sample_size >= 1, "Param `sample_size` must be >= 1"
+    rows_to_measure: Iterable[Mapping[str, Any]] = rows
+    scale = 1.0
+    if sample_size is not None and sample_size < len(rows):
+        step = len(rows) / sample_size
+        rows_to_measure = [rows[int(idx * step)] for idx in range(sample_size)]
+        scale = len(rows) / sample_size
+
+    seen: Set[int] = set()
+    by_field: Dict[str, int] = {}
+    # Keyed by the `id` of each value (not using a container per value, as that would trigger the garbage collector)
+    field_by_value_id: Dict[int, str] = {}
+    size_by_value_id: Dict[int, int] = {}
+    ids_of_repeated_values: Set[int] = set()
+    row_containers = 0
+    for row in rows_to_measure:
+        row_containers += _get_row_container_size(row, seen=seen)
+        for key, value in row.items():
+            if id(key) not in seen:
+                seen.add(id(key))
+                by_field[key] = by_field.get(key, 0) + sys.getsizeof(key)
+            value_id = id(value)
+            if value_id in size_by_value_id:
+                ids_of_repeated_values.add(value_id)
+                continue
+            if deep and type(value) not in _ATOMIC_TYPES:
+                size = get_deep_size(value, seen=seen)
+            elif value_id in seen:
+                size = 0
+            else:
+                seen.add(value_id)
+                size = sys.getsizeof(value)
+            field_by_value_id[value_id] = key
+            size_by_value_id[value_id] = size
+
+    # When sampling, the values that occur once in the sample are assumed to be unique to their row (so their size
+    # is extrapolated), whereas the values that occur multiple times are assumed to be shared (so they're counted once)
+    for value_id, size in size_by_value_id.items():
+        key = field_by_value_id[value_id]
+        by_field[key] = by_field.get(key, 0) + (size if value_id in ids_of_repeated_values else round(size * scale))
+    return MemoryUsage(
+        by_field=by_field,
+        row_containers=round(row_containers * scale),
+        list_container=sys.getsizeof(rows),
+        is_estimate=scale != 1.0,
+    )
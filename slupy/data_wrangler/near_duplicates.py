@@ -0,0 +1,246 @@
+from array import array
+from functools import lru_cache
+import random
+import re
+import string
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import zlib
+
+from slupy.core import checks
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PUNCTUATION_TABLE = str.maketrans({char: " " for char in string.punctuation})
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str, /) -> str:
+    """Lower-cases the given text, replaces punctuation by spaces and collapses whitespace"""
+    return _WHITESPACE_PATTERN.sub(" ", text.lower().translate(_PUNCTUATION_TABLE)).strip()
+
+
+def get_shingles(text: str, /, *, size: Optional[int] = 3) -> Set[int]:
+    """
+    Returns the set of hashes (32-bit) of the character shingles (substrings of length `size`) of the given text.
+    Texts that are shorter than `size` have a single shingle (the text itself). Empty texts have no shingles.
+    """
+    assert checks.is_positive_integer(size), "Param `size` must be a positive integer"
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())}
+    return {zlib.crc32(text[idx : idx + size].encode()) for idx in range(len(text) - size + 1)}
+
+
+def compute_jaccard_similarity(set_1: Set[int], set_2: Set[int], /) -> float:
+    """Returns the Jaccard similarity (size of intersection / size of union) of the given sets"""
+    if not set_1 and not set_2:
+        return 1.0
+    num_common = len(set_1 & set_2)
+    return num_common / (len(set_1) + len(set_2) - num_common)
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures of sets of (32-bit) hashes, using `num_perm` random hash functions of the form
+    `(a * x + b) mod p`. The fraction of positions at which the signatures of 2 sets agree is an unbiased estimate
+    of their Jaccard similarity.
+
+    The permuted values of each distinct hash are computed once and cached (shingles repeat a lot across texts), so a
+    signature costs one C-level column-wise `min` over the cached values.
+    """
+
+    __slots__ = ("num_perm", "_permutations", "_permuted_values_by_hash")
+
+    def __init__(self, *, num_perm: Optional[int] = 128, seed: Optional[int] = 0) -> None:
+        assert checks.is_positive_integer(num_perm), "Param `num_perm` must be a positive integer"
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1)) for _ in range(num_perm)
+        ]
+        self._permuted_values_by_hash: Dict[int, array] = {}
+
+    def _get_permuted_values(self, hash_: int, /) -> array:
+        permuted_values = self._permuted_values_by_hash.get(hash_)
+        if permuted_values is None:
+            permuted_values = array("I", [((a * hash_ + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in self._permutations])
+            self._permuted_values_by_hash[hash_] = permuted_values
+        return permuted_values
+
+    def signature(self, hashes: Set[int], /) -> Tuple[int, ...]:
+        """Returns the MinHash signature of the given set of hashes (empty sets get a signature of maximum values)"""
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        if len(hashes) == 1:
+            return tuple(self._get_permuted_values(next(iter(hashes))))
+        return tuple(map(min, zip(*map(self._get_permuted_values, hashes))))
+
+
+def _compute_probability_of_candidate(similarity: float, /, *, bands: int, rows: int) -> float:
+    """Probability of 2 sets having the given Jaccard similarity sharing at least one LSH band"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def _integrate(func: Callable[[float], float], /, *, start: float, end: float, num_steps: Optional[int] = 100) -> float:
+    step = (end - start) / num_steps
+    return sum(func(start + (idx + 0.5) * step) for idx in range(num_steps)) * step
+
+
+@lru_cache(maxsize=128)
+def compute_lsh_params(
+        *,
+        threshold: float,
+        num_perm: int,
+        false_positive_weight: Optional[float] = 0.5,
+        false_negative_weight: Optional[float] = 0.5,
+    ) -> Tuple[int, int]:
+    """
+    Returns `(bands, rows)` such that `bands * rows <= num_perm`, which minimises the weighted sum of the probabilities of
+    false positives (pairs below the `threshold` that become candidates) and false negatives (pairs at/above the
+    `threshold` that never become candidates).
+
+    A higher `false_negative_weight` favours recall (more candidates to verify), and a higher `false_positive_weight`
+    favours speed (fewer candidates to verify).
+    """
+    assert checks.is_number(threshold) and 0 < threshold < 1, "Param `threshold` must be a number in the range (0, 1)"
+    assert checks.is_positive_integer(num_perm), "Param `num_perm` must be a positive integer"
+    best_params = (1, num_perm)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive_rate = _integrate(
+                lambda s: _compute_probability_of_candidate(s, bands=bands, rows=rows),
+                start=0.0,
+                end=threshold,
+            )
+            false_negative_rate = _integrate(
+                lambda s: 1 - _compute_probability_of_candidate(s, bands=bands, rows=rows),
+                start=threshold,
+                end=1.0,
+            )
+            error = false_positive_weight * false_positive_rate + false_negative_weight * false_negative_rate
+            if error < best_error:
+                best_error = error
+                best_params = (bands, rows)
+    return best_params
+
+
+class _DisjointSet:
+    """Union-find over the integers [0, size)"""
+
+    __slots__ = ("parents",)
+
+    def __init__(self, size: int, /) -> None:
+        self.parents = list(range(size))
+
+    def find(self, item: int, /) -> int:
+        parents = self.parents
+        root = item
+        while parents[root] != root:
+            root = parents[root]
+        while parents[item] != root:
+            parents[item], item = root, parents[item]
+        return root
+
+    def union(self, item_1: int, item_2: int, /) -> None:
+        root_1, root_2 = self.find(item_1), self.find(item_2)
+        if root_1 != root_2:
+            self.parents[max(root_1, root_2)] = min(root_1, root_2)
+
+
+def _verify_bucket(
+        members: List[int],
+        /,
+        *,
+        shingles: List[Set[int]],
+        disjoint_set: _DisjointSet,
+        threshold: float,
+    ) -> None:
+    """
+    Verifies the members of an LSH bucket, merging the groups of the members that are near-duplicates.
+    Each member is only compared with one representative per group found in the bucket (and not at all, if its group
+    is already represented), so a bucket of near-identical texts takes linear time instead of quadratic time.
+    """
+    find, union = disjoint_set.find, disjoint_set.union
+    representatives: List[int] = []
+    for member in members:
+        if any(find(representative) == find(member) for representative in representatives):
+            continue
+        is_matched = False
+        for representative in representatives:
+            if find(representative) == find(member):
+                continue  # Merged via an earlier representative
+            if compute_jaccard_similarity(shingles[member], shingles[representative]) >= threshold:
+                union(member, representative)
+                is_matched = True
+        if not is_matched:
+            representatives.append(member)
+
+
+def find_near_duplicate_groups(
+        texts: Iterable[str],
+        /,
+        *,
+        threshold: Optional[float] = 0.8,
+        num_perm: Optional[int] = 128,
+        shingle_size: Optional[int] = 3,
+        normalize: Optional[bool] = True,
+        false_positive_weight: Optional[float] = 0.5,
+        false_negative_weight: Optional[float] = 0.5,
+        seed: Optional[int] = 0,
+    ) -> List[List[int]]:
+    """
+    Returns groups of indices of the given texts that are near-duplicates, ie; the Jaccard similarity of their shingles
+    is >= `threshold` (groups are transitive, so A ~ B and B ~ C puts A, B and C in the same group).
+    Same output format as `slupy.data_wrangler.dataset.Dataset.find_duplicate_indices()`.
+
+    Texts are bucketed via MinHash signatures and LSH banding (refer `compute_lsh_params()`), and the members of each
+    bucket are verified (exactly) against one representative per group, so it runs in near-linear time even when many
+    texts share a bucket. Identical (normalized) texts are hashed once.
+    Pairs that never share a bucket are missed, with a probability that decreases as `num_perm` and
+    `false_negative_weight` increase.
+    """
+    assert checks.is_number(threshold) and 0 < threshold <= 1, "Param `threshold` must be a number in the range (0, 1]"
+    indices_by_text: Dict[str, List[int]] = {}
+    for idx, text in enumerate(texts):
+        key = normalize_text(text) if normalize else text
+        sub_indices = indices_by_text.get(key)
+        if sub_indices is None:
+            indices_by_text[key] = [idx]
+        else:
+            sub_indices.append(idx)
+
+    distinct_texts = list(indices_by_text.keys())
+    disjoint_set = _DisjointSet(len(distinct_texts))
+    if threshold < 1 and len(distinct_texts) > 1:
+        bands, rows = compute_lsh_params(
+            threshold=threshold,
+            num_perm=num_perm,
+            false_positive_weight=false_positive_weight,
+            false_negative_weight=false_negative_weight,
+        )
+        min_hasher = MinHasher(num_perm=num_perm, seed=seed)
+        shingles = [get_shingles(text, size=shingle_size) for text in distinct_texts]
+        buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        for text_idx, shingles_of_text in enumerate(shingles):
+            signature = min_hasher.signature(shingles_of_text)
+            for band_idx, bucket in enumerate(buckets):
+                band = signature[band_idx * rows : (band_idx + 1) * rows]
+                members = bucket.get(band)
+                if members is None:
+                    bucket[band] = [text_idx]
+                else:
+                    members.append(text_idx)
+
+        for bucket in buckets:
+            for members in bucket.values():
+                if len(members) > 1:
+                    _verify_bucket(members, shingles=shingles, disjoint_set=disjoint_set, threshold=threshold)
+
+    indices_by_root: Dict[int, List[int]] = {}
+    for text_idx, sub_indices in enumerate(indices_by_text.values()):
+        indices_by_root.setdefault(disjoint_set.find(text_idx), []).extend(sub_indices)
+    groups = [sorted(sub_indices) for sub_indices in indices_by_root.values() if len(sub_indices) > 1]
+    groups.sort(key=lambda sub_indices: sub_indices[0])
+    return groups
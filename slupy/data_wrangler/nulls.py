@@ -0,0 +1,101 @@
+from typing import Any, Dict, Iterable, List, Mapping
+
+_KEEP_MASK_TABLE = bytes.maketrans(b"01", b"\x01\x00")
+
+
+class NullStats:
+    """
+    Null counts and null bitmaps of the fields of a list of rows.
+    The bitmap of a field is an integer, where bit `i` is set if the value of the field is `None` on row `i`.
+    """
+
+    __slots__ = ("num_rows", "_num_rows_by_field", "_null_indices_by_field", "_bitmaps")
+
+    def __init__(
+            self,
+            *,
+            num_rows: int,
+            num_rows_by_field: Dict[str, int],
+            null_indices_by_field: Dict[str, List[int]],
+        ) -> None:
+        self.num_rows = num_rows
+        self._num_rows_by_field = num_rows_by_field
+        self._null_indices_by_field = null_indices_by_field
+        self._bitmaps: Dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(num_rows={self.num_rows}, null_counts={self.get_null_counts()})"
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields found in any of the rows"""
+        return list(self._num_rows_by_field.keys())
+
+    @property
+    def fields_having_nulls(self) -> List[str]:
+        return list(self._null_indices_by_field.keys())
+
+    def get_null_counts(self) -> Dict[str, int]:
+        """Returns dictionary having keys = fields, and values = number of rows where the field is `None`"""
+        return {field: len(self._null_indices_by_field.get(field, ())) for field in self._num_rows_by_field}
+
+    def get_null_indices(self, field: str, /) -> List[int]:
+        """Returns the (ascending) indices of the rows where the given field is `None`"""
+        return self._null_indices_by_field.get(field, [])
+
+    def is_field_in_all_rows(self, field: str, /) -> bool:
+        return self._num_rows_by_field.get(field, 0) == self.num_rows
+
+    def get_bitmap(self, field: str, /) -> int:
+        """Returns the null bitmap of the given field (built once per field)"""
+        null_indices = self._null_indices_by_field.get(field)
+        if not null_indices:
+            return 0
+        bitmap = self._bitmaps.get(field)
+        if bitmap is None:
+            bits = bytearray((self.num_rows + 7) // 8)
+            for idx in null_indices:
+                bits[idx >> 3] |= 1 << (idx & 7)
+            bitmap = int.from_bytes(bits, "little")
+            self._bitmaps[field] = bitmap
+        return bitmap
+
+    def get_combined_bitmap(self, fields: Iterable[str], /) -> int:
+        """Returns the bitmap of the rows where any of the given fields is `None` (bitwise OR of their bitmaps)"""
+        combined_bitmap = 0
+        for field in fields:
+            combined_bitmap |= self.get_bitmap(field)
+        return combined_bitmap
+
+
+def compute_null_stats(rows: List[Mapping[str, Any]], /) -> NullStats:
+    """Computes the `NullStats` of the given rows in a single pass"""
+    num_rows_by_keys: Dict[tuple, int] = {}
+    null_indices_by_field: Dict[str, List[int]] = {}
+    for idx, row in enumerate(rows):
+        keys = tuple(row)
+        num_rows_by_keys[keys] = num_rows_by_keys.get(keys, 0) + 1
+        if None in row.values():
+            for field, value in row.items():
+                if value is None:
+                    null_indices = null_indices_by_field.get(field)
+                    if null_indices is None:
+                        null_indices_by_field[field] = [idx]
+                    else:
+                        null_indices.append(idx)
+
+    num_rows_by_field: Dict[str, int] = {}
+    for keys, num_rows in num_rows_by_keys.items():
+        for field in keys:
+            num_rows_by_field[field] = num_rows_by_field.get(field, 0) + num_rows
+    return NullStats(
+        num_rows=len(rows),
+        num_rows_by_field=num_rows_by_field,
+        null_indices_by_field=null_indices_by_field,
+    )
+
+
+def bitmap_to_keep_mask(bitmap: int, /, *, num_rows: int) -> bytes:
+    """Returns a mask (usable with `itertools.compress()`) having 1 for the rows whose bit is not set, and 0 otherwise"""
+    bit_string = format(bitmap, f"0{num_rows}b")[::-1] if num_rows else ""
+    return bit_string.encode().translate(_KEEP_MASK_TABLE)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+class Schema:
+    """
+    Ordered collection of fields that is shared by many `Record` objects, so that each record only needs to store
+    its values (and not its own key table).
+    """
+
+    __slots__ = ("fields", "positions", "_children_with_field", "_children_without_field")
+
+    def __init__(self, fields: Tuple[str, ...], /) -> None:
+        assert len(set(fields)) == len(fields), "Param `fields` must not have duplicates"
+        self.fields = tuple(fields)
+        self.positions: Dict[str, int] = {field: idx for idx, field in enumerate(self.fields)}
+        self._children_with_field: Dict[str, Schema] = {}
+        self._children_without_field: Dict[str, Schema] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.fields!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, (self.fields,))
+
+    def with_field(self, field: str, /) -> Schema:
+        """Returns the schema having the given `field` appended. Rows that gain the same field share the same schema."""
+        child = self._children_with_field.get(field)
+        if child is None:
+            child = Schema(self.fields + (field,))
+            self._children_with_field[field] = child
+        return child
+
+    def without_field(self, field: str, /) -> Schema:
+        """Returns the schema having the given `field` removed. Rows that lose the same field share the same schema."""
+        child = self._children_without_field.get(field)
+        if child is None:
+            child = Schema(tuple(f for f in self.fields if f != field))
+            self._children_without_field[field] = child
+        return child
+
+
+class Record(MutableMapping):
+    """
+    Compact row that stores its values as a list against a shared `Schema`.
+    Behaves like a dictionary (supports lookups, iteration, equality and updates), so functions written for
+    dictionary rows keep working.
+    """
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: Schema, values: List[Any], /) -> None:
+        self._schema = schema
+        self._values = values
+
+    @classmethod
+    def from_dict(cls, dict_obj: Dict[str, Any], /, *, schema: Schema) -> Record:
+        """Returns a record having the values of `dict_obj` (which must have exactly the fields of `schema`)"""
+        return cls(schema, [dict_obj[field] for field in schema.fields])
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._schema.positions[key]]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        position = self._schema.positions.get(key)
+        if position is None:
+            self._schema = self._schema.with_field(key)
+            self._values.append(value)
+        else:
+            self._values[position] = value
+
+    def __delitem__(self, key: str) -> None:
+        position = self._schema.positions[key]
+        self._schema = self._schema.without_field(key)
+        del self._values[position]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.fields)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._schema.positions
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record) and other._schema is self._schema:
+            return self._values == other._values
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, (self._schema, self._values))
+
+    def __copy__(self) -> Record:
+        return self.__class__(self._schema, self._values.copy())
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Record:
+        return self.__class__(self._schema, copy.deepcopy(self._values, memo))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = self._schema.positions.get(key)
+        return default if position is None else self._values[position]
+
+    def copy(self) -> Record:
+        """Returns shallow-copy of the record"""
+        return self.__copy__()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a new dictionary having the fields and values of the record"""
+        return dict(zip(self._schema.fields, self._values))
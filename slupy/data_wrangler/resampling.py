@@ -0,0 +1,133 @@
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from slupy.data_wrangler.grouping import AggregationSpec
+from slupy.dates.time_travel import TimeTravel
+
+# Offsets of a fixed width, whose buckets are found by arithmetic (instead of searching the bucket boundaries)
+FIXED_WIDTH_OFFSETS = ("weeks", "days", "hours", "minutes", "seconds", "milliseconds", "microseconds")
+# Offsets whose width depends on the calendar (as per `slupy.dates.time_travel.TimeTravel`)
+CALENDAR_OFFSETS = ("years", "months")
+# Offsets that can be used with date-objects (the other offsets need datetime-objects)
+DATE_OFFSETS = ("years", "months", "weeks", "days")
+
+
+def get_default_origin(value: Union[datetime, date], /, *, offset_name: str) -> Union[datetime, date]:
+    """
+    Returns the given value rounded down to the unit of the given offset (eg: to the start of its hour for 'hours', to
+    the start of its month for 'months', to the Monday of its week for 'weeks').
+    """
+    if offset_name == "years":
+        value = value.replace(month=1, day=1)
+    elif offset_name == "months":
+        value = value.replace(day=1)
+    elif offset_name == "weeks":
+        value -= timedelta(days=value.weekday())
+    if type(value) is date:
+        return value
+    if offset_name in ("years", "months", "weeks", "days"):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if offset_name == "hours":
+        return value.replace(minute=0, second=0, microsecond=0)
+    if offset_name == "minutes":
+        return value.replace(second=0, microsecond=0)
+    if offset_name == "seconds":
+        return value.replace(microsecond=0)
+    if offset_name == "milliseconds":
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value
+
+
+def _compute_boundaries(
+        first: Union[datetime, date],
+        last: Union[datetime, date],
+        /,
+        *,
+        offset_name: str,
+        offset_value: int,
+    ) -> List[Union[datetime, date]]:
+    """
+    Returns the starts of the buckets of a calendar offset, from `first` up to (and including) the bucket of `last`.
+    Each boundary is computed from `first` (instead of from the previous boundary), so that the day of month does not
+    drift (eg: monthly buckets from Jan 31 start on Feb 29, Mar 31, Apr 30 and so on).
+    """
+    boundaries = [first]
+    while True:
+        boundary = TimeTravel(first).add(**{offset_name: offset_value * len(boundaries)}).value
+        if boundary > last:
+            return boundaries
+        boundaries.append(boundary)
+
+
+def resample_rows(
+        rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        time_field: str,
+        offset_kwargs: Dict[str, int],
+        specs: List[AggregationSpec],
+        origin: Optional[Union[datetime, date]] = None,
+        include_empty_buckets: Optional[bool] = False,
+    ) -> List[Dict[str, Any]]:
+    """
+    Assigns the rows to consecutive time buckets (starting at `origin`, each of the width given by `offset_kwargs`), and
+    aggregates each bucket in a single pass over the rows. Returns one row per bucket (in chronological order), having
+    the start of the bucket in the `time_field`, followed by the aggregated values. By default, `origin` is the earliest
+    value rounded down to the unit of the offset (refer `get_default_origin()`).
+    Refer `slupy.data_wrangler.dataset.Dataset.resample()`.
+
+    Fixed-width offsets (eg: hours) find the bucket of a value by arithmetic. Calendar offsets (eg: months) precompute
+    the bucket boundaries via `slupy.dates.time_travel.TimeTravel`, and find the bucket of a value by binary search.
+    """
+    (offset_name, offset_value), = offset_kwargs.items()
+    times = list(map(itemgetter(time_field), rows))
+    present_times = [value for value in times if value is not None]
+    if not present_times:
+        return []
+    types = set(map(type, present_times))
+    assert types == {date} or types == {datetime}, (
+        f"Values of the field '{time_field}' must be either all of type 'date' or all of type 'datetime'"
+    )
+    type_ = types.pop()
+    assert origin is None or type(origin) is type_, f"Param `origin` must be of type '{type_.__name__}', like the values"
+    assert type_ is datetime or offset_name in DATE_OFFSETS, (
+        f"Param `offset_kwargs` must use one of {list(DATE_OFFSETS)} for date-objects"
+    )
+    first = get_default_origin(min(present_times), offset_name=offset_name) if origin is None else origin
+    last = max(present_times)
+    if offset_name in FIXED_WIDTH_OFFSETS:
+        width = timedelta(**offset_kwargs)
+        boundaries = None
+    else:
+        # Starts of the buckets, where bucket `idx` spans [boundaries[idx], boundaries[idx + 1])
+        boundaries = _compute_boundaries(first, last, offset_name=offset_name, offset_value=offset_value)
+
+    getters = [(itemgetter(input_field), aggregator.create, aggregator.update) for _, input_field, aggregator in specs]
+    states_by_bucket: Dict[int, List[Any]] = {}
+    for value, row in zip(times, rows):
+        if value is None or value < first:
+            continue
+        bucket = (value - first) // width if boundaries is None else bisect_right(boundaries, value) - 1
+        states = states_by_bucket.get(bucket)
+        if states is None:
+            states = states_by_bucket[bucket] = [create() for _, create, _ in getters]
+        for state_idx, (get_value, _, update) in enumerate(getters):
+            states[state_idx] = update(states[state_idx], get_value(row))
+
+    if not states_by_bucket:
+        return []
+    finalizers = [(output_field, aggregator.create, aggregator.finalize) for output_field, _, aggregator in specs]
+    if include_empty_buckets:
+        buckets = range(min(states_by_bucket), max(states_by_bucket) + 1)
+    else:
+        buckets = sorted(states_by_bucket)
+    resampled_rows = []
+    for bucket in buckets:
+        states = states_by_bucket.get(bucket)
+        row = {time_field: first + bucket * width if boundaries is None else boundaries[bucket]}
+        for state_idx, (output_field, create, finalize) in enumerate(finalizers):
+            row[output_field] = finalize(create() if states is None else states[state_idx])
+        resampled_rows.append(row)
+    return resampled_rows
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of a `ResultCache`.
+
+    Attributes:
+        - hits (int): Number of calls whose result was found in the cache.
+        - misses (int): Number of calls whose result was computed (and then cached).
+        - size (int): Number of results currently cached.
+        - maxsize (int): Maximum number of results that are cached (the least recently used ones are evicted).
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class ResultCache:
+    """
+    LRU cache of the results of method calls, bound to a version (of the object whose methods are cached).
+    All the cached results are discarded once the cache is used with a different version.
+    """
+
+    def __init__(self, *, maxsize: int) -> None:
+        assert isinstance(maxsize, int) and maxsize > 0, "Param `maxsize` must be a positive integer"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._version: Hashable = None
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, size={len(self._results)})"
+
+    # Copies (and unpickled caches) start empty, as the results belong to the object that computed them
+    def __copy__(self) -> ResultCache:
+        return ResultCache(maxsize=self.maxsize)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> ResultCache:
+        return ResultCache(maxsize=self.maxsize)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _make_result_cache, (self.maxsize,)
+
+    def _sync_version(self, version: Hashable, /) -> None:
+        if version != self._version:
+            self._results.clear()
+            self._version = version
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], /, *, version: Hashable) -> Any:
+        """Returns the cached result of the given key (computing and caching it, if it's not found)"""
+        self._sync_version(version)
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            result = compute()
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+            return result
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._results), maxsize=self.maxsize)
+
+
+def _make_result_cache(maxsize: int, /) -> ResultCache:
+    return ResultCache(maxsize=maxsize)
+
+
+def _freeze(value: Any, /) -> Hashable:
+    """Returns a hashable equivalent of the given argument (lists become tuples, dictionaries become sorted items)"""
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(map(_freeze, value)))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    hash(value)  # Raises `TypeError` if the value is unhashable
+    return value
+
+
+def cached_result(*, copy_result: Callable[[Any], Any]) -> Callable:
+    """
+    Decorator for methods whose result only depends on the arguments and the state of the instance. The results are
+    cached in `self._result_cache` (if it's not `None`), and bound to the version given by `self._get_cache_version()`.
+
+    Parameters:
+        - copy_result (callable): Function that returns a copy of a cached result, which is returned to the caller
+        (so that modifying the returned value never modifies the cached value).
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache: ResultCache = self._result_cache
+            if cache is None:
+                return method(self, *args, **kwargs)
+            try:
+                key = (method.__name__, _freeze(args), _freeze(kwargs))
+            except TypeError:  # Calls having unhashable arguments are not cached
+                return method(self, *args, **kwargs)
+            result = cache.get_or_compute(
+                key,
+                functools.partial(method, self, *args, **kwargs),
+                version=self._get_cache_version(),
+            )
+            return copy_result(result)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,137 @@
+from itertools import islice
+import math
+import random
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from slupy.core import checks
+
+
+def _random_in_open_interval(rng: random.Random, /) -> float:
+    """Returns a random float in the open interval (0, 1)"""
+    while True:
+        number = rng.random()
+        if number > 0.0:
+            return number
+
+
+def _compute_weight(rng: random.Random, /, *, k: int) -> float:
+    return math.exp(math.log(_random_in_open_interval(rng)) / k)
+
+
+def _compute_num_items_to_skip(rng: random.Random, /, *, weight: float) -> int:
+    if weight >= 1.0:
+        return 0
+    return math.floor(math.log(_random_in_open_interval(rng)) / math.log1p(-weight))
+
+
+class _Reservoir:
+    """Reservoir sample (as per Algorithm L) that gets offered one item at a time"""
+
+    __slots__ = ("k", "rng", "items", "num_items_seen", "next_position", "weight")
+
+    def __init__(self, *, k: int, rng: random.Random) -> None:
+        self.k = k
+        self.rng = rng
+        self.items: List[Tuple[int, Any]] = []
+        self.num_items_seen = 0
+        self.next_position = 0
+        self.weight = 1.0
+
+    def _schedule_next(self) -> None:
+        self.next_position += _compute_num_items_to_skip(self.rng, weight=self.weight) + 1
+
+    def offer(self, position: int, item: Any, /) -> None:
+        """Offers the item at the given position (in the stream) to the reservoir"""
+        num_items_seen = self.num_items_seen
+        self.num_items_seen += 1
+        if num_items_seen < self.k:
+            self.items.append((position, item))
+            if num_items_seen == self.k - 1:
+                self.next_position = num_items_seen
+                self.weight = _compute_weight(self.rng, k=self.k)
+                self._schedule_next()
+            return
+        if num_items_seen == self.next_position:
+            self.items[self.rng.randrange(self.k)] = (position, item)
+            self.weight *= _compute_weight(self.rng, k=self.k)
+            self._schedule_next()
+
+
+def _sorted_by_position(items: List[Tuple[int, Any]], /) -> List[Any]:
+    return [item for _, item in sorted(items, key=lambda pair: pair[0])]
+
+
+def reservoir_sample(
+        iterable: Iterable[Any],
+        /,
+        *,
+        k: int,
+        seed: Optional[int] = None,
+    ) -> List[Any]:
+    """
+    Returns a uniform random sample of `k` items from the given iterable (or all the items, if there are fewer than `k`),
+    in the order in which they appear in the iterable.
+
+    Uses reservoir sampling (Algorithm L), which reads the iterable once, holds at most `k` items in memory, and
+    jumps over the items that cannot be sampled (without generating a random number for each of them).
+    The sample is reproducible for a given `seed`.
+    """
+    assert checks.is_non_negative_integer(k), "Param `k` must be a non-negative integer"
+    if k == 0:
+        return []
+    rng = random.Random(seed)
+    items_with_position = enumerate(iterable)
+    reservoir = list(islice(items_with_position, k))
+    if len(reservoir) < k:
+        return [item for _, item in reservoir]
+    weight = _compute_weight(rng, k=k)
+    while True:
+        num_items_to_skip = _compute_num_items_to_skip(rng, weight=weight)
+        item_with_position = next(islice(items_with_position, num_items_to_skip, None), None)
+        if item_with_position is None:
+            break
+        reservoir[rng.randrange(k)] = item_with_position
+        weight *= _compute_weight(rng, k=k)
+    return _sorted_by_position(reservoir)
+
+
+def stratified_reservoir_sample(
+        iterable: Iterable[Any],
+        /,
+        *,
+        key: Callable[[Any], Hashable],
+        k: Optional[int] = None,
+        k_by_group: Optional[Dict[Hashable, int]] = None,
+        seed: Optional[int] = None,
+    ) -> List[Any]:
+    """
+    Returns a uniform random sample of items per group (where the group of an item is given by `key(item)`), in the
+    order in which they appear in the iterable. Keeps one reservoir (as per Algorithm L) per group, and reads the
+    iterable once. The sample is reproducible for a given `seed`.
+
+    Parameters:
+        - key (Callable): Takes in an item, and returns its group.
+        - k (int): Number of items to sample per group.
+        - k_by_group (dict): Number of items to sample for each group (groups that are missing are not sampled).
+    """
+    assert sum([k is not None, k_by_group is not None]) == 1, "Expected exactly one of the following params: ['k', 'k_by_group']"
+    assert k is None or checks.is_non_negative_integer(k), "Param `k` must be a non-negative integer"
+    rng = random.Random(seed)
+    reservoirs: Dict[Hashable, Optional[_Reservoir]] = {}
+    for position, item in enumerate(iterable):
+        group = key(item)
+        reservoir = reservoirs.get(group)
+        if reservoir is None:
+            if group in reservoirs:
+                continue
+            k_of_group = k if k_by_group is None else k_by_group.get(group, 0)
+            reservoir = _Reservoir(k=k_of_group, rng=rng) if k_of_group > 0 else None
+            reservoirs[group] = reservoir
+            if reservoir is None:
+                continue
+        reservoir.offer(position, item)
+    items = []
+    for reservoir in reservoirs.values():
+        if reservoir is not None:
+            items.extend(reservoir.items)
+    return _sorted_by_position(items)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import mmap
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+from typing import Any, Callable, List, Literal, Mapping, Optional, Sequence, Tuple
+import weakref
+
+try:
+    import _posixshmem
+except ImportError:  # Windows (where segments are not tracked, and are freed once no process has them open)
+    _posixshmem = None
+
+from slupy.data_wrangler.columnar import decode_column, decode_rows, encode_rows, get_packed_size, pack, unpack
+
+SharedKind = Literal["columnar", "pickle"]
+
+# Typecodes of the column kinds that can be viewed without decoding (refer `slupy.data_wrangler.columnar`)
+_VIEWABLE_TYPECODES = {"int64": "q", "float64": "d"}
+
+
+def _encode(rows: Sequence[Mapping[str, Any]], /) -> tuple:
+    encoded = encode_rows(rows)
+    if encoded is not None:
+        header, buffers = encoded
+        return {"kind": "columnar", "num_rows": len(rows), "columns": header}, buffers
+    # Rows that have different fields (or a mix of dictionaries and records) are pickled as a whole
+    buffer = pickle.dumps(list(rows), protocol=pickle.HIGHEST_PROTOCOL)
+    return {"kind": "pickle", "num_rows": len(rows), "columns": None}, [buffer]
+
+
+def _release_segment(shm: SharedMemory, owner_pid: int, /) -> None:
+    # Processes forked from the owner inherit the handle, but must never unlink the segment
+    if os.getpid() != owner_pid:
+        return
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:  # already unlinked (eg: by the resource tracker)
+        pass
+
+
+class SharedSegment:
+    """
+    Handle of a shared memory segment that holds rows (refer `share_rows()`), owned by the process that created it.
+
+    The segment is unlinked by `release()`, when the handle is used as a context manager and exits, when the handle is
+    garbage-collected, or when the interpreter exits. If the owner process crashes, the segment is unlinked by the
+    resource tracker of `multiprocessing` instead. Processes that attach to the segment never unlink it, so workers
+    that crash cannot leak it (nor remove it from under the other workers).
+    """
+
+    def __init__(self, shm: SharedMemory, /, *, kind: SharedKind, num_rows: int) -> None:
+        self._shm = shm
+        self.name = shm.name
+        self.size = shm.size
+        self.kind = kind
+        self.num_rows = num_rows
+        self._finalizer = weakref.finalize(self, _release_segment, shm, os.getpid())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, size={self.size}, kind={self.kind!r},"
+            f" num_rows={self.num_rows}, is_released={self.is_released})"
+        )
+
+    def __enter__(self) -> SharedSegment:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    @property
+    def is_released(self) -> bool:
+        return not self._finalizer.alive
+
+    def release(self) -> None:
+        """Detaches from the segment and unlinks it (the processes still attached to it keep their mapping)"""
+        self._finalizer()
+
+
+def share_rows(rows: Sequence[Mapping[str, Any]], /) -> SharedSegment:
+    """
+    Copies the given rows into a new shared memory segment, and returns its (owner) handle.
+    Rows that all have the same fields (in the same order) are encoded column by column
+    (refer `slupy.data_wrangler.columnar.encode_rows()`), and other rows are pickled.
+    """
+    header, buffers = _encode(rows)
+    shm = SharedMemory(create=True, size=get_packed_size(header, buffers))
+    try:
+        pack(header, buffers, target=shm.buf)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return SharedSegment(shm, kind=header["kind"], num_rows=header["num_rows"])
+
+
+def _map_read_only(name: str, /) -> Tuple[memoryview, Callable[[], None]]:
+    """
+    Maps the segment of the given name as read-only, and returns its buffer and a function that unmaps it.
+    On POSIX, the segment is mapped directly (instead of via `SharedMemory`, which registers the segment with the
+    resource tracker shared with the owner, so that attaching processes could unlink it from under the owner).
+    """
+    if _posixshmem is None:
+        shm = SharedMemory(name=name)
+        return shm.buf.toreadonly(), shm.close
+    fd = _posixshmem.shm_open(f"/{name}", os.O_RDONLY, mode=0o600)
+    try:
+        mapping = mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+    return memoryview(mapping), mapping.close
+
+
+class SharedColumns:
+    """
+    Read-only access to the rows of a shared memory segment, from any process (refer `attach()`).
+    Views returned by `get_view()` point directly into the segment, and are released once detached.
+    """
+
+    def __init__(self, name: str, /) -> None:
+        self._source, self._unmap = _map_read_only(name)
+        self._views: List[memoryview] = []
+        header, self._buffers = unpack(self._source)
+        self.name = name
+        self.kind: SharedKind = header["kind"]
+        self.num_rows: int = header["num_rows"]
+        self._header = header["columns"]
+        self._rows: Optional[List[Mapping[str, Any]]] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, kind={self.kind!r}, num_rows={self.num_rows})"
+
+    def __enter__(self) -> SharedColumns:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def fields(self) -> Optional[List[str]]:
+        """Fields of the rows (or `None` if the rows don't all have the same fields)"""
+        return list(self._header["fields"]) if self.kind == "columnar" else None
+
+    def get_rows(self) -> List[Mapping[str, Any]]:
+        """Returns the rows (dictionaries or records, as they were shared). They're decoded into new objects"""
+        if self.kind == "columnar":
+            return decode_rows(self._header, self._buffers)
+        if self._rows is None:
+            self._rows = pickle.loads(self._buffers[0])
+        return list(self._rows)
+
+    def get_values(self, field: str, /) -> List[Any]:
+        """Returns the values of the given field (decoded into new objects)"""
+        if self.kind == "columnar":
+            if field not in self._header["fields"]:
+                raise KeyError(f"Field '{field}' is not found")
+            return decode_column(self._header, self._buffers, field=field)
+        return [row[field] for row in self.get_rows()]
+
+    def get_view(self, field: str, /) -> memoryview:
+        """
+        Returns a read-only view (without copying) of the values of the given field, as 64-bit integers or floats.
+        Raises `ValueError` if the field is not such a column, or if it has nulls (refer `get_values()` instead).
+        The view is valid until `close()` is called.
+        """
+        if self.kind == "columnar" and field in self._header["fields"]:
+            description = self._header["columns"][self._header["fields"].index(field)]
+            typecode = _VIEWABLE_TYPECODES.get(description["kind"])
+            if typecode is not None and not description["has_nulls"]:
+                view = self._buffers[description["buffers"][0]].cast(typecode)
+                self._views.append(view)
+                return view
+        raise ValueError(f"Field '{field}' cannot be viewed without decoding, as it's not a 64-bit numeric column without nulls")
+
+    def close(self) -> None:
+        """Releases the views, and detaches from the segment (which is never unlinked by this process)"""
+        if self._unmap is None:
+            return
+        for view in reversed(self._views):
+            view.release()
+        for buffer in self._buffers:
+            buffer.release()
+        self._source.release()
+        self._views, self._buffers, self._rows = [], [], None
+        self._unmap()
+        self._unmap = None
+
+
+def attach(name: str, /) -> SharedColumns:
+    """Attaches to the shared memory segment of the given name (created via `share_rows()`). Use as a context manager"""
+    return SharedColumns(name)
+
+
+def load_shared_rows(name: str, /) -> List[Mapping[str, Any]]:
+    """Returns the rows of the shared memory segment of the given name, and detaches from it"""
+    with attach(name) as shared_columns:
+        return shared_columns.get_rows()
@@ -0,0 +1,596 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+import math
+import pickle
+import sqlite3
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from slupy.core import checks
+from slupy.data_wrangler.expressions import (
+    BinaryOperation,
+    BooleanOperation,
+    Column,
+    Compare,
+    Expression,
+    IsIn,
+    IsNull,
+    Literal as LiteralExpression,
+    UnaryOperation,
+)
+
+if TYPE_CHECKING:
+    from slupy.data_wrangler.dataset import Dataset
+
+# Kind of values of a column, which decides how its values are stored:
+#   - 'number': int/float (stored natively)
+#   - 'bool': bool (stored as 0/1, and converted back via a converter)
+#   - 'any': a mix of int/float/str/bytes (stored natively)
+#   - 'pickle': any other values (eg: lists, datetimes, NaN, or bools mixed with other types) stored as pickles
+ColumnKind = Literal["number", "bool", "any", "pickle"]
+
+# Every declared type contains "BLOB", so that the columns have no type affinity (SQLite never converts the values,
+# eg: the string "1" stays a string), and each one is registered as a converter (applied when the values are read)
+_DECLARED_TYPE_BY_KIND: Dict[str, str] = {
+    "number": "SLUPY_NUMBER_BLOB",
+    "bool": "SLUPY_BOOL_BLOB",
+    "any": "",
+    "pickle": "SLUPY_PICKLE_BLOB",
+}
+_KIND_BY_DECLARED_TYPE = {declared_type: kind for kind, declared_type in _DECLARED_TYPE_BY_KIND.items()}
+
+sqlite3.register_converter(_DECLARED_TYPE_BY_KIND["bool"], lambda value: value != b"0")
+sqlite3.register_converter(_DECLARED_TYPE_BY_KIND["pickle"], pickle.loads)
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+_NATIVE_TYPES = (int, float, str, bytes)
+_MAX_VALUES_PER_IN_LIST = 500
+_PRAGMAS_FOR_BULK_LOADING = {"synchronous": "OFF", "journal_mode": "MEMORY", "cache_size": "-262144"}  # 256 MiB cache
+
+_COMPARISON_OPERATORS = {"==": "IS", "!=": "IS NOT", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+_ARITHMETIC_OPERATORS = {"+", "-", "*", "/"}
+
+
+def quote_identifier(name: str, /) -> str:
+    """Returns the given table/column name quoted for SQL"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def connect(path: str, /) -> sqlite3.Connection:
+    """
+    Returns a connection to the SQLite database at the given path, which converts the values of the columns written
+    via `write_rows()` back to their types. Transactions are handled explicitly (`isolation_level=None`).
+    """
+    return sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, isolation_level=None)
+
+
+def _is_native_value(value: Any, /) -> bool:
+    if type(value) is int:
+        return _INT64_MIN <= value <= _INT64_MAX
+    if type(value) is float:
+        return not math.isnan(value)  # SQLite stores NaN as NULL
+    return True
+
+
+def _infer_kind(values: List[Any], /) -> Optional[ColumnKind]:
+    """Returns the kind of the given values of a column (or `None` if they're all `None`)"""
+    types = set(map(type, values))
+    types.discard(type(None))
+    if not types:
+        return None
+    if types == {bool}:
+        return "bool"
+    if not types.issubset(_NATIVE_TYPES) or not all(_is_native_value(value) for value in values if value is not None):
+        return "pickle"
+    return "number" if types.issubset((int, float)) else "any"
+
+
+def _is_compatible_kind(existing_kind: ColumnKind, new_kind: Optional[ColumnKind], /) -> bool:
+    if new_kind is None or existing_kind in (new_kind, "pickle"):
+        return True
+    return existing_kind == "any" and new_kind == "number"
+
+
+def get_column_kinds(connection: sqlite3.Connection, table: str, /) -> Dict[str, ColumnKind]:
+    """Returns dictionary having keys = columns of the given table (in order), and values = their kinds"""
+    columns = connection.execute(f"PRAGMA table_info({quote_identifier(table)})").fetchall()
+    if not columns:
+        raise ValueError(f"Table '{table}' is not found")
+    # Columns of tables that were not written via `write_rows()` are read as returned by `sqlite3`
+    return {name: _KIND_BY_DECLARED_TYPE.get(declared_type.upper(), "any") for _, name, declared_type, *_ in columns}
+
+
+def write_rows(
+        connection: sqlite3.Connection,
+        table: str,
+        rows: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        if_exists: Literal["fail", "replace", "append"] = "fail",
+        batch_size: Optional[int] = 100_000,
+    ) -> Dict[str, ColumnKind]:
+    """
+    Writes the given rows into the given table (creating it, unless `if_exists='append'`), and returns the kinds of its
+    columns. A field that is missing from a row is written as NULL.
+
+    The rows are inserted via `executemany()` in batches of `batch_size` rows, all within a single transaction, and
+    with pragmas tuned for bulk loading (no syncing to disk, journal in memory, large page cache), which are restored
+    afterwards.
+    """
+    assert if_exists in ("fail", "replace", "append"), "Param `if_exists` must be one of ['fail', 'replace', 'append']"
+    assert checks.is_positive_integer(batch_size), "Param `batch_size` must be a positive integer"
+    fields = list(dict.fromkeys(field for row in rows for field in row))
+    assert fields, "Param `rows` must have at least 1 field"
+    kinds = {field: _infer_kind([row.get(field) for row in rows]) for field in fields}
+    table_exists = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,),
+    ).fetchone() is not None
+    if table_exists and if_exists == "fail":
+        raise ValueError(f"Table '{table}' already exists")
+    if table_exists and if_exists == "append":
+        existing_kinds = get_column_kinds(connection, table)
+        for field, kind in kinds.items():
+            if field not in existing_kinds:
+                raise KeyError(f"Field '{field}' is not a column of the table '{table}'")
+            if not _is_compatible_kind(existing_kinds[field], kind):
+                raise ValueError(f"Field '{field}' has values of other types than the column of the table '{table}'")
+        kinds = {field: existing_kinds[field] for field in fields}
+    else:
+        kinds = {field: kind or "any" for field, kind in kinds.items()}
+
+    previous_pragmas = {name: connection.execute(f"PRAGMA {name}").fetchone()[0] for name in _PRAGMAS_FOR_BULK_LOADING}
+    for name, value in _PRAGMAS_FOR_BULK_LOADING.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    try:
+        connection.execute("BEGIN")
+        try:
+            if table_exists and if_exists == "replace":
+                connection.execute(f"DROP TABLE {quote_identifier(table)}")
+            if not table_exists or if_exists == "replace":
+                columns = ", ".join(
+                    f"{quote_identifier(field)} {_DECLARED_TYPE_BY_KIND[kind]}".rstrip() for field, kind in kinds.items()
+                )
+                connection.execute(f"CREATE TABLE {quote_identifier(table)} ({columns})")
+            insert = (
+                f"INSERT INTO {quote_identifier(table)} ({', '.join(map(quote_identifier, fields))})"
+                f" VALUES ({', '.join('?' * len(fields))})"
+            )
+            pickled_positions = [idx for idx, field in enumerate(fields) if kinds[field] == "pickle"]
+            for start in range(0, len(rows), batch_size):
+                values = [tuple(map(row.get, fields)) for row in rows[start : start + batch_size]]
+                if pickled_positions:
+                    values = [_pickle_values(row_values, pickled_positions) for row_values in values]
+                connection.executemany(insert, values)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+    finally:
+        for name, value in previous_pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+    return kinds
+
+
+def _pickle_values(values: Tuple[Any, ...], positions: List[int], /) -> Tuple[Any, ...]:
+    values = list(values)
+    for idx in positions:
+        if values[idx] is not None:
+            values[idx] = pickle.dumps(values[idx], protocol=pickle.HIGHEST_PROTOCOL)
+    return tuple(values)
+
+
+def read_rows(
+        connection: sqlite3.Connection,
+        query: str,
+        /,
+        *,
+        params: Union[Sequence[Any], Mapping[str, Any]] = (),
+    ) -> Iterator[Dict[str, Any]]:
+    """Yields the rows (dictionaries) returned by the given query"""
+    cursor = connection.execute(query, params)
+    fields = [description[0] for description in cursor.description or []]
+    for values in cursor:
+        yield dict(zip(fields, values))
+
+
+def _convert_from_storage(value: Any, kind: ColumnKind, /) -> Any:
+    """Converts a value as stored (which is how user-defined SQL functions get it) into the value that was written"""
+    if value is None:
+        return None
+    if kind == "bool":
+        return bool(value)
+    if kind == "pickle":
+        return pickle.loads(value)
+    return value
+
+
+class _ExpressionTranslator:
+    """
+    Translates expressions (refer `slupy.data_wrangler.expressions`) into SQL having the same result as the compiled
+    Python code, or returns `None` if that's not possible (eg: for fields stored as pickles, or for `//` and `%`, which
+    round differently in SQL). The values of the literals are appended to `params`.
+
+    Equality is null-safe (`==` is translated to `IS`), so that `None == None` holds like in Python. Where Python would
+    raise (eg: for `None < 1`, or for `1 < "a"`), SQL compares as per its own rules instead.
+    """
+
+    def __init__(self, *, kinds: Dict[str, ColumnKind]) -> None:
+        self.kinds = kinds
+        self.params: List[Any] = []
+
+    def translate_predicate(self, expression: Expression, /) -> Optional[str]:
+        if isinstance(expression, Compare):
+            left, right = self.translate_value(expression.left), self.translate_value(expression.right)
+            if left is None or right is None:
+                return None
+            if expression.operator not in ("==", "!=") and "null" in (left[1], right[1]):
+                return None  # Raises in Python
+            return f"({left[0]} {_COMPARISON_OPERATORS[expression.operator]} {right[0]})"
+        if isinstance(expression, BooleanOperation):
+            left, right = self.translate_predicate(expression.left), self.translate_predicate(expression.right)
+            if left is None or right is None:
+                return None
+            return f"({left} {expression.operator.upper()} {right})"
+        if isinstance(expression, UnaryOperation) and expression.operator == "not":
+            operand = self.translate_predicate(expression.operand)
+            return None if operand is None else f"(NOT {operand})"
+        if isinstance(expression, IsNull):
+            operand = self.translate_value(expression.operand)
+            if operand is None:
+                return None
+            return f"({operand[0]} {'IS NOT' if expression.negate else 'IS'} NULL)"
+        if isinstance(expression, IsIn):
+            return self._translate_is_in(expression)
+        if isinstance(expression, Column) and self.kinds.get(expression.field) == "bool":
+            return f"({self.translate_value(expression)[0]} IS 1)"  # Truthiness of a boolean field
+        return None
+
+    def _translate_is_in(self, expression: IsIn, /) -> Optional[str]:
+        if not isinstance(expression.operand, Column) or not isinstance(expression.values, frozenset):
+            return None
+        operand = self.translate_value(expression.operand)
+        values = expression.values
+        if operand is None or len(values) > _MAX_VALUES_PER_IN_LIST:
+            return None
+        if not all(type(value) in (bool, type(None)) + _NATIVE_TYPES and _is_native_value(value) for value in values):
+            return None
+        values_not_null = [value for value in values if value is not None]
+        self.params.extend(values_not_null)
+        placeholders = ", ".join("?" * len(values_not_null))
+        # Never results in NULL (like `NOT (NULL IN (...))` would), so that `~col(field).isin(...)` holds for nulls
+        if None in values:
+            return f"({operand[0]} IS NULL OR {operand[0]} IN ({placeholders}))" if values_not_null else f"({operand[0]} IS NULL)"
+        return f"({operand[0]} IS NOT NULL AND {operand[0]} IN ({placeholders}))" if values_not_null else "0"
+
+    def translate_value(self, expression: Expression, /) -> Optional[Tuple[str, str]]:
+        """Returns tuple of (SQL, kind of the value), where the kind can also be 'null'"""
+        if isinstance(expression, Column):
+            kind = self.kinds.get(expression.field)
+            if kind is None:
+                raise KeyError(f"Key '{expression.field}' is not found")
+            return None if kind == "pickle" else (quote_identifier(expression.field), kind)
+        if isinstance(expression, LiteralExpression):
+            value = expression.value
+            if value is None:
+                return ("NULL", "null")
+            if type(value) is bool:
+                self.params.append(value)
+                return ("?", "bool")
+            if type(value) in _NATIVE_TYPES and _is_native_value(value):
+                self.params.append(value)
+                return ("?", "number" if type(value) in (int, float) else "any")
+            return None
+        if isinstance(expression, BinaryOperation) and expression.operator in _ARITHMETIC_OPERATORS:
+            left, right = self.translate_value(expression.left), self.translate_value(expression.right)
+            if left is None or right is None or left[1] != "number" or right[1] != "number":
+                return None
+            if expression.operator == "/":
+                return (f"(CAST({left[0]} AS REAL) / {right[0]})", "number")  # True division (like in Python)
+            return (f"({left[0]} {expression.operator} {right[0]})", "number")
+        if isinstance(expression, UnaryOperation) and expression.operator == "-":
+            operand = self.translate_value(expression.operand)
+            if operand is None or operand[1] != "number":
+                return None
+            return (f"(-{operand[0]})", "number")
+        predicate = self.translate_predicate(expression)
+        return None if predicate is None else (predicate, "bool")
+
+
+class _Connection:
+    """Connection shared by an `SQLiteDataset` and the datasets derived from it"""
+
+    def __init__(self, path: str, /) -> None:
+        self.path = path
+        self.connection = connect(path)
+        self.num_functions = 0
+        self.function_errors: List[BaseException] = []
+        self.indexes: set = set()
+
+    def register_function(self, func: Callable[..., Any], /) -> str:
+        """Registers the given function, to be called from SQL, and returns its name"""
+        name = f"slupy_function_{self.num_functions}"
+        self.num_functions += 1
+
+        def wrapper(*args: Any) -> Any:
+            try:
+                return func(*args)
+            except Exception as error:
+                self.function_errors.append(error)  # Re-raised as is (instead of as `sqlite3.OperationalError`)
+                raise
+
+        self.connection.create_function(name, -1, wrapper)
+        return name
+
+    def execute(self, sql: str, params: Sequence[Any] = (), /) -> sqlite3.Cursor:
+        self.function_errors.clear()
+        try:
+            return self.connection.execute(sql, params)
+        except sqlite3.OperationalError:
+            if self.function_errors:
+                raise self.function_errors[0]
+            raise
+
+    def ensure_index(self, table: str, columns: Tuple[Tuple[str, bool], ...], /) -> None:
+        """Creates an index on the given columns (tuples of field and ascending) of the table, if it doesn't exist"""
+        if (table, columns) in self.indexes:
+            return
+        name = "slupy_index__" + "__".join([table] + [f"{field}_{'asc' if ascending else 'desc'}" for field, ascending in columns])
+        indexed_columns = ", ".join(
+            f"{quote_identifier(field)} {'ASC' if ascending else 'DESC'}" for field, ascending in columns
+        )
+        self.connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote_identifier(name)} ON {quote_identifier(table)} ({indexed_columns})"
+        )
+        self.indexes.add((table, columns))
+
+
+class SQLiteDataset:
+    """
+    Dataset whose rows are kept in a table of an SQLite database (refer `Dataset.to_sqlite()`), for datasets that do not
+    fit in memory. The operations are translated into SQL (pushed down), and are only run once the rows are read (via
+    iteration, `to_dataset()`, `len()` or `value_counts()`), so the rows are never all loaded into memory.
+
+    Each operation returns a new `SQLiteDataset` (the table itself is never modified). Expressions given to
+    `filter_rows()` are translated into SQL where possible (refer `slupy.data_wrangler.expressions`); the parts that
+    cannot be translated (and functions) are run in Python, row by row, within the query.
+
+    Each row has all the columns of the table, so a field that was missing from a row is read as `None`.
+    Indexes are created on demand (once the rows are read) for the fields that are ordered by or compared for equality
+    with constants, unless `auto_index=False`. Later queries on the same fields then use the index.
+    """
+
+    def __init__(self, path: str, table: str, /, *, auto_index: Optional[bool] = True) -> None:
+        """
+        Parameters:
+            - path (str): Path of the SQLite database.
+            - table (str): Name of the table having the rows.
+            - auto_index (bool): If `auto_index=True`, creates indexes on the fields that are ordered by or compared for
+            equality (once the rows are read).
+        """
+        self._connection = _Connection(path)
+        self.table = table
+        self.auto_index = auto_index
+        self._kinds = get_column_kinds(self._connection.connection, table)
+        self._fields: List[str] = list(self._kinds)
+        self._conditions: List[Tuple[str, List[Any]]] = []
+        self._order: List[Tuple[str, bool]] = []
+        self._index_candidates: List[Tuple[Tuple[str, bool], ...]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._connection.path!r}, table={self.table!r}, fields={self._fields})"
+
+    def __enter__(self) -> SQLiteDataset:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connection (shared with the datasets derived from this one)"""
+        self._connection.connection.close()
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._fields)
+
+    def _derive(self) -> SQLiteDataset:
+        instance = self.__class__.__new__(self.__class__)
+        instance.__dict__.update(self.__dict__)
+        instance._fields = list(self._fields)
+        instance._conditions = list(self._conditions)
+        instance._order = list(self._order)
+        instance._index_candidates = list(self._index_candidates)
+        return instance
+
+    def _get_where_clause(self) -> Tuple[str, List[Any]]:
+        if not self._conditions:
+            return "", []
+        params = [param for _, condition_params in self._conditions for param in condition_params]
+        return " WHERE " + " AND ".join(condition for condition, _ in self._conditions), params
+
+    def _get_order_clause(self, *, reverse: Optional[bool] = False) -> str:
+        # The position (rowid) breaks the ties, so that the order is stable (like `Dataset.order_by()`)
+        columns = [(quote_identifier(field), ascending) for field, ascending in self._order] + [("rowid", True)]
+        return ", ".join(f"{column} {'ASC' if ascending != reverse else 'DESC'}" for column, ascending in columns)
+
+    def get_sql(self) -> Tuple[str, List[Any]]:
+        """Returns tuple of (SQL query, params) that selects the rows of the dataset"""
+        where, params = self._get_where_clause()
+        columns = ", ".join(map(quote_identifier, self._fields)) or "NULL"
+        return f"SELECT {columns} FROM {quote_identifier(self.table)}{where} ORDER BY {self._get_order_clause()}", params
+
+    def _execute(self, sql: str, params: Sequence[Any], /) -> sqlite3.Cursor:
+        if self.auto_index:
+            for columns in self._index_candidates:
+                self._connection.ensure_index(self.table, columns)
+        return self._connection.execute(sql, params)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        fields = self._fields
+        for values in self._execute(*self.get_sql()):
+            yield dict(zip(fields, values))
+
+    def __len__(self) -> int:
+        where, params = self._get_where_clause()
+        return self._execute(f"SELECT COUNT(*) FROM {quote_identifier(self.table)}{where}", params).fetchone()[0]
+
+    def to_dataset(self) -> Dataset:
+        """Returns a `Dataset` having the rows"""
+        from slupy.data_wrangler.dataset import Dataset  # Imported here, as said module imports this one
+
+        return Dataset(list(self))
+
+    def create_index(self, *, fields: List[str]) -> SQLiteDataset:
+        """Creates an index on the given fields of the table (if it doesn't exist). Returns the same instance."""
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        self._check_fields_exist(fields)
+        self._connection.ensure_index(self.table, tuple((field, True) for field in fields))
+        return self
+
+    def _check_fields_exist(self, fields: Iterable[str], /) -> None:
+        for field in fields:
+            if field not in self._fields:
+                raise KeyError(f"Key '{field}' is not found")
+
+    def _check_not_pickled(self, fields: Iterable[str], /, *, operation: str) -> None:
+        for field in fields:
+            if self._kinds[field] == "pickle":
+                raise TypeError(f"Field '{field}' is stored as pickles (as it has non-SQL values), so it cannot be used for {operation}")
+
+    def filter_rows(self, *, func: Union[Callable[[Dict[str, Any]], bool], Expression]) -> SQLiteDataset:
+        """
+        Keeps the rows for which `func` returns `True` (refer `Dataset.filter_rows()`). Expressions are translated into
+        SQL where possible; functions (and the parts of expressions that cannot be translated) are run in Python.
+        """
+        instance = self._derive()
+        kinds = {field: self._kinds[field] for field in self._fields}
+        if not isinstance(func, Expression):
+            instance._conditions.append(instance._make_python_condition(func, fields=self._fields, check_bool=True))
+            return instance
+        for conjunct in func.get_conjuncts():
+            translator = _ExpressionTranslator(kinds=kinds)
+            condition = translator.translate_predicate(conjunct)
+            if condition is None:
+                row_function = conjunct.compile()
+                instance._conditions.append(
+                    instance._make_python_condition(row_function, fields=sorted(conjunct.get_fields()), check_bool=False),
+                )
+                continue
+            instance._conditions.append((condition, translator.params))
+            index_field = _get_equality_field(conjunct)
+            if index_field is not None:
+                instance._index_candidates.append(((index_field, True),))
+        return instance
+
+    def _make_python_condition(
+            self,
+            func: Callable[[Dict[str, Any]], Any],
+            /,
+            *,
+            fields: List[str],
+            check_bool: bool,
+        ) -> Tuple[str, List[Any]]:
+        self._check_fields_exist(fields)
+        kinds = [self._kinds[field] for field in fields]
+
+        def condition(*values: Any) -> int:
+            row = {field: _convert_from_storage(value, kind) for field, kind, value in zip(fields, kinds, values)}
+            should_keep_row = func(row)
+            if check_bool:
+                assert isinstance(should_keep_row, bool), f"Result of `func` must be of type boolean"
+            return 1 if should_keep_row else 0
+
+        name = self._connection.register_function(condition)
+        return f"{name}({', '.join(map(quote_identifier, fields))})", []
+
+    def order_by(self, *, fields: List[str], ascending: List[bool]) -> SQLiteDataset:
+        """
+        Orders by the given fields in the desired order (refer `Dataset.order_by()`), where nulls come first (instead of
+        raising an error), and values of different types are ordered as numbers < strings < bytes.
+        """
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        assert checks.is_list_of_instances_of_type(ascending, type_=bool, allow_empty=False), (
+            "Param `ascending` must be a non-empty list of booleans"
+        )
+        assert len(fields) == len(ascending), "Params `fields` and `ascending` must be of same length"
+        self._check_fields_exist(fields)
+        self._check_not_pickled(fields, operation="ordering")
+        instance = self._derive()
+        instance._order = list(zip(fields, ascending))
+        instance._index_candidates.append(tuple(instance._order))
+        return instance
+
+    def keep_fields(self, *, fields: List[str]) -> SQLiteDataset:
+        """Keeps the given fields (refer `Dataset.keep_fields()`)"""
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        self._check_fields_exist(fields)
+        instance = self._derive()
+        instance._fields = [field for field in self._fields if field in fields]
+        return instance
+
+    def drop_duplicates(
+            self,
+            *,
+            keep: Literal["first", "last", "none"] = "first",
+            subset: Optional[List[str]] = None,
+        ) -> SQLiteDataset:
+        """
+        Drops the duplicate rows (refer `Dataset.drop_duplicates()`), where the first/last row is as per the current
+        order. Integers and floats that are equal (eg: 1 and 1.0) are duplicates, like in Python.
+        """
+        assert keep in ("first", "last", "none"), "Param `keep` must be one of ['first', 'last', 'none']"
+        subset = list(subset) if subset else self.fields
+        self._check_fields_exist(subset)
+        self._check_not_pickled(subset, operation="finding duplicates")
+        where, params = self._get_where_clause()
+        partition = ", ".join(map(quote_identifier, subset))
+        if keep == "none":
+            window = f"COUNT(*) OVER (PARTITION BY {partition})"
+        else:
+            window = f"ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY {self._get_order_clause(reverse=keep == 'last')})"
+        condition = (
+            f"rowid IN (SELECT rowid FROM (SELECT rowid, {window} AS slupy_position FROM {quote_identifier(self.table)}"
+            f"{where}) WHERE slupy_position = 1)"
+        )
+        instance = self._derive()
+        instance._conditions.append((condition, params))
+        return instance
+
+    def value_counts(self) -> Dict[str, Counter]:
+        """
+        Returns dictionary having keys = fields, and values = `collections.Counter` objects having the value-counts
+        of all the values in said field (refer `Dataset.value_counts()`). Counted via `GROUP BY` (in SQL), except for
+        the fields stored as pickles.
+        """
+        where, params = self._get_where_clause()
+        table = quote_identifier(self.table)
+        result: Dict[str, Counter] = {}
+        for field in sorted(self._fields):
+            column = quote_identifier(field)
+            if self._kinds[field] == "pickle":
+                result[field] = Counter(value for (value,) in self._execute(f"SELECT {column} FROM {table}{where}", params))
+                continue
+            counter = Counter()
+            for value, count in self._execute(f"SELECT {column}, COUNT(*) FROM {table}{where} GROUP BY {column}", params):
+                counter[value] += count
+            result[field] = counter
+        return result
+
+
+def _get_equality_field(expression: Expression, /) -> Optional[str]:
+    """Returns the field that the given expression compares for equality with constants (if any)"""
+    if isinstance(expression, Compare) and expression.operator == "==":
+        for left, right in [(expression.left, expression.right), (expression.right, expression.left)]:
+            if isinstance(left, Column) and isinstance(right, LiteralExpression):
+                return left.field
+    if isinstance(expression, IsIn) and isinstance(expression.operand, Column):
+        return expression.operand.field
+    return None
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable
+import inspect
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+from slupy.core import checks
+from slupy.core.helpers import make_deep_copy
+from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.deduplication import StreamDeduplicator
+from slupy.data_wrangler.expressions import Expression
+
+Row = Dict[str, Any]
+Chunk = List[Row]
+ChunkTransform = Callable[[Chunk], Awaitable[Chunk]]
+
+
+class _EndOfStream:
+    """Put into a queue once the stage that feeds the queue has no more chunks"""
+
+
+class _StageFailure:
+    """Put into a queue (instead of a chunk) once a stage has raised an exception, which is re-raised by the consumer"""
+
+    def __init__(self, error: BaseException, /) -> None:
+        self.error = error
+
+
+_END_OF_STREAM = _EndOfStream()
+
+
+async def _iterate_async(rows: Union[AsyncIterable[Row], Iterable[Row]], /) -> AsyncIterator[Row]:
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def _read_chunks(
+        rows: Union[AsyncIterable[Row], Iterable[Row]],
+        output_queue: asyncio.Queue,
+        /,
+        *,
+        chunk_size: int,
+        deep_copy: bool,
+    ) -> None:
+    try:
+        chunk: Chunk = []
+        async for row in _iterate_async(rows):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                await output_queue.put(make_deep_copy(chunk) if deep_copy else chunk)  # Waits while the queue is full
+                chunk = []
+        if chunk:
+            await output_queue.put(make_deep_copy(chunk) if deep_copy else chunk)
+        await output_queue.put(_END_OF_STREAM)
+    except Exception as error:
+        await output_queue.put(_StageFailure(error))
+
+
+async def _run_stage(transform: ChunkTransform, input_queue: asyncio.Queue, output_queue: asyncio.Queue, /) -> None:
+    while True:
+        chunk = await input_queue.get()
+        if isinstance(chunk, (_EndOfStream, _StageFailure)):
+            await output_queue.put(chunk)
+            return
+        try:
+            chunk = await transform(chunk)
+        except Exception as error:
+            await output_queue.put(_StageFailure(error))
+            return
+        if chunk:
+            await output_queue.put(chunk)
+
+
+def _make_filter_transform(func: Union[Callable[[Row], bool], Expression], /) -> ChunkTransform:
+    filter_chunk = func.compile_filter() if isinstance(func, Expression) else None
+
+    async def transform(chunk: Chunk) -> Chunk:
+        if filter_chunk is not None:
+            return filter_chunk(chunk)
+        chunk_filtered: Chunk = []
+        for row in chunk:
+            should_keep_row = func(row)
+            assert isinstance(should_keep_row, bool), f"Result of `func` must be of type boolean"
+            if should_keep_row:
+                chunk_filtered.append(row)
+        return chunk_filtered
+
+    return transform
+
+
+def _make_compute_transform(
+        field: str,
+        func: Union[Callable[[Row], Any], Expression],
+        /,
+        *,
+        concurrency: int,
+    ) -> ChunkTransform:
+    if isinstance(func, Expression):
+        assign = func.compile_assignment()
+
+        async def transform_by_expression(chunk: Chunk) -> Chunk:
+            assign(chunk, field)
+            return chunk
+
+        return transform_by_expression
+
+    semaphore: Optional[asyncio.Semaphore] = None
+
+    async def compute_value(row: Row, awaitable: Awaitable) -> None:
+        async with semaphore:
+            row[field] = await awaitable
+
+    async def transform(chunk: Chunk) -> Chunk:
+        nonlocal semaphore
+        awaitables = []
+        try:
+            for row in chunk:
+                value = func(row)
+                if inspect.isawaitable(value):
+                    awaitables.append(compute_value(row, value))
+                else:
+                    row[field] = value
+        except Exception:
+            for awaitable in awaitables:
+                awaitable.close()  # The coroutines that will never be awaited
+            raise
+        if awaitables:
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(concurrency)  # Created lazily, so that it belongs to the running loop
+            await asyncio.gather(*awaitables)
+        return chunk
+
+    return transform
+
+
+def _make_drop_fields_transform(fields: List[str], /) -> ChunkTransform:
+    async def transform(chunk: Chunk) -> Chunk:
+        for row in chunk:
+            for field in fields:
+                row.pop(field, None)
+        return chunk
+
+    return transform
+
+
+def _make_deduplicate_transform(deduplicator: StreamDeduplicator, /) -> ChunkTransform:
+    async def transform(chunk: Chunk) -> Chunk:
+        return [row for row in chunk if not deduplicator.is_duplicate(row)]
+
+    return transform
+
+
+class AsyncDatasetStream:
+    """
+    Pipeline of row-local `Dataset` operations over rows that come from an asynchronous (or regular) iterable, such as
+    the pages of an HTTP API or an asynchronous database cursor. The rows are processed chunk by chunk, so the rows are
+    never all held in memory (unless collected via `to_dataset()`).
+
+    Each operation runs as its own task, and the tasks are connected by bounded queues of at most `max_pending_chunks`
+    chunks each. A stage that is slower than the stages before it makes them wait (backpressure), so the source is only
+    read as fast as the rows are consumed, while reading from the source overlaps with transforming the rows.
+
+    The operations modify the rows in-place (like the `Dataset` methods with `inplace=True`), unless `deep_copy=True`.
+    Each method returns a new stream having the additional operation, and a stream can only be consumed once.
+
+    Usage:
+    ```
+    stream = (
+        AsyncDatasetStream(fetch_rows(), chunk_size=500)
+        .filter_rows(func=col("status") == "active")
+        .compute_field(field="profile", func=fetch_profile, concurrency=10)
+        .drop_duplicates(subset=["id"])
+    )
+    dataset = await stream.to_dataset()
+    ```
+    """
+
+    def __init__(
+            self,
+            rows: Union[AsyncIterable[Dict[str, Any]], Iterable[Dict[str, Any]]],
+            /,
+            *,
+            chunk_size: Optional[int] = 1000,
+            max_pending_chunks: Optional[int] = 4,
+            deep_copy: Optional[bool] = False,
+        ) -> None:
+        """
+        Parameters:
+            - rows (AsyncIterable | Iterable): The source of the rows (dictionaries).
+            - chunk_size (int): Number of rows per chunk.
+            - max_pending_chunks (int): Maximum number of chunks waiting between 2 consecutive stages of the pipeline.
+            - deep_copy (bool): If `deep_copy=True`, creates a deep-copy of each chunk read from the source, so that
+            the rows of the source are never modified.
+        """
+        assert checks.is_positive_integer(chunk_size), "Param `chunk_size` must be a positive integer"
+        assert checks.is_positive_integer(max_pending_chunks), "Param `max_pending_chunks` must be a positive integer"
+        self._rows = rows
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks
+        self.deep_copy = deep_copy
+        self._transforms: List[ChunkTransform] = []
+        self._is_consumed = [False]  # Shared by the streams derived from the same source
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(chunk_size={self.chunk_size}, max_pending_chunks={self.max_pending_chunks},"
+            f" num_stages={len(self._transforms)})"
+        )
+
+    def _with_transform(self, transform: ChunkTransform, /) -> AsyncDatasetStream:
+        stream = self.__class__.__new__(self.__class__)
+        stream.__dict__.update(self.__dict__)
+        stream._transforms = self._transforms + [transform]
+        return stream
+
+    def filter_rows(self, *, func: Union[Callable[[Dict[str, Any]], bool], Expression]) -> AsyncDatasetStream:
+        """Keeps the rows for which `func` returns `True` (refer `Dataset.filter_rows()`)"""
+        return self._with_transform(_make_filter_transform(func))
+
+    def compute_field(
+            self,
+            *,
+            field: str,
+            func: Union[Callable[[Dict[str, Any]], Any], Expression],
+            concurrency: Optional[int] = 1,
+        ) -> AsyncDatasetStream:
+        """
+        Stores the result of `func` in the key `field` of each row (refer `Dataset.compute_field()`).
+        The `func` can also be an async function (or return an awaitable), in which case at most `concurrency` results
+        are awaited at the same time.
+        """
+        assert checks.is_valid_object_of_type(field, type_=str, allow_empty=False), "Param `field` must be a non-empty string"
+        assert checks.is_positive_integer(concurrency), "Param `concurrency` must be a positive integer"
+        return self._with_transform(_make_compute_transform(field, func, concurrency=concurrency))
+
+    def drop_fields(self, *, fields: List[str]) -> AsyncDatasetStream:
+        """Drops the given fields (if they exist)"""
+        assert checks.is_list_of_instances_of_type(fields, type_=str, allow_empty=False), (
+            "Param `fields` must be a non-empty list of strings"
+        )
+        return self._with_transform(_make_drop_fields_transform(list(fields)))
+
+    def drop_duplicates(
+            self,
+            *,
+            subset: Optional[List[str]] = None,
+            mode: Literal["exact", "bloom"] = "exact",
+            window: Optional[int] = None,
+        ) -> AsyncDatasetStream:
+        """
+        Drops the rows that are duplicates of earlier rows of the stream, keeping the first occurrence of each row.
+        Refer `slupy.data_wrangler.deduplication.StreamDeduplicator` for the parameters.
+        """
+        deduplicator = StreamDeduplicator(subset=subset, mode=mode, window=window)
+        return self._with_transform(_make_deduplicate_transform(deduplicator))
+
+    async def iter_chunks(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Runs the pipeline, and yields the non-empty chunks of rows that come out of it"""
+        assert not self._is_consumed[0], "The stream has already been consumed"
+        self._is_consumed[0] = True
+        queues = [asyncio.Queue(maxsize=self.max_pending_chunks) for _ in range(len(self._transforms) + 1)]
+        tasks = [
+            asyncio.create_task(
+                _read_chunks(self._rows, queues[0], chunk_size=self.chunk_size, deep_copy=self.deep_copy),
+            ),
+        ]
+        for transform, input_queue, output_queue in zip(self._transforms, queues, queues[1:]):
+            tasks.append(asyncio.create_task(_run_stage(transform, input_queue, output_queue)))
+        try:
+            while True:
+                chunk = await queues[-1].get()
+                if isinstance(chunk, _EndOfStream):
+                    return
+                if isinstance(chunk, _StageFailure):
+                    raise chunk.error
+                yield chunk
+        finally:
+            # Also stops the pipeline when the consumer stops early (or fails)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        async for chunk in self.iter_chunks():
+            for row in chunk:
+                yield row
+
+    async def to_dataset(self) -> Dataset:
+        """Runs the pipeline, and returns a `Dataset` having all the rows that come out of it"""
+        rows: List[Dict[str, Any]] = []
+        async for chunk in self.iter_chunks():
+            rows.extend(chunk)
+        return Dataset(rows)
+
+    async def to_sink(self, sink: Callable[[List[Dict[str, Any]]], Any], /) -> int:
+        """
+        Runs the pipeline, and passes each chunk of rows that comes out of it to the given `sink` (eg: a function that
+        writes the rows to a database). The `sink` can also be an async function, which is awaited for each chunk
+        (meanwhile, the pipeline keeps preparing the next chunks, up to its bounded queues). Returns the number of rows
+        passed to the `sink`.
+        """
+        num_rows = 0
+        async for chunk in self.iter_chunks():
+            result = sink(chunk)
+            if inspect.isawaitable(result):
+                await result
+            num_rows += len(chunk)
+        return num_rows
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from slupy.core import checks
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class TraceEvent:
+    """
+    Record of one call of a traced operation.
+
+    Attributes:
+        - operation (str): Qualified name of the operation (eg: 'Dataset.filter_rows').
+        - start_time (float): Value of `time.perf_counter()` (in seconds) when the operation started.
+        - wall_time (float): Elapsed time (in seconds).
+        - cpu_time (float): CPU time of the process (in seconds).
+        - rows_in (int): Number of rows of the dataset on which the operation was called.
+        - rows_out (int): Number of rows of the dataset returned by the operation (if it returns a dataset).
+        - copied (bool): Is `True` if the operation returned a new dataset, `False` if it returned the same dataset
+        (if it returns a dataset).
+        - peak_memory_delta (int): Peak memory allocated during the operation (in bytes), over the memory allocated
+        before it. Only available if memory tracking is enabled.
+        - depth (int): Nesting level of the operation (0 for operations that are not called by another traced operation).
+        - thread_id (int): Identifier of the thread that called the operation.
+        - error (str): Type of the exception raised by the operation (if any).
+    """
+
+    operation: str
+    start_time: float
+    wall_time: float
+    cpu_time: float
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    copied: Optional[bool] = None
+    peak_memory_delta: Optional[int] = None
+    depth: int = 0
+    thread_id: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class TraceSink:
+    """Base class of the destinations of trace events"""
+
+    def record(self, event: TraceEvent, /) -> None:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Called when the tracing context (that uses this sink) exits"""
+        pass
+
+
+class InMemorySink(TraceSink):
+    """Keeps the trace events in the list `events`"""
+
+    def __init__(self) -> None:
+        self.events: List[TraceEvent] = []
+
+    def record(self, event: TraceEvent, /) -> None:
+        self.events.append(event)
+
+
+class LoggingSink(TraceSink):
+    """Logs each trace event"""
+
+    def __init__(self, *, logger_: Optional[logging.Logger] = None, level: Optional[int] = logging.INFO) -> None:
+        self.logger = logger_ or logger
+        self.level = level
+
+    def record(self, event: TraceEvent, /) -> None:
+        self.logger.log(
+            self.level,
+            "%s%s took %.6fs (cpu: %.6fs) | rows: %s -> %s | copied: %s | peak memory delta: %s bytes%s",
+            "  " * event.depth,
+            event.operation,
+            event.wall_time,
+            event.cpu_time,
+            event.rows_in,
+            event.rows_out,
+            event.copied,
+            event.peak_memory_delta,
+            f" | error: {event.error}" if event.error else "",
+        )
+
+
+class ChromeTraceSink(TraceSink):
+    """
+    Writes the trace events to a JSON file as per the Chrome trace-event format, when the tracing context exits.
+    The file can be opened in `chrome://tracing` or https://ui.perfetto.dev
+    """
+
+    def __init__(self, *, filepath: str) -> None:
+        self.filepath = filepath
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, event: TraceEvent, /) -> None:
+        args = event.to_dict()
+        for key in ("operation", "start_time", "wall_time", "thread_id"):
+            args.pop(key)
+        chrome_event = {
+            "name": event.operation,
+            "cat": "slupy",
+            "ph": "X",
+            "ts": event.start_time * 1e6,
+            "dur": event.wall_time * 1e6,
+            "pid": os.getpid(),
+            "tid": event.thread_id,
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(chrome_event)
+
+    def close(self) -> None:
+        with open(file=self.filepath, mode="w") as fp:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, fp)
+
+
+@dataclass
+class Tracer:
+    sinks: List[TraceSink] = field(default_factory=list)
+    track_memory: bool = False
+
+    def record(self, event: TraceEvent, /) -> None:
+        for sink in self.sinks:
+            sink.record(event)
+
+
+_active_tracers: ContextVar[Tuple[Tracer, ...]] = ContextVar("slupy_active_tracers", default=())
+_open_frames: ContextVar[Tuple[List[int], ...]] = ContextVar("slupy_open_frames", default=())
+
+
+@contextmanager
+def trace_operations(
+        *,
+        sinks: List[TraceSink],
+        track_memory: Optional[bool] = False,
+    ) -> Iterator[Tracer]:
+    """
+    Context manager that traces the operations (public methods of `Dataset`) called within it, and sends a `TraceEvent`
+    per call to each of the given sinks. Tracing is disabled outside this context, where it adds no measurable overhead.
+
+    Parameters:
+        - sinks (List[TraceSink]): Eg: `InMemorySink()`, `LoggingSink()`, `ChromeTraceSink(filepath=...)`.
+        - track_memory (bool): If `track_memory=True`, measures the peak memory of each operation via `tracemalloc`
+        (which slows down the traced code considerably).
+
+    Usage:
+    ```
+    sink = InMemorySink()
+    with trace_operations(sinks=[sink]):
+        dataset.filter_rows(func=...).order_by(fields=[...], ascending=[...])
+    print(sink.events)
+    ```
+    """
+    assert checks.is_list_of_instances_of_type(sinks, type_=TraceSink, allow_empty=False), (
+        "Param `sinks` must be a non-empty list of trace sinks"
+    )
+    tracer = Tracer(sinks=sinks, track_memory=bool(track_memory))
+    started_tracemalloc = False
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracemalloc = True
+    token = _active_tracers.set(_active_tracers.get() + (tracer,))
+    try:
+        yield tracer
+    finally:
+        _active_tracers.reset(token)
+        if started_tracemalloc:
+            tracemalloc.stop()
+        for sink in sinks:
+            sink.close()
+
+
+def _call_traced(
+        func: Callable[..., Any],
+        tracers: Tuple[Tracer, ...],
+        instance: Any,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+    track_memory = any(tracer.track_memory for tracer in tracers) and tracemalloc.is_tracing()
+    open_frames = _open_frames.get()
+    frame = [0]  # peak memory (absolute) of the nested operations
+    token = _open_frames.set(open_frames + (frame,))
+    memory_before = 0
+    if track_memory:
+        memory_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    rows_in = len(instance) if hasattr(instance, "__len__") else None
+    error = None
+    result = None
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    try:
+        result = func(instance, *args, **kwargs)
+        return result
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        wall_time = time.perf_counter() - start
+        cpu_time = time.process_time() - cpu_start
+        _open_frames.reset(token)
+        peak_memory_delta = None
+        if track_memory:
+            peak_memory = max(tracemalloc.get_traced_memory()[1], frame[0])
+            peak_memory_delta = max(peak_memory - memory_before, 0)
+            if open_frames:  # the peak of the enclosing operation must account for this operation
+                open_frames[-1][0] = max(open_frames[-1][0], peak_memory)
+        returns_dataset = type(result) is type(instance)
+        event = TraceEvent(
+            operation=func.__qualname__,
+            start_time=start,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            rows_in=rows_in,
+            rows_out=len(result) if returns_dataset else None,
+            copied=(result is not instance) if returns_dataset else None,
+            peak_memory_delta=peak_memory_delta,
+            depth=len(open_frames),
+            thread_id=threading.get_ident(),
+            error=error,
+        )
+        for tracer in tracers:
+            tracer.record(event)
+
+
+def traced(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator that traces the decorated method when called within `trace_operations()`"""
+    @functools.wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        tracers = _active_tracers.get()
+        if not tracers:
+            return func(self, *args, **kwargs)
+        return _call_traced(func, tracers, self, args, kwargs)
+    return wrapper
+
+
+def trace_public_methods(cls: Type[T]) -> Type[T]:
+    """Class decorator that applies `traced` to each public method (not to properties, class-methods or static-methods)"""
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attribute):
+            continue
+        setattr(cls, name, traced(attribute))
+    return cls
@@ -0,0 +1,64 @@
+import pickle
+import unittest
+
+from slupy.data_wrangler.aggregations import AGGREGATORS, get_aggregator
+
+
+def aggregate(agg, values):
+    aggregator = get_aggregator(agg)
+    state = aggregator.create()
+    for value in values:
+        state = aggregator.update(state, value)
+    return aggregator.finalize(state)
+
+
+def aggregate_in_2_parts(agg, values, split_at):
+    aggregator = get_aggregator(agg)
+    states = []
+    for part in (values[:split_at], values[split_at:]):
+        state = aggregator.create()
+        for value in part:
+            state = aggregator.update(state, value)
+        states.append(state)
+    return aggregator.finalize(aggregator.merge(*states))
+
+
+class TestAggregations(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.values = [4, None, 1, 7, None, 3]
+
+    def test_aggregators(self):
+        self.assertEqual(aggregate("size", self.values), 6)
+        self.assertEqual(aggregate("count", self.values), 4)
+        self.assertEqual(aggregate("sum", self.values), 15)
+        self.assertEqual(aggregate("mean", self.values), 3.75)
+        self.assertEqual(aggregate("min", self.values), 1)
+        self.assertEqual(aggregate("max", self.values), 7)
+        self.assertEqual(aggregate("first", self.values), 4)
+        self.assertEqual(aggregate("last", self.values), 3)
+        self.assertEqual(aggregate("list", self.values), self.values)
+        self.assertEqual(aggregate(len, self.values), 6)
+        self.assertEqual(aggregate("mean", [None]), None)
+        self.assertEqual(aggregate("first", []), None)
+
+    def test_merge(self):
+        for name in AGGREGATORS:
+            for split_at in range(len(self.values) + 1):
+                self.assertEqual(
+                    aggregate_in_2_parts(name, self.values, split_at),
+                    aggregate(name, self.values),
+                    msg=f"Aggregator '{name}' (split at {split_at})",
+                )
+
+    def test_pickle(self):
+        for name, aggregator in AGGREGATORS.items():
+            state = aggregator.create()
+            self.assertEqual(pickle.loads(pickle.dumps(state)), state, msg=f"Aggregator '{name}'")
+            self.assertIsInstance(pickle.loads(pickle.dumps(aggregator)), type(aggregator))
+
+    def test_invalid(self):
+        with self.assertRaises(AssertionError):
+            get_aggregator("median")
+        with self.assertRaises(AssertionError):
+            get_aggregator(123)
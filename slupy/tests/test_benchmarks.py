@@ -0,0 +1,67 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from slupy.benchmarks.__main__ import main
+from slupy.benchmarks.generators import generate_rows, get_field_names
+from slupy.benchmarks.suite import (
+    compute_scaling_exponent,
+    find_regressions,
+    load_timings,
+    run_benchmarks,
+    save_timings,
+)
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_generate_rows(self):
+        rows = generate_rows(num_rows=200, num_fields=6, cardinality=3, null_rate=0.5, seed=1)
+        self.assertEqual(rows, generate_rows(num_rows=200, num_fields=6, cardinality=3, null_rate=0.5, seed=1))
+        self.assertEqual(list(rows[0].keys()), get_field_names(num_fields=6))
+        self.assertEqual(get_field_names(num_fields=6), ["id", "category_1", "integer_2", "decimal_3", "text_4", "category_5"])
+        self.assertLessEqual(len({row["category_1"] for row in rows}), 4)  # 3 categories and None
+        num_nulls = sum(row["integer_2"] is None for row in rows)
+        self.assertTrue(50 < num_nulls < 150)
+        self.assertTrue(all(row["id"] is not None for row in rows))
+
+    def test_compute_scaling_exponent(self):
+        self.assertAlmostEqual(compute_scaling_exponent({10: 1.0, 100: 10.0, 1000: 100.0}), 1.0)
+        self.assertAlmostEqual(compute_scaling_exponent({10: 1.0, 100: 100.0}), 2.0)
+        self.assertIsNone(compute_scaling_exponent({10: 1.0}))
+
+    def test_find_regressions(self):
+        baseline = {"a": {100: 1.0, 1000: 0.0001}, "b": {100: 1.0}}
+        timings = {"a": {100: 1.3, 1000: 1.0}, "b": {100: 1.1}, "c": {100: 5.0}}
+        regressions = find_regressions(timings=timings, baseline=baseline, threshold=0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("a (100 rows)"))
+
+    def test_run_and_save(self):
+        timings = run_benchmarks(sizes=[50, 100], names=["copy", "drop_duplicates"], repeat=1)
+        self.assertEqual(set(timings.keys()), {"copy", "drop_duplicates"})
+        self.assertEqual(set(timings["copy"].keys()), {50, 100})
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, "baseline.json")
+            save_timings(timings, filepath=filepath)
+            self.assertEqual(load_timings(filepath=filepath), timings)
+
+        with self.assertRaises(AssertionError):
+            run_benchmarks(sizes=[10], names=["benchmark-that-does-not-exist"])
+
+    def test_all_benchmarks_run(self):
+        timings = run_benchmarks(sizes=[30], repeat=1)
+        self.assertTrue(all(30 in timings_by_size for timings_by_size in timings.values()))
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, "baseline.json")
+            with redirect_stdout(io.StringIO()):
+                exit_code = main(["--sizes", "20", "--repeat", "1", "--benchmarks", "copy", "--save-baseline", filepath])
+            self.assertEqual(exit_code, 0)
+            save_timings({"copy": {20: 0.0}}, filepath=filepath)
+            with redirect_stdout(io.StringIO()):
+                exit_code = main(["--sizes", "20", "--repeat", "1", "--benchmarks", "copy", "--baseline", filepath])
+            self.assertEqual(exit_code, 0)  # baselines under 1 millisecond are ignored
@@ -0,0 +1,73 @@
+from datetime import date
+import unittest
+
+from slupy.data_wrangler.columnar import decode_column, decode_rows, encode_rows, get_packed_size, pack, unpack
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestColumnar(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {
+                "id": idx,
+                "score": idx / 4,
+                "flag": idx % 2 == 0,
+                "team": f"team-{idx % 3}",
+                "name": f"name-{idx}" if idx % 5 else None,
+                "count": idx % 7 if idx % 4 else None,
+                "when": date(2020, 1, 1 + idx % 28),
+                "tags": [idx],
+            }
+            for idx in range(100)
+        ]
+
+    def test_encode_rows(self):
+        header, buffers = encode_rows(self.rows)
+        kinds = {field: column["kind"] for field, column in zip(header["fields"], header["columns"])}
+        self.assertEqual(
+            kinds,
+            {
+                "id": "int64",
+                "score": "float64",
+                "flag": "bool",
+                "team": "category",
+                "name": "str",
+                "count": "int64",
+                "when": "category",
+                "tags": "object",
+            },
+        )
+        self.assertEqual(decode_rows(header, buffers), self.rows)
+        self.assertEqual(decode_column(header, buffers, field="name"), [row["name"] for row in self.rows])
+
+    def test_encode_rows_keeps_types(self):
+        rows = [{"a": value} for value in [1, True, 1.0, None, 1, "1"]]
+        decoded_rows = decode_rows(*encode_rows(rows))
+        self.assertEqual([type(row["a"]) for row in decoded_rows], [type(row["a"]) for row in rows])
+        rows = [{"a": "\ud800 é"}, {"a": ""}, {"a": "x"}]
+        self.assertEqual(decode_rows(*encode_rows(rows)), rows)
+        rows = [{"a": 2 ** 70}, {"a": 1}]
+        self.assertEqual(decode_rows(*encode_rows(rows)), rows)
+
+    def test_encode_records(self):
+        schema = Schema(("a", "b"))
+        records = [Record(schema, [idx, str(idx)]) for idx in range(10)]
+        decoded_records = decode_rows(*encode_rows(records))
+        self.assertTrue(all(isinstance(record, Record) for record in decoded_records))
+        self.assertEqual(decoded_records, records)
+
+    def test_rows_that_cannot_be_encoded(self):
+        self.assertIsNone(encode_rows([]))
+        self.assertIsNone(encode_rows([{"a": 1}, {"b": 1}]))
+        self.assertIsNone(encode_rows([{"a": 1, "b": 2}, {"b": 2, "a": 1}]))
+        self.assertIsNone(encode_rows([{"a": 1}, Record(Schema(("a",)), [1])]))
+        self.assertEqual(decode_rows(*encode_rows([{}, {}])), [{}, {}])
+
+    def test_pack_and_unpack(self):
+        header, buffers = encode_rows(self.rows)
+        target = bytearray(get_packed_size(header, buffers))
+        pack(header, buffers, target=memoryview(target))
+        unpacked_header, unpacked_buffers = unpack(memoryview(target))
+        self.assertEqual(unpacked_header, header)
+        self.assertEqual(decode_rows(unpacked_header, unpacked_buffers), self.rows)
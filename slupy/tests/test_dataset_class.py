@@ -1,10 +1,18 @@
+from collections import Counter
+import copy
 from datetime import datetime
+from decimal import Decimal
+import os
+import pickle
+import tempfile
 from typing import Any, Dict, List
 import unittest
 import uuid
 
 from slupy.core.helpers import make_deep_copy
-from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.dataset import Dataset, DatasetView
+from slupy.data_wrangler.expressions import col
+from slupy.data_wrangler.records import Record
 
 
 class TestDataset(unittest.TestCase):
@@ -321,6 +329,73 @@ class TestDataset(unittest.TestCase):
 
         self._assert_list_data_is_unchanged()
 
+    def test_getitem_slice(self):
+        dataset = Dataset(self.list_data_1)
+
+        view = dataset[2:6]
+        self.assertIsInstance(view, DatasetView)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(view.data, dataset.data[2:6])
+        self.assertIs(view[0], dataset.data[2])
+        self.assertEqual(view[-1], dataset.data[5])
+        self.assertEqual(view[1:3].data, dataset.data[3:5])
+        self.assertEqual(dataset[::-2].data, dataset.data[::-2])
+        self.assertEqual(dataset[100:].data, [])
+        self.assertEqual(view.to_dataset().data, dataset.data[2:6])
+
+        with self.assertRaises(IndexError):
+            view[len(view)]
+
+        self._assert_list_data_is_unchanged()
+
+    def test_iter(self):
+        dataset = Dataset(self.list_data_1)
+        self.assertEqual(list(dataset), dataset.data)
+        self.assertEqual(list(dataset[1::3]), dataset.data[1::3])
+        self.assertEqual(list(dataset[-2:]), dataset.data[-2:])
+        self.assertEqual(list(dataset[:2]), dataset.data[:2])
+        self._assert_list_data_is_unchanged()
+
+    def test_iter_tuples(self):
+        dataset = Dataset(self.list_data_2)
+        self.assertEqual(
+            list(dataset.iter_tuples(fields=["text", "index"])),
+            [("AAA", 1), ("BBB", 4), ("CCC", 7)],
+        )
+        self.assertEqual(
+            list(dataset.iter_tuples(fields=["text"])),
+            [("AAA",), ("BBB",), ("CCC",)],
+        )
+        self.assertEqual(
+            list(dataset[1:].iter_tuples(fields=["number"])),
+            [(-1,), (45,)],
+        )
+
+        with self.assertRaises(KeyError):
+            list(dataset.iter_tuples(fields=["key-that-does-not-exist"]))
+
+        self._assert_list_data_is_unchanged()
+
+    def test_from_records(self):
+        records = [tuple(row.values()) for row in self.list_data_1]
+        dataset = Dataset.from_records(records, fields=["index", "text", "number"])
+        self.assertTrue(all(isinstance(row, Record) for row in dataset))
+        self.assertEqual(dataset.data, self.list_data_1)
+        self.assertEqual(
+            dataset.drop_duplicates(subset=["text"]).data,
+            Dataset(self.list_data_1).drop_duplicates(subset=["text"]).data,
+        )
+        self.assertEqual(
+            dataset.compute_field(field="index", func=lambda d: d["index"] + 100).get_values_by_field(field="index"),
+            list(range(101, 110)),
+        )
+        self.assertEqual(dataset.value_counts(), Dataset(self.list_data_1).value_counts())
+
+        with self.assertRaises(ValueError):
+            Dataset.from_records([(1, 2), (1, 2, 3)], fields=["a", "b"])
+
+        self._assert_list_data_is_unchanged()
+
     def test_find_duplicate_indices(self):
         dataset = Dataset(self.list_data_7)
         self.assertEqual(
@@ -1195,6 +1270,131 @@ class TestDataset(unittest.TestCase):
         self.assertEqual(result, result_expected)
         self._assert_list_data_is_unchanged()
 
+    def test_filter_rows_by_expression(self):
+        dataset = Dataset(self.list_data_1)
+        expression = (col("number") > 0) & col("text").isin({"AAA", "CCC"}) & (col("text") != "CCC")
+        result = dataset.filter_rows(func=expression).data
+        result_expected = dataset.filter_rows(
+            func=lambda d: d["number"] > 0 and d["text"] in {"AAA", "CCC"} and d["text"] != "CCC",
+        ).data
+        self.assertEqual(result, result_expected)
+        self.assertEqual(len(result), 3)
+        self.assertTrue(all(row_1 is not row_2 for row_1, row_2 in zip(result, dataset.data)))
+
+        dataset_encoded = dataset.encode_categoricals(fields=["text"])
+        self.assertEqual(dataset_encoded.filter_rows(func=expression).data, result_expected)
+        self.assertEqual(
+            dataset_encoded.filter_rows(func=(col("text") == "BBB")).get_values_by_field(field="index"),
+            [4, 5, 6],
+        )
+        self.assertEqual(
+            dataset_encoded.filter_rows(func=(col("text") == "ZZZ")).data,
+            [],
+        )
+
+        dataset_encoded.filter_rows(func=(col("text") != "AAA") & (col("number") > 0), inplace=True)
+        self.assertEqual(dataset_encoded.get_values_by_field(field="index"), [7, 8, 9])
+
+        with self.assertRaises(KeyError):
+            dataset.filter_rows(func=(col("key-that-does-not-exist") == 1))
+
+        self._assert_list_data_is_unchanged()
+
+    def test_compute_field_by_expression(self):
+        dataset = Dataset(self.list_data_1)
+        result = dataset.compute_field(field="total", func=col("index") * 100 + col("number"))
+        self.assertEqual(
+            result.get_values_by_field(field="total"),
+            [row["index"] * 100 + row["number"] for row in self.list_data_1],
+        )
+        self._assert_list_data_is_unchanged()
+
+    def test_expressions_with_non_finite_floats(self):
+        dataset = Dataset(self.list_data_1)
+        self.assertEqual(dataset.filter_rows(func=col("number") < float("inf")).data, self.list_data_1)
+        self.assertEqual(dataset.filter_rows(func=col("number") <= float("-inf")).data, [])
+        result = dataset.compute_field(field="bound", func=col("number") * 0 + float("-inf"))
+        self.assertEqual(result.get_values_by_field(field="bound"), [float("-inf")] * len(self.list_data_1))
+        self._assert_list_data_is_unchanged()
+
+    def test_filter_rows_batch(self):
+        dataset = Dataset(self.list_data_1)
+        batch_sizes = []
+
+        def func(rows):
+            batch_sizes.append(len(rows))
+            return [row["number"] > 0 for row in rows]
+
+        result = dataset.filter_rows_batch(func=func, batch_size=4).data
+        self.assertEqual(result, dataset.filter_rows(func=lambda d: d["number"] > 0).data)
+        self.assertEqual(batch_sizes, [4, 4, 1])
+
+        result = dataset.filter_rows_batch(
+            func=lambda columns: [text == "BBB" for text in columns["text"]],
+            batch_size=2,
+            columns=["text"],
+        )
+        self.assertEqual(result.get_values_by_field(field="index"), [4, 5, 6])
+
+        with self.assertRaises(AssertionError):
+            dataset.filter_rows_batch(func=lambda rows: [True], batch_size=2)
+
+        with self.assertRaises(AssertionError):
+            dataset.filter_rows_batch(func=lambda rows: [1] * len(rows), batch_size=2)
+
+        self.assertEqual(Dataset([]).filter_rows_batch(func=func, batch_size=2).data, [])
+        self._assert_list_data_is_unchanged()
+
+    def test_filter_rows_batch_inplace(self):
+        dataset = Dataset(self.list_data_1, deep_copy=True)
+        dataset.filter_rows_batch(func=lambda rows: [row["text"] == "CCC" for row in rows], batch_size=5, inplace=True)
+        self.assertEqual(dataset.get_values_by_field(field="index"), [7, 8, 9])
+        self._assert_list_data_is_unchanged()
+
+    def test_compute_fields(self):
+        dataset = Dataset(self.list_data_1)
+        result = dataset.compute_fields(funcs={
+            "index_plus_one": col("index") + 1,
+            "index_plus_two": lambda row: row["index_plus_one"] + 1,
+        })
+        self.assertEqual(
+            [(row["index_plus_one"], row["index_plus_two"]) for row in result],
+            [(row["index"] + 1, row["index"] + 2) for row in self.list_data_1],
+        )
+        self._assert_list_data_is_unchanged()
+        dataset.compute_fields(funcs={"index_negated": lambda row: -row["index"]}, inplace=True)
+        self.assertEqual(dataset.get_values_by_field(field="index_negated"), [-row["index"] for row in self.list_data_1])
+        result = dataset.compute_fields(funcs={"scaled": col("index") * float("inf"), "lower": col("index") - float("inf")})
+        self.assertEqual(
+            [(row["scaled"], row["lower"]) for row in result],
+            [(float("inf"), float("-inf"))] * len(self.list_data_1),  # the indices are positive
+        )
+        with self.assertRaises(AssertionError):
+            dataset.compute_fields(funcs={})
+        with self.assertRaises(AssertionError):
+            dataset.compute_fields(funcs={"a": 1})
+
+    def test_compute_field_batch(self):
+        dataset = Dataset(self.list_data_1)
+        result = dataset.compute_field_batch(
+            field="index",
+            func=lambda columns: [index + 100 for index in columns["index"]],
+            batch_size=2,
+            columns=["index"],
+        )
+        self.assertEqual(
+            result.data,
+            dataset.compute_field(field="index", func=lambda d: d["index"] + 100).data,
+        )
+
+        with self.assertRaises(KeyError):
+            dataset.compute_field_batch(field="x", func=lambda columns: columns["--index--"], batch_size=2, columns=["--index--"])
+
+        dataset_copy = Dataset(self.list_data_1, deep_copy=True)
+        dataset_copy.compute_field_batch(field="x", func=lambda rows: [len(rows)] * len(rows), batch_size=5, inplace=True)
+        self.assertEqual(dataset_copy.get_values_by_field(field="x"), [5, 5, 5, 5, 5, 4, 4, 4, 4])
+        self._assert_list_data_is_unchanged()
+
     def test_order_by(self):
         dataset = Dataset(self.list_data_5)
         dataset_ordered = dataset.order_by(fields=["number", "text"], ascending=[False, False])
@@ -1390,3 +1590,532 @@ class TestDataset(unittest.TestCase):
 
         self._assert_list_data_is_unchanged()
 
+    def test_encode_categoricals(self):
+        dataset = Dataset(self.list_data_7)
+        dataset_encoded = dataset.encode_categoricals(fields=["text", "number"])
+        self.assertEqual(dataset_encoded.data, self.list_data_7)
+
+        encoding = dataset_encoded.get_categorical_encoding(field="text")
+        self.assertEqual(encoding.categories, ["AAA", "BBB", "CCC", "DDD", "EEE"])
+        self.assertEqual(list(encoding.codes), [0, 0, 0, 0, 1, 1, 2, 3, 3, 3, 4])
+        self.assertEqual(encoding.get_code("DDD"), 3)
+        self.assertEqual(encoding.get_code("ZZZ"), -1)
+        self.assertTrue(all(row["text"] is encoding.categories[code] for row, code in zip(dataset_encoded, encoding.codes)))
+
+        self.assertEqual(dataset_encoded.value_counts(), dataset.value_counts())
+        self.assertEqual(
+            dataset_encoded.find_duplicate_indices(subset=["number", "text"]),
+            dataset.find_duplicate_indices(subset=["number", "text"]),
+        )
+        self.assertEqual(
+            dataset_encoded.find_duplicate_indices(subset=["text"], break_at="first"),
+            [[0, 1]],
+        )
+        self.assertEqual(
+            dataset_encoded.drop_duplicates(subset=["text"]).data,
+            dataset.drop_duplicates(subset=["text"]).data,
+        )
+
+        with self.assertRaises(AssertionError):
+            dataset_encoded.get_categorical_encoding(field="index")
+
+        self._assert_list_data_is_unchanged()
+
+    def test_encode_categoricals_inplace(self):
+        dataset = Dataset(self.list_data_7, deep_copy=True)
+        dataset.encode_categoricals(fields=["text"], inplace=True)
+        dataset.filter_rows(func=lambda row: row["number"] >= 4, inplace=True)
+        self.assertEqual(
+            dataset.get_categorical_encoding(field="text").categories,
+            ["DDD", "EEE"],
+        )
+        dataset.compute_field(field="text", func=lambda row: row["text"].lower(), inplace=True)
+        self.assertEqual(
+            dataset.value_counts()["text"],
+            {"ddd": 3, "eee": 1},
+        )
+        self._assert_list_data_is_unchanged()
+
+    def test_encode_categoricals_with_ragged_rows(self):
+        rows = [{"a": "x", "b": 1}, {"b": 2}, {"a": None, "b": 3}, {"a": "x", "b": 4}]
+        dataset = Dataset(rows, deep_copy=True)
+        dataset_encoded = dataset.encode_categoricals(fields=["a"])
+        self.assertEqual(dataset_encoded.data, rows)  # The field is not added to the rows that don't have it
+        encoding = dataset_encoded.get_categorical_encoding(field="a")
+        self.assertEqual(encoding.categories, ["x", None])
+        self.assertEqual(list(encoding.codes), [0, 1, 1, 0])
+        self.assertEqual(encoding.num_missing, 1)
+        self.assertEqual(dataset_encoded.value_counts(), dataset.value_counts())
+        self.assertEqual(dataset_encoded.value_counts()["a"], Counter({"x": 2, None: 2}))
+        with self.assertRaises(KeyError):
+            dataset_encoded.find_duplicate_indices(subset=["a"])
+        with self.assertRaises(KeyError):
+            dataset_encoded.filter_rows(func=col("a") == "x")
+
+    def test_pivot(self):
+        dataset = Dataset(self.list_data_5)
+        result = dataset.pivot(index=["text"], columns="number", values="number", agg="count", fill_value=0).data
+        self.assertEqual(
+            result,
+            [
+                {"text": None, "50": 1, "None": 0, "-1": 0, "20": 0, "5": 0},
+                {"text": "BBB", "50": 1, "None": 0, "-1": 1, "20": 1, "5": 0},
+                {"text": "AAA", "50": 1, "None": 0, "-1": 1, "20": 0, "5": 1},
+            ],
+        )
+
+        dataset = Dataset(self.list_data_7)
+        result = dataset.pivot(index=["number"], columns="text", values="index", agg="list").data
+        self.assertEqual(result[0], {"number": 1, "AAA": [1, 2, 3, 4], "BBB": None, "CCC": None, "DDD": None, "EEE": None})
+        self.assertEqual(len(result), 5)
+
+        result = dataset.pivot(index=["number", "text"], columns="text", values="index", agg=max).data
+        self.assertEqual(len(result), 5)
+
+        with self.assertRaises(AssertionError):
+            Dataset([{"a": "a", "b": 1}]).pivot(index=["a"], columns="a", values="b")
+
+        with self.assertRaises(AssertionError):
+            Dataset([{"a": 1, "b": 1}, {"a": "1", "b": 1}]).pivot(index=["b"], columns="a", values="b")
+
+        with self.assertRaises(KeyError):
+            dataset.pivot(index=["key-that-does-not-exist"], columns="text", values="index")
+
+        self._assert_list_data_is_unchanged()
+
+    def test_melt(self):
+        dataset = Dataset(self.list_data_2)
+        result = dataset.melt(id_fields=["index"], variable_field="field").data
+        self.assertEqual(
+            result,
+            [
+                {"index": 1, "field": "number", "value": 10},
+                {"index": 1, "field": "text", "value": "AAA"},
+                {"index": 4, "field": "number", "value": -1},
+                {"index": 4, "field": "text", "value": "BBB"},
+                {"index": 7, "field": "number", "value": 45},
+                {"index": 7, "field": "text", "value": "CCC"},
+            ],
+        )
+
+        result_pivoted = Dataset(result).pivot(index=["index"], columns="field", values="value")
+        self.assertEqual(
+            result_pivoted.reorder_fields(reordered_fields=["index", "text", "number"]).data,
+            self.list_data_2,
+        )
+
+        with self.assertRaises(KeyError):
+            dataset.melt(id_fields=["index"], value_fields=["key-that-does-not-exist"])
+
+        self._assert_list_data_is_unchanged()
+
+    def test_sample(self):
+        dataset = Dataset(self.list_data_7)
+
+        result = dataset.sample(n=4, seed=42)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result.data, dataset.sample(n=4, seed=42).data)
+        indices = result.get_values_by_field(field="index")
+        self.assertEqual(indices, sorted(indices))
+        self.assertTrue(all(row in self.list_data_7 for row in result))
+
+        self.assertEqual(len(dataset.sample(frac=0.5, seed=1)), 6)
+        self.assertEqual(dataset.sample(n=100).data, self.list_data_7)
+        self.assertEqual(dataset.sample(frac=0).data, [])
+
+        with self.assertRaises(AssertionError):
+            dataset.sample(n=1, frac=0.5)
+
+        with self.assertRaises(AssertionError):
+            dataset.sample(frac=1.5)
+
+        self._assert_list_data_is_unchanged()
+
+    def test_sample_stratified(self):
+        dataset = Dataset(self.list_data_7)
+
+        result = dataset.sample(n=2, seed=7, stratify_by=["text"])
+        self.assertEqual(
+            result.value_counts()["text"],
+            {"AAA": 2, "BBB": 2, "CCC": 1, "DDD": 2, "EEE": 1},
+        )
+        self.assertEqual(result.data, dataset.sample(n=2, seed=7, stratify_by=["text"]).data)
+
+        result = dataset.sample(frac=0.5, seed=7, stratify_by=["number", "text"])
+        self.assertEqual(
+            result.value_counts()["text"],
+            {"AAA": 2, "BBB": 1, "DDD": 2},
+        )
+
+        self._assert_list_data_is_unchanged()
+
+    def test_memory_usage(self):
+        dataset = Dataset(self.list_data_7)
+        usage = dataset.memory_usage()
+        self.assertEqual(sorted(usage.by_field.keys()), dataset.get_unique_fields())
+        self.assertGreater(usage.row_containers, 0)
+        self.assertGreater(usage.total, usage.row_containers)
+
+        dataset_compact = Dataset.from_records([tuple(row.values()) for row in self.list_data_7], fields=["index", "number", "text"])
+        self.assertLess(dataset_compact.memory_usage().row_containers, usage.row_containers)
+
+        self.assertTrue(dataset.memory_usage(sample_size=5).is_estimate)
+        self._assert_list_data_is_unchanged()
+
+
+    def test_find_near_duplicate_indices(self):
+        dataset = Dataset([
+            {"brand": "Apple", "title": "iPhone 13 (128GB) - Midnight"},
+            {"brand": "Samsung", "title": "Galaxy S21 Ultra 5G"},
+            {"brand": "apple", "title": "iphone 13, 128gb  midnight"},
+            {"brand": None, "title": "Galaxy S21 Ultra 5G"},
+            {"brand": "SAMSUNG", "title": "Galaxy S21 Ultra 5G!"},
+        ])
+        self.assertEqual(dataset.find_near_duplicate_indices(fields=["brand", "title"]), [[0, 2], [1, 4]])
+        self.assertEqual(dataset.find_near_duplicate_indices(fields=["title"]), [[0, 2], [1, 3, 4]])
+        with self.assertRaises(KeyError):
+            dataset.find_near_duplicate_indices(fields=["price"])
+
+    def test_null_counts(self):
+        dataset = Dataset(self.list_data_6)
+        self.assertEqual(dataset.null_counts(), {"a": 0, "b": 1, "c": 1})
+
+        dataset.fill_nulls(value=0, inplace=True)
+        self.assertEqual(set(dataset.null_counts().values()), {0})
+
+        dataset.data[0]["b"] = None
+        dataset.compute_field(field="b_copy", func=lambda row: row["b"], inplace=True)
+        self.assertEqual(dataset.null_counts()["b_copy"], 1)
+        self.assertEqual(len(dataset.drop_nulls(subset=["b_copy"])), len(dataset) - 1)
+
+    def test_null_stats_are_cached(self):
+        dataset = Dataset([{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+        self.assertEqual(dataset.null_counts(), {"a": 0, "b": 0})
+        null_stats = dataset._null_stats
+        data = dataset.data
+        self.assertIs(dataset.drop_nulls(inplace=True).data, data)  # no nulls, so nothing is rebuilt
+        self.assertIs(dataset.fill_nulls(value=0, inplace=True).data, data)
+        self.assertIs(dataset._null_stats, null_stats)
+        dataset.compute_field(field="c", func=lambda row: None, inplace=True)
+        self.assertEqual(dataset.null_counts(), {"a": 0, "b": 0, "c": 2})
+        self.assertIsNot(dataset._null_stats, null_stats)
+
+    def test_nulls_after_modifying_rows_outside_of_dataset(self):
+        dataset = Dataset([{"a": 1}, {"a": None}])
+        self.assertEqual(dataset.null_counts(), {"a": 1})
+        dataset[1]["a"] = 42
+        dataset[0]["a"] = None
+        dataset.data = dataset.data  # The cached null stats cannot see the modifications, so they're discarded
+        self.assertEqual(dataset.null_counts(), {"a": 1})
+        self.assertEqual(dataset.drop_nulls().data, [{"a": 42}])
+        dataset.fill_nulls(value=0, inplace=True)
+        self.assertEqual(dataset.data, [{"a": 0}, {"a": 42}])
+
+        dataset = Dataset([{"a": None}, {"a": 1}, {"a": 2}])
+        dataset.null_counts()
+        dataset.data.append({"a": None})  # The cached null stats are stale once the number of rows changes
+        self.assertEqual(dataset.null_counts(), {"a": 2})
+        self.assertEqual(dataset.drop_nulls().data, [{"a": 1}, {"a": 2}])
+
+    def test_drop_nulls_with_fields_missing_from_some_rows(self):
+        dataset = Dataset([{"a": 1, "b": None}, {"a": None}, {"a": 2, "b": 3}])
+        self.assertEqual(dataset.drop_nulls().data, [{"a": 2, "b": 3}])
+        self.assertEqual(dataset.drop_nulls(subset=["a"]).data, [{"a": 1, "b": None}, {"a": 2, "b": 3}])
+        self.assertEqual(dataset.fill_nulls(value=0).data, [{"a": 1, "b": 0}, {"a": 0}, {"a": 2, "b": 3}])
+        with self.assertRaises(KeyError):
+            Dataset([{"a": 1, "b": 2}, {"a": 2}]).drop_nulls(subset=["b"])
+        with self.assertRaises(KeyError):
+            Dataset([{"a": 1, "b": 2}, {"a": 2}]).fill_nulls(value=0, subset=["b"])
+
+    def test_group_by(self):
+        dataset = Dataset(self.list_data_7)
+        result = dataset.group_by(
+            fields=["text"],
+            aggregations={"count": ("index", "size"), "total": ("number", "sum"), "indices": ("index", "list")},
+        )
+        self.assertEqual(
+            result.data[0],
+            {"text": "AAA", "count": 4, "total": 4, "indices": [1, 2, 3, 4]},
+        )
+        self.assertEqual(len(result), len(set(row["text"] for row in self.list_data_7)))
+        self.assertEqual(
+            dataset.group_by(
+                fields=["number", "text"],
+                aggregations={"count": ("index", "size")},
+                num_workers=2,
+                strategy="shuffle",
+                min_rows_per_worker=1,
+            ).data,
+            dataset.group_by(fields=["number", "text"], aggregations={"count": ("index", "size")}).data,
+        )
+        with self.assertRaises(AssertionError):
+            dataset.group_by(fields=["text"], aggregations={"text": ("index", "size")})
+        with self.assertRaises(KeyError):
+            dataset.group_by(fields=["missing"], aggregations={"count": ("index", "size")})
+        self._assert_list_data_is_unchanged()
+
+    def test_shared_memory(self):
+        dataset = Dataset(self.list_data_7)
+        with dataset.to_shared_memory() as segment:
+            self.assertEqual(Dataset.attach_shared_memory(segment.name).data, self.list_data_7)
+        self.assertTrue(segment.is_released)
+        with self.assertRaises(FileNotFoundError):
+            Dataset.attach_shared_memory(segment.name)
+
+        dataset = Dataset.from_records([(1, "a"), (2, None)], fields=["number", "text"])
+        with dataset.to_shared_memory() as segment:
+            attached_dataset = Dataset.attach_shared_memory(segment.name)
+            self.assertTrue(all(isinstance(row, Record) for row in attached_dataset))
+            self.assertEqual(attached_dataset.data, dataset.data)
+        self._assert_list_data_is_unchanged()
+
+    def test_encoded_fields_compare_like_the_values(self):
+        list_data = [{"x": 1}, {"x": True}, {"x": 1.0}, {"x": float("nan")}, {"x": "1"}]
+        dataset = Dataset(list_data)
+        encoded_dataset = dataset.encode_categoricals(fields=["x"])
+        self.assertEqual(encoded_dataset.value_counts(), dataset.value_counts())
+        self.assertEqual(encoded_dataset.value_counts()["x"][1], 3)
+        self.assertEqual(
+            encoded_dataset.find_duplicate_indices(subset=["x"]),
+            dataset.find_duplicate_indices(subset=["x"]),
+        )
+        self.assertEqual(encoded_dataset.find_duplicate_indices(subset=["x"]), [[0, 1, 2]])
+        self.assertEqual(Dataset(list_data[:3]).encode_categoricals(fields=["x"]).find_duplicate_indices(subset=["x"]), [[0, 1, 2]])
+
+    def test_pickle(self):
+        list_data = [{"index": idx, "score": idx / 2, "text": f"text-{idx % 3}"} for idx in range(100)]
+        dataset = Dataset(list_data).encode_categoricals(fields=["text"])
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            unpickled_dataset = pickle.loads(pickle.dumps(dataset, protocol=protocol))
+            self.assertIsNotNone(unpickled_dataset._pending_columns)  # rows are decoded lazily
+            self.assertEqual(len(unpickled_dataset), 100)
+            self.assertEqual(unpickled_dataset.data, list_data)
+            self.assertIsNone(unpickled_dataset._pending_columns)
+            self.assertEqual(unpickled_dataset._categorical_fields, ["text"])
+
+        buffers = []
+        pickled_dataset = pickle.dumps(dataset, protocol=5, buffer_callback=buffers.append)
+        self.assertGreater(len(buffers), 0)
+        self.assertLess(len(pickled_dataset), sum(memoryview(buffer).nbytes for buffer in buffers))
+        unpickled_dataset = pickle.loads(pickled_dataset, buffers=buffers)
+        repickled_dataset = pickle.loads(pickle.dumps(unpickled_dataset))  # without decoding the rows
+        self.assertEqual(repickled_dataset.data, list_data)
+        self.assertEqual(unpickled_dataset.data, list_data)
+
+        for list_data in [[{"a": 1}, {"b": 2}], [{"a": "text", "b": [1]}], []]:  # pickled as usual
+            unpickled_dataset = pickle.loads(pickle.dumps(Dataset(list_data)))
+            self.assertIsNone(unpickled_dataset._pending_columns)
+            self.assertEqual(unpickled_dataset.data, list_data)
+
+        dataset = Dataset.from_records([(1, "a"), (2, None)], fields=["number", "text"])
+        unpickled_dataset = pickle.loads(pickle.dumps(dataset))
+        self.assertIsNotNone(unpickled_dataset._pending_columns)
+        self.assertEqual(unpickled_dataset.data, dataset.data)
+        self.assertTrue(all(isinstance(row, Record) for row in unpickled_dataset))
+
+    def test_copy(self):
+        dataset = pickle.loads(pickle.dumps(Dataset(self.list_data_1)))
+        deep_copy = dataset.copy()
+        self.assertEqual(deep_copy.data, self.list_data_1)
+        self.assertIsNot(deep_copy.data[0], dataset.data[0])
+        self.assertIsNot(copy.deepcopy(dataset).data[0], dataset.data[0])
+        shallow_copy = copy.copy(dataset)
+        self.assertIs(shallow_copy.data, dataset.data)
+
+    def test_fingerprints(self):
+        dataset = Dataset([{"a": 1, "b": "x"}, {"b": "x", "a": 1.0}, {"a": 2, "b": "y"}])
+        fingerprints = dataset.fingerprints()
+        self.assertEqual(len(fingerprints), 3)
+        self.assertEqual(fingerprints[0], fingerprints[1])
+        self.assertNotEqual(fingerprints[0], fingerprints[2])
+        self.assertEqual(dataset.fingerprints(subset=["b"], algorithm="builtin"), [hash("x"), hash("x"), hash("y")])
+        # Cached until the rows are modified via the `Dataset` methods
+        self.assertIs(dataset._fingerprints[(None, "blake2b")], dataset._fingerprints[(None, "blake2b")])
+        fingerprints.clear()
+        self.assertEqual(len(dataset.fingerprints()), 3)
+        dataset.compute_field(field="b", func=lambda row: row["a"], inplace=True)
+        self.assertEqual(dataset._fingerprints, {})
+        self.assertEqual(len(set(dataset.fingerprints())), 2)
+        dataset.data = [{"a": 1}]
+        self.assertEqual(len(dataset.fingerprints()), 1)
+        with self.assertRaises(AssertionError):
+            dataset.fingerprints(algorithm="md5")
+
+    def test_add_fingerprint_field(self):
+        list_data = [{"a": 1, "b": "x"}, {"a": 1, "b": "y"}, {"a": 2, "b": "x"}]
+        dataset = Dataset(list_data)
+        result = dataset.add_fingerprint_field(field="key", subset=["a"])
+        self.assertEqual(result[0]["key"], result[1]["key"])
+        self.assertNotEqual(result[0]["key"], result[2]["key"])
+        self.assertNotIn("key", list_data[0])
+        self.assertEqual(result.drop_duplicates(subset=["key"]).get_values_by_field(field="b"), ["x", "x"])
+        dataset.add_fingerprint_field(field="key", inplace=True)
+        self.assertEqual(len({row["key"] for row in list_data}), 3)
+
+    def test_find_duplicate_indices_with_unhashable_values(self):
+        dataset = Dataset([{"a": [1], "b": 1}, {"a": [2], "b": 1}, {"a": [1], "b": 1.0}, {"a": [1], "b": True}])
+        self.assertEqual(dataset.find_duplicate_indices(), [[0, 2, 3]])
+        self.assertEqual(dataset.find_duplicate_indices(subset=["b"]), [[0, 1, 2, 3]])
+        self.assertEqual(dataset.find_duplicate_indices(subset=["a"], break_at="first"), [[0, 2]])
+        with self.assertRaises(KeyError):
+            dataset.find_duplicate_indices(subset=["c"])
+
+    def test_find_duplicate_indices_with_decimals(self):
+        dataset = Dataset([{"a": [Decimal("1.0")]}, {"a": [1]}, {"a": [Decimal("1.5")]}, {"a": [1.5]}, {"a": [2]}])
+        self.assertEqual(dataset.find_duplicate_indices(), [[0, 1], [2, 3]])
+        self.assertEqual(dataset.drop_duplicates().data, [{"a": [Decimal("1.0")]}, {"a": [Decimal("1.5")]}, {"a": [2]}])
+
+    def test_result_cache(self):
+        dataset = Dataset([{"a": 2, "b": "x"}, {"a": 1, "b": "y"}]).enable_result_cache(maxsize=8)
+        self.assertEqual(dataset.get_unique_fields(), ["a", "b"])
+        dataset.get_unique_fields().append("c")
+        self.assertEqual(dataset.get_unique_fields(), ["a", "b"])
+        self.assertEqual(dataset.value_counts()["b"], Counter({"x": 1, "y": 1}))
+        dataset.value_counts()["b"]["z"] = 1
+        self.assertEqual(dataset.value_counts()["b"], Counter({"x": 1, "y": 1}))
+        dataset.get_datatypes_by_field()["a"].add(str)
+        self.assertEqual(dataset.get_datatypes_by_field(), {"a": {int}, "b": {str}})
+        ordered = dataset.order_by(fields=["a"], ascending=[True])
+        ordered.data.reverse()
+        self.assertEqual(dataset.order_by(fields=["a"], ascending=[True]).get_values_by_field(field="a"), [1, 2])
+        self.assertEqual(dataset.order_by(fields=["a"], ascending=[False]).get_values_by_field(field="a"), [2, 1])
+        stats = dataset.get_result_cache_stats()
+        self.assertEqual((stats.misses, stats.size), (5, 5))
+        self.assertGreaterEqual(stats.hits, 6)
+        # Modifications via the `Dataset` methods (or assigning the rows) discard the cached results
+        dataset.compute_field(field="c", func=lambda row: 1, inplace=True)
+        self.assertEqual(dataset.get_unique_fields(), ["a", "b", "c"])
+        dataset.data = [{"d": 1}]
+        self.assertEqual(dataset.get_unique_fields(), ["d"])
+        dataset.data.append({"e": 1})
+        self.assertEqual(dataset.get_unique_fields(), ["d", "e"])
+        dataset.data[0]["f"] = 1  # Not seen by the cache, until it's cleared
+        self.assertEqual(dataset.get_unique_fields(), ["d", "e"])
+        dataset.clear_result_cache()
+        self.assertEqual(dataset.get_unique_fields(), ["d", "e", "f"])
+        self.assertEqual(dataset.copy().get_result_cache_stats().size, 0)
+        dataset.disable_result_cache()
+        with self.assertRaises(AssertionError):
+            dataset.get_result_cache_stats()
+        with self.assertRaises(AssertionError):
+            dataset.enable_result_cache(maxsize=0)
+
+    def test_to_sqlite(self):
+        list_data = [{"a": 1, "b": "x", "c": True}, {"a": 2, "b": None, "c": False}, {"a": 3, "b": "z"}]
+        with tempfile.TemporaryDirectory() as dirpath:
+            path = os.path.join(dirpath, "data.db")
+            with Dataset(list_data).to_sqlite(path, "rows") as sqlite_dataset:
+                self.assertEqual(len(sqlite_dataset), 3)
+                self.assertEqual(sqlite_dataset.filter_rows(func=col("b") == "z").to_dataset().data, [{"a": 3, "b": "z", "c": None}])
+            self.assertEqual(
+                Dataset.from_sqlite(path, "SELECT a, c FROM rows WHERE b IS NOT NULL ORDER BY a DESC").data,
+                [{"a": 3, "c": None}, {"a": 1, "c": True}],
+            )
+
+    def test_flatten_and_unflatten(self):
+        list_data = [
+            {"id": 1, "user": {"name": "a", "scores": {"x": 1, "y": 2}}},
+            {"id": 2, "user": {"name": "b", "scores": {"x": 3, "y": 4}}},
+        ]
+        dataset = Dataset(list_data)
+        dataset_flattened = dataset.flatten()
+        self.assertEqual(
+            dataset_flattened.data,
+            [
+                {"id": 1, "user.name": "a", "user.scores.x": 1, "user.scores.y": 2},
+                {"id": 2, "user.name": "b", "user.scores.x": 3, "user.scores.y": 4},
+            ],
+        )
+        self.assertEqual(
+            dataset.flatten(sep="/", max_depth=1).data[0],
+            {"id": 1, "user/name": "a", "user/scores": {"x": 1, "y": 2}},
+        )
+        self.assertIsNot(dataset.flatten(max_depth=1).data[0]["user.scores"], list_data[0]["user"]["scores"])
+        self.assertEqual(dataset_flattened.unflatten().data, list_data)
+        self.assertEqual(dataset.data, list_data)
+        dataset_flattened.unflatten(inplace=True)
+        self.assertEqual(dataset_flattened.data, list_data)
+        dataset_of_records = Dataset.from_records([(1, {"x": 1, "y": 2})], fields=["id", "scores"])
+        self.assertEqual(dataset_of_records.flatten().data, [{"id": 1, "scores.x": 1, "scores.y": 2}])
+        self.assertEqual(dataset_of_records.flatten().unflatten().data, [{"id": 1, "scores": {"x": 1, "y": 2}}])
+        with self.assertRaises(AssertionError):
+            dataset.flatten(sep="")
+        with self.assertRaises(AssertionError):
+            dataset.unflatten(max_depth=0)
+
+    def test_resample(self):
+        list_data = [
+            {"at": datetime(2024, 1, 1, 10, 15), "amount": 10},
+            {"at": datetime(2024, 1, 1, 10, 45), "amount": 20},
+            {"at": datetime(2024, 1, 1, 12, 5), "amount": 5},
+        ]
+        result = Dataset(list_data).resample(
+            time_field="at",
+            offset_kwargs={"hours": 1},
+            aggregations={"total": ("amount", "sum"), "average": ("amount", "mean")},
+            origin=datetime(2024, 1, 1),
+            include_empty_buckets=True,
+        )
+        self.assertEqual(
+            result.data,
+            [
+                {"at": datetime(2024, 1, 1, 10), "total": 30, "average": 15},
+                {"at": datetime(2024, 1, 1, 11), "total": 0, "average": None},
+                {"at": datetime(2024, 1, 1, 12), "total": 5, "average": 5},
+            ],
+        )
+        with self.assertRaises(AssertionError):
+            Dataset(list_data).resample(time_field="at", offset_kwargs={"hours": 1, "minutes": 30}, aggregations={"n": ("amount", "size")})
+        with self.assertRaises(AssertionError):
+            Dataset(list_data).resample(time_field="at", offset_kwargs={"quarters": 1}, aggregations={"n": ("amount", "size")})
+        with self.assertRaises(AssertionError):
+            Dataset(list_data).resample(time_field="at", offset_kwargs={"hours": 1}, aggregations={"at": ("amount", "size")})
+
+    def test_upsert(self):
+        list_data = [{"id": 1, "name": "a", "price": 10}, {"id": 2, "name": "b", "price": 20}]
+        rows = [{"id": 2, "price": 21}, {"id": 3, "name": "c", "price": 30}]
+        dataset = Dataset(make_deep_copy(list_data))
+        self.assertEqual(
+            dataset.upsert(rows, key=["id"]).data,
+            [{"id": 1, "name": "a", "price": 10}, {"id": 2, "price": 21}, {"id": 3, "name": "c", "price": 30}],
+        )
+        self.assertEqual(dataset.data, list_data)
+        self.assertEqual(
+            dataset.upsert(rows, key=["id"], on_conflict="update_fields").data,
+            [{"id": 1, "name": "a", "price": 10}, {"id": 2, "name": "b", "price": 21}, {"id": 3, "name": "c", "price": 30}],
+        )
+        self.assertEqual(dataset.upsert(Dataset(rows), key=["id"], on_conflict="keep").data, list_data + rows[1:])
+
+        # The index is kept up-to-date by the in-place upserts and filters
+        dataset.upsert(rows, key=["id"], inplace=True)
+        dataset.filter_rows(func=col("id") != 1, inplace=True)
+        dataset.upsert([{"id": 3, "name": "C", "price": 31}, {"id": 4, "name": "d", "price": 40}], key=["id"], inplace=True)
+        self.assertEqual(
+            dataset.data,
+            [{"id": 2, "price": 21}, {"id": 3, "name": "C", "price": 31}, {"id": 4, "name": "d", "price": 40}],
+        )
+        dataset.compute_field(field="id", func=lambda row: row["id"] * 10, inplace=True)  # discards the index
+        dataset.upsert([{"id": 20, "price": 0}], key=["id"], inplace=True)
+        self.assertEqual(dataset.get_values_by_field(field="price"), [0, 31, 40])
+
+        with self.assertRaises(ValueError):
+            Dataset([{"id": 1}, {"id": 1}]).upsert([], key=["id"])
+        with self.assertRaises(KeyError):
+            Dataset(list_data).upsert([{"name": "z"}], key=["id"])
+        with self.assertRaises(AssertionError):
+            Dataset(list_data).upsert(rows, key=["id"], on_conflict="merge")
+
+    def test_diff(self):
+        old_dataset = Dataset(self.list_data_1)
+        list_data = make_deep_copy(self.list_data_1)
+        list_data[0]["number"] = -1
+        removed_row = list_data.pop(1)
+        list_data.append({"index": 100, "text": "ZZZ", "number": 0})
+        result = old_dataset.diff(Dataset(list_data), key=["index"], compare=["text", "number"])
+        self.assertEqual(result.added, [{"index": 100, "text": "ZZZ", "number": 0}])
+        self.assertEqual(result.removed, [removed_row])
+        self.assertEqual([(change.key, change.changes) for change in result.changed], [(1, {"number": (10, -1)})])
+        self.assertEqual(result.num_unchanged, len(self.list_data_1) - 2)
+        with self.assertRaises(AssertionError):
+            old_dataset.diff(list_data, key=["index"])
+        self._assert_list_data_is_unchanged()
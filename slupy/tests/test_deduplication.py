@@ -0,0 +1,75 @@
+from hashlib import blake2b
+import unittest
+
+from slupy.data_wrangler.deduplication import (
+    BloomFilter,
+    ScalableBloomFilter,
+    StreamDeduplicator,
+    deduplicate_stream,
+)
+
+
+def _make_digest(item: int) -> bytes:
+    return blake2b(str(item).encode(), digest_size=16).digest()
+
+
+class TestDeduplication(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [{"id": idx, "key": idx % 100} for idx in range(1000)]
+
+    def test_bloom_filter(self):
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        num_already_present = sum(bloom_filter.add(_make_digest(item)) for item in range(1000))
+        self.assertLess(num_already_present, 10)
+        self.assertTrue(bloom_filter.add(_make_digest(0)))
+        self.assertTrue(all(_make_digest(item) in bloom_filter for item in range(1000)))
+        num_false_positives = sum(_make_digest(item) in bloom_filter for item in range(1000, 11_000))
+        self.assertLess(num_false_positives / 10_000, 0.03)
+
+    def test_scalable_bloom_filter(self):
+        bloom_filter = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        num_already_present = sum(bloom_filter.add(_make_digest(item)) for item in range(5000))
+        self.assertLess(num_already_present, 100)
+        self.assertGreater(len(bloom_filter.filters), 1)
+        self.assertTrue(all(_make_digest(item) in bloom_filter for item in range(5000)))
+        num_false_positives = sum(_make_digest(item) in bloom_filter for item in range(5000, 15_000))
+        self.assertLess(num_false_positives / 10_000, 0.02)
+
+    def test_exact_mode(self):
+        deduplicator = StreamDeduplicator(subset=["key"])
+        rows = list(deduplicator.filter(iter(self.rows)))
+        self.assertEqual(rows, self.rows[:100])
+        self.assertEqual(deduplicator.get_stats()["num_duplicates"], 900)
+        self.assertEqual(deduplicator.num_fingerprints, 100)
+        self.assertEqual(list(deduplicate_stream(self.rows)), self.rows)
+        self.assertEqual(list(deduplicate_stream(self.rows + self.rows[:5])), self.rows)
+
+    def test_bloom_mode(self):
+        rows = list(deduplicate_stream(self.rows, subset=["key"], mode="bloom"))
+        self.assertEqual(rows, self.rows[:100])
+        rows = list(deduplicate_stream(self.rows + self.rows, mode="bloom", error_rate=0.0001))
+        self.assertEqual(rows, self.rows)
+
+    def test_window(self):
+        rows = [{"key": key} for key in [1, 2, 1, 3, 4, 5, 1, 1]]
+        self.assertEqual(
+            list(deduplicate_stream(rows, window=3)),
+            [{"key": 1}, {"key": 2}, {"key": 3}, {"key": 4}, {"key": 5}, {"key": 1}],
+        )
+        deduplicator = StreamDeduplicator(subset=["key"], window=10)
+        list(deduplicator.filter(self.rows))
+        self.assertLessEqual(deduplicator.num_fingerprints, 10)
+
+        deduplicator = StreamDeduplicator(subset=["id"], mode="bloom", window=100, initial_capacity=10, error_rate=1e-5)
+        self.assertEqual(len(list(deduplicator.filter(self.rows + self.rows))), 2000)  # all duplicates are expired
+        self.assertLessEqual(deduplicator.num_fingerprints, 100)
+
+    def test_ttl(self):
+        rows = [{"key": "a", "time": 0}, {"key": "a", "time": 5}, {"key": "b", "time": 6}, {"key": "a", "time": 20}]
+        for mode in ["exact", "bloom"]:
+            deduplicator = StreamDeduplicator(subset=["key"], mode=mode, ttl=10, get_timestamp=lambda row: row["time"])
+            self.assertEqual([row["time"] for row in deduplicator.filter(rows)], [0, 6, 20])
+
+        with self.assertRaises(AssertionError):
+            StreamDeduplicator(get_timestamp=lambda row: row["time"])
@@ -0,0 +1,55 @@
+import unittest
+
+from slupy.data_wrangler.diffing import MISSING, diff_rows, get_field_changes
+
+
+class TestDiffing(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.old_rows = [
+            {"id": 1, "name": "a", "price": 10},
+            {"id": 2, "name": "b", "price": 20},
+            {"id": 3, "name": "c", "price": 30},
+            {"id": 4, "name": "d", "price": 40},
+        ]
+        self.new_rows = [
+            {"id": 5, "name": "e", "price": 50},
+            {"id": 4, "name": "d", "price": 41},
+            {"id": 2, "name": "b", "price": 20},
+            {"id": 1, "name": "A", "price": 10},
+        ]
+
+    def test_diff_rows(self):
+        result = diff_rows(self.old_rows, self.new_rows, key=["id"])
+        self.assertTrue(result.has_changes)
+        self.assertEqual(result.added, [{"id": 5, "name": "e", "price": 50}])
+        self.assertEqual(result.removed, [{"id": 3, "name": "c", "price": 30}])
+        self.assertEqual([change.key for change in result.changed], [1, 4])
+        self.assertEqual(result.changed[0].changes, {"name": ("a", "A")})
+        self.assertEqual(result.changed[1].changes, {"price": (40, 41)})
+        self.assertIs(result.changed[1].new_row, self.new_rows[1])
+        self.assertEqual(result.num_unchanged, 1)
+
+    def test_diff_rows_by_compared_fields(self):
+        result = diff_rows(self.old_rows, self.new_rows, key=["id", "name"], compare=["price"])
+        self.assertEqual([row["id"] for row in result.added], [5, 1])
+        self.assertEqual([row["id"] for row in result.removed], [1, 3])
+        self.assertEqual(len(result.changed), 1)
+        self.assertEqual(result.changed[0].key, (4, "d"))
+        self.assertEqual(result.num_unchanged, 1)
+        self.assertFalse(diff_rows(self.old_rows, self.old_rows, key=["id"]).has_changes)
+
+    def test_duplicate_keys(self):
+        with self.assertRaises(ValueError):
+            diff_rows(self.old_rows + self.old_rows[:1], self.new_rows, key=["id"])
+        with self.assertRaises(ValueError):
+            diff_rows(self.old_rows, self.new_rows + self.new_rows[-1:], key=["id"])
+        with self.assertRaises(KeyError):
+            diff_rows(self.old_rows, self.new_rows, key=["missing"])
+
+    def test_get_field_changes(self):
+        self.assertEqual(
+            get_field_changes({"a": 1, "b": 2}, {"a": 1.0, "c": None}),
+            {"b": (2, MISSING), "c": (MISSING, None)},
+        )
+        self.assertEqual(get_field_changes({"a": 1, "b": 2}, {"a": 2, "b": 3}, fields=["b"]), {"b": (2, 3)})
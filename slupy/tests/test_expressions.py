@@ -0,0 +1,69 @@
+import unittest
+
+from slupy.data_wrangler.expressions import col, compile_assignments, get_string_lookup, lit
+
+
+class TestExpressions(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {"a": 1, "b": 10, "status": "paid"},
+            {"a": 2, "b": 20, "status": "failed"},
+            {"a": 3, "b": None, "status": "refunded"},
+        ]
+
+    def test_compile(self):
+        self.assertEqual((col("a") + col("b") * 2).compile()(self.rows[0]), 21)
+        self.assertEqual((100 - col("a")).compile()(self.rows[1]), 98)
+        self.assertEqual((-col("a") ** 2).compile()(self.rows[2]), -9)
+        self.assertEqual((col("a") / 2 + lit(0.5)).compile()(self.rows[0]), 1.0)
+        self.assertEqual((col("a") // 2 + col("a") % 2).compile()(self.rows[2]), 2)
+        self.assertTrue(((col("a") >= 2) & (col("a") < 3)).compile()(self.rows[1]))
+        self.assertTrue(((col("a") == 1) | (col("a") != 1)).compile()(self.rows[2]))
+        self.assertTrue((~(col("a") <= 1)).compile()(self.rows[1]))
+        self.assertTrue(col("b").is_null().compile()(self.rows[2]))
+        self.assertTrue(col("b").is_not_null().compile()(self.rows[0]))
+        self.assertTrue(col("a").isin([[1], 2]).compile()(self.rows[1]))  # unhashable values
+
+        with self.assertRaises(KeyError):
+            col("c").compile()(self.rows[0])
+
+    def test_compile_filter_and_values(self):
+        expression = (col("a") > 1) & col("status").isin({"paid", "refunded"})
+        self.assertEqual(expression.compile_filter()(self.rows), [self.rows[2]])
+        self.assertEqual((col("a") * 10).compile_values()(self.rows), [10, 20, 30])
+        self.assertEqual((col("a") == lit(float("nan"))).compile_filter()(self.rows), [])  # constants that are not literals
+        self.assertEqual(expression.get_fields(), {"a", "status"})
+        self.assertEqual(len(expression.get_conjuncts()), 2)
+
+    def test_compile_assignments(self):
+        assign = compile_assignments({
+            "c": col("a") * 10,
+            "d": lambda row: row["c"] + 1,  # uses the field set before it
+            "e": col("status").isin({"paid"}) | (col("d") > 30),
+        })
+        assign(self.rows)
+        self.assertEqual([(row["c"], row["d"], row["e"]) for row in self.rows], [(10, 11, True), (20, 21, False), (30, 31, True)])
+        compile_assignments({"f": col("a") * float("inf"), "g": lambda row: -row["f"]})(self.rows)
+        self.assertEqual([(row["f"], row["g"]) for row in self.rows], [(float("inf"), float("-inf"))] * 3)
+
+    def test_non_finite_float_literals(self):
+        self.assertEqual((col("a") < float("inf")).compile_filter()(self.rows), self.rows)
+        self.assertEqual((col("a") > float("-inf")).compile_filter()(self.rows), self.rows)
+        self.assertEqual((col("a") * float("inf")).compile_values()(self.rows), [float("inf")] * 3)
+        self.assertEqual((col("a") - lit(float("-inf"))).compile()(self.rows[0]), float("inf"))
+
+    def test_no_truth_value(self):
+        with self.assertRaises(TypeError):
+            bool(col("a") > 1)
+
+        with self.assertRaises(TypeError):
+            1 < col("a") < 3
+
+    def test_get_string_lookup(self):
+        self.assertEqual(get_string_lookup(col("status") == "paid"), ("status", {"paid"}, False))
+        self.assertEqual(get_string_lookup("paid" != col("status")), ("status", {"paid"}, True))
+        self.assertEqual(get_string_lookup(col("status").isin({"a", "b"})), ("status", {"a", "b"}, False))
+        self.assertIsNone(get_string_lookup(col("status") == 1))
+        self.assertIsNone(get_string_lookup(col("status") > "a"))
+        self.assertIsNone(get_string_lookup(col("status").isin({"a", 1})))
@@ -0,0 +1,112 @@
+from datetime import datetime
+from decimal import Decimal
+from fractions import Fraction
+import subprocess
+import sys
+import unittest
+
+from slupy.data_wrangler.fingerprints import (
+    canonical_encode,
+    compute_fingerprint,
+    compute_fingerprints,
+    encode_row,
+    encode_rows,
+)
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestFingerprints(unittest.TestCase):
+
+    def test_equal_values_have_equal_encodings(self):
+        self.assertEqual(canonical_encode(1), canonical_encode(1.0))
+        self.assertEqual(canonical_encode(1), canonical_encode(True))
+        self.assertEqual(canonical_encode({"a": 1, "b": [1, 2]}), canonical_encode({"b": [1, 2], "a": 1}))
+        self.assertEqual(canonical_encode({1, 2, 3}), canonical_encode(frozenset([3, 2, 1])))
+        self.assertEqual(
+            canonical_encode(Record(Schema(("a", "b")), [1, "x"])),
+            canonical_encode({"b": "x", "a": 1}),
+        )
+
+    def test_equal_numbers_of_other_types_have_equal_encodings(self):
+        self.assertEqual(canonical_encode(Decimal("1.0")), canonical_encode(1))
+        self.assertEqual(canonical_encode(Decimal("1")), canonical_encode(1))
+        self.assertEqual(canonical_encode(Fraction(2, 2)), canonical_encode(1))
+        self.assertEqual(canonical_encode(Decimal("0.50")), canonical_encode(0.5))
+        self.assertEqual(canonical_encode(Fraction(1, 2)), canonical_encode(0.5))
+        self.assertEqual(canonical_encode(Decimal("0.1")), canonical_encode(Fraction(1, 10)))
+        self.assertNotEqual(canonical_encode(Decimal("0.1")), canonical_encode(0.1))  # as `Decimal("0.1") != 0.1`
+        self.assertEqual(canonical_encode(Decimal("-Infinity")), canonical_encode(float("-inf")))
+        self.assertEqual(canonical_encode([Decimal("2.00"), {"a": Decimal("1")}]), canonical_encode([2, {"a": 1}]))
+        self.assertEqual(
+            compute_fingerprints([{"a": Decimal("1.0"), "b": Decimal("2.5")}, {"a": 1, "b": 2.5}], algorithm="blake2b"),
+            compute_fingerprints([{"a": 1, "b": 2.5}, {"a": 1.0, "b": Fraction(5, 2)}], algorithm="blake2b"),
+        )
+        self.assertEqual(compute_fingerprint({"a": Decimal("1")}), compute_fingerprint({"a": 1}))
+        self.assertEqual(
+            compute_fingerprints([{"a": Decimal("1.0")}, {"a": 1}]),
+            compute_fingerprints([{"a": 1}, {"a": 1}]),
+        )
+
+    def test_different_values_have_different_encodings(self):
+        values = [
+            None, 0, 1, 1.5, "1", "", b"1", [1], (1,), [[1]], {"1": 1}, {1: "1"}, {1},
+            ["a", "b"], ["a,b"], ["ab", ""], datetime(2020, 1, 1), "2020-01-01",
+        ]
+        encodings = [canonical_encode(value) for value in values]
+        self.assertEqual(len(set(encodings)), len(values))
+
+    def test_encode_row(self):
+        row = {"a": 1, "b": None, "c": "x"}
+        self.assertEqual(encode_row(row, subset=["c", "a"]), canonical_encode("x") + canonical_encode(1))
+        self.assertEqual(encode_row(row), canonical_encode(row))
+        with self.assertRaises(KeyError):
+            encode_row(row, subset=["d"])
+
+    def test_encode_rows(self):
+        rows = [
+            {"a": 1, "b": "x"}, {"b": True, "a": 1.0}, {"a": [1], "b": None}, {1: 2}, {}, {"a": 1.5, "b": {"c": 2}},
+            Record(Schema(("a", "b")), [1, "x"]), {"a": True, "b": None}, {"a": None, "b": 2},
+        ]
+        self.assertEqual(encode_rows(rows), [encode_row(row) for row in rows])
+        self.assertEqual(encode_rows(rows[:2]), [encode_row(row) for row in rows[:2]])
+        self.assertEqual(encode_rows([{}, {}]), ["d0{}", "d0{}"])
+        subset_rows = [row for row in rows if "a" in row]
+        self.assertEqual(encode_rows(subset_rows, subset=["b", "a"]), [encode_row(row, subset=["b", "a"]) for row in subset_rows])
+        with self.assertRaises(KeyError):
+            encode_rows(rows, subset=["a"])
+
+    def test_compute_fingerprints(self):
+        rows = [
+            {"a": 1, "b": "x"}, {"b": "x", "a": 1.0}, {"a": [1], "b": None}, {}, {"a": 2.5, "b": None},
+            Record(Schema(("a", "b")), [True, "x"]),
+        ]
+        for algorithm in ["blake2b", "builtin"]:
+            fingerprints = compute_fingerprints(rows, algorithm=algorithm)
+            self.assertEqual(fingerprints, [compute_fingerprint(row, algorithm=algorithm) for row in rows])
+            self.assertEqual(fingerprints[0], fingerprints[1])
+            self.assertEqual(fingerprints[0], fingerprints[5])
+            self.assertEqual(
+                compute_fingerprints(rows[:3], subset=["b"], algorithm=algorithm),
+                [compute_fingerprint(row, subset=["b"], algorithm=algorithm) for row in rows[:3]],
+            )
+        with self.assertRaises(KeyError):
+            compute_fingerprints(rows, subset=["a"], algorithm="builtin")
+
+    def test_compute_fingerprint(self):
+        row = {"a": 1, "b": [1, {"c": None}], "d": datetime(2020, 1, 1)}
+        fingerprint = compute_fingerprint(row)
+        self.assertIsInstance(fingerprint, bytes)
+        self.assertEqual(len(fingerprint), 16)
+        self.assertEqual(fingerprint, compute_fingerprint(dict(reversed(list(row.items())))))
+        self.assertNotEqual(fingerprint, compute_fingerprint(row, subset=["a"]))
+        self.assertIsInstance(compute_fingerprint(row, algorithm="builtin"), int)
+        with self.assertRaises(ValueError):
+            compute_fingerprint(row, algorithm="md5")
+
+    def test_fingerprint_is_stable_across_processes(self):
+        code = (
+            "from slupy.data_wrangler.fingerprints import compute_fingerprint;"
+            "print(compute_fingerprint({'a': 'text', 'b': [1, 2.5]}).hex())"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), compute_fingerprint({"a": "text", "b": [1, 2.5]}).hex())
@@ -0,0 +1,74 @@
+import unittest
+
+from slupy.data_wrangler.flattening import flatten_rows, unflatten_rows
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestFlattening(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {"id": 1, "user": {"name": "a", "address": {"city": "x", "zip": 1}}, "tags": ["t1"], "meta": {}},
+            {"id": 2, "user": {"name": "b", "address": {"city": "y", "zip": 2}}, "tags": [], "meta": {}},
+            {"id": 3, "user": {"name": "c", "address": None}, "tags": [], "meta": {"k": 1}},  # different shape
+            {"id": 4, "user": {"name": "d", "address": {"city": "z", "zip": 4}}, "tags": [], "meta": {}},
+        ]
+
+    def test_flatten_rows(self):
+        result = flatten_rows(self.rows)
+        self.assertEqual(
+            result[0],
+            {"id": 1, "user.name": "a", "user.address.city": "x", "user.address.zip": 1, "tags": ["t1"], "meta": {}},
+        )
+        self.assertEqual(list(result[0]), ["id", "user.name", "user.address.city", "user.address.zip", "tags", "meta"])
+        self.assertEqual(result[2], {"id": 3, "user.name": "c", "user.address": None, "tags": [], "meta.k": 1})
+        self.assertEqual(result[3]["user.address.city"], "z")
+        self.assertIs(result[0]["tags"], self.rows[0]["tags"])
+        self.assertEqual(self.rows[0]["user"]["address"], {"city": "x", "zip": 1})  # The rows are not modified
+
+    def test_flatten_rows_with_max_depth(self):
+        result = flatten_rows(self.rows, sep="__", max_depth=1)
+        self.assertEqual(
+            result[0],
+            {"id": 1, "user__name": "a", "user__address": {"city": "x", "zip": 1}, "tags": ["t1"], "meta": {}},
+        )
+        self.assertEqual(flatten_rows(self.rows[:1], max_depth=2), flatten_rows(self.rows[:1]))
+
+    def test_flatten_rows_with_changing_shapes(self):
+        rows = [{"a": {"b": 1}}, {"a": 2}, {"a": {"b": {"c": 3}}}, {"a": {"b": {}}}, {"a": {"b": 4}}, {"a": {"c": 5}}]
+        self.assertEqual(
+            flatten_rows(rows),
+            [{"a.b": 1}, {"a": 2}, {"a.b.c": 3}, {"a.b": {}}, {"a.b": 4}, {"a.c": 5}],
+        )
+        many_shapes = [{"a": {f"b{idx}": idx}} for idx in range(200)]
+        self.assertEqual(flatten_rows(many_shapes), [{f"a.b{idx}": idx} for idx in range(200)])
+
+    def test_flatten_rows_with_duplicate_keys(self):
+        with self.assertRaises(ValueError):
+            flatten_rows([{"a.b": 1, "a": {"b": 2}}])
+        self.assertEqual(flatten_rows([{"a.b": 1, "a": {"b": 2}}], max_depth=None, sep="_"), [{"a.b": 1, "a_b": 2}])
+
+    def test_flatten_and_unflatten_records(self):
+        schema = Schema(("id", "user"))
+        records = [Record(schema, [1, {"name": "a", "age": 30}]), Record(schema, [2, {"name": "b", "age": 40}])]
+        flattened_rows = flatten_rows(records)
+        self.assertEqual(
+            flattened_rows,
+            [{"id": 1, "user.name": "a", "user.age": 30}, {"id": 2, "user.name": "b", "user.age": 40}],
+        )
+        self.assertEqual(unflatten_rows(flattened_rows), [record.to_dict() for record in records])
+        flat_records = [Record(Schema(("id", "user.name")), [1, "a"])]
+        self.assertEqual(unflatten_rows(flat_records), [{"id": 1, "user": {"name": "a"}}])
+
+    def test_unflatten_rows(self):
+        self.assertEqual(unflatten_rows(flatten_rows(self.rows)), self.rows)
+        self.assertEqual(unflatten_rows([{"a.b.c": 1, "a.d": 2}], max_depth=1), [{"a": {"b.c": 1, "d": 2}}])
+        self.assertEqual(unflatten_rows([{"a": 1}, {"a.b": 2}]), [{"a": 1}, {"a": {"b": 2}}])
+        with self.assertRaises(ValueError):
+            unflatten_rows([{"a": 1, "a.b": 2}])
+        with self.assertRaises(ValueError):
+            unflatten_rows([{"a.b": 2, "a": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
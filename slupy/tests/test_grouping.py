@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+from slupy.data_wrangler.aggregations import get_aggregator
+from slupy.data_wrangler.grouping import aggregate_rows, finalize_groups, group_rows, merge_partial_states
+
+
+def _get_range(values):
+    return max(values) - min(values)
+
+
+class TestGrouping(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {"team": f"team-{idx % 7}", "player": idx % 3, "points": idx, "note": None if idx % 5 else "x"}
+            for idx in range(300)
+        ]
+        self.specs = [
+            (output_field, input_field, get_aggregator(agg))
+            for output_field, input_field, agg in [
+                ("num_rows", "points", "size"),
+                ("num_notes", "note", "count"),
+                ("total", "points", "sum"),
+                ("average", "points", "mean"),
+                ("lowest", "points", "min"),
+                ("highest", "points", "max"),
+                ("first_points", "points", "first"),
+                ("last_points", "points", "last"),
+                ("all_points", "points", "list"),
+            ]
+        ]
+
+    def test_aggregate_rows(self):
+        states_by_key, first_index_by_key = aggregate_rows(self.rows, fields=["team"], specs=self.specs[:3])
+        self.assertEqual(list(states_by_key.keys()), [f"team-{idx}" for idx in range(7)])
+        self.assertEqual(first_index_by_key["team-3"], 3)
+        self.assertEqual(states_by_key["team-0"][0], 43)
+
+    def test_merge_partial_states(self):
+        partial_1, _ = aggregate_rows(self.rows[:100], fields=["team", "player"], specs=self.specs)
+        partial_2, _ = aggregate_rows(self.rows[100:], fields=["team", "player"], specs=self.specs)
+        merged = merge_partial_states([partial_1, partial_2], specs=self.specs)
+        expected, _ = aggregate_rows(self.rows, fields=["team", "player"], specs=self.specs)
+        self.assertEqual(
+            finalize_groups(merged, fields=["team", "player"], specs=self.specs),
+            finalize_groups(expected, fields=["team", "player"], specs=self.specs),
+        )
+
+    def test_parallel_matches_serial(self):
+        for fields in [["team"], ["team", "player"], ["points"]]:
+            expected = group_rows(self.rows, fields=fields, specs=self.specs)
+            self.assertEqual(expected[0][fields[0]], self.rows[0][fields[0]])
+            for strategy in ["merge", "shuffle"]:
+                result = group_rows(
+                    self.rows,
+                    fields=fields,
+                    specs=self.specs,
+                    num_workers=3,
+                    strategy=strategy,
+                    min_rows_per_worker=10,
+                )
+                self.assertEqual(result, expected)
+
+    def test_concurrent_calls(self):
+        other_rows = [{"team": f"other-{idx % 4}", "points": 1} for idx in range(200)]
+        specs = self.specs[:1]
+
+        def group(rows):
+            return group_rows(rows, fields=["team"], specs=specs, num_workers=2, min_rows_per_worker=10)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(group, [self.rows, other_rows] * 2))
+        self.assertEqual(results[0], group_rows(self.rows, fields=["team"], specs=specs))
+        self.assertEqual(results[1], [{"team": f"other-{idx}", "num_rows": 50} for idx in range(4)])
+        self.assertEqual(results[2:], results[:2])
+
+    def test_callable_aggregator(self):
+        specs = [("points_range", "points", get_aggregator(_get_range))]
+        expected = group_rows(self.rows, fields=["team"], specs=specs)
+        self.assertEqual(expected[0], {"team": "team-0", "points_range": 294})
+        result = group_rows(self.rows, fields=["team"], specs=specs, num_workers=2, min_rows_per_worker=10)
+        self.assertEqual(result, expected)
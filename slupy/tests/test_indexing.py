@@ -0,0 +1,31 @@
+import unittest
+
+from slupy.data_wrangler.indexing import KeyIndex
+
+
+class TestIndexing(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {"region": "eu", "id": 1, "value": "a"},
+            {"region": "eu", "id": 2, "value": "b"},
+            {"region": "us", "id": 1, "value": "c"},
+        ]
+
+    def test_key_index(self):
+        key_index = KeyIndex(self.rows, fields=("region", "id"))
+        self.assertEqual(key_index.position_by_key, {("eu", 1): 0, ("eu", 2): 1, ("us", 1): 2})
+        self.assertEqual(key_index.num_rows, 3)
+        key_index.rebuild(self.rows[1:])
+        self.assertEqual(key_index.position_by_key, {("eu", 2): 0, ("us", 1): 1})
+        self.assertEqual(KeyIndex(self.rows, fields=("value",)).position_by_key, {"a": 0, "b": 1, "c": 2})
+
+    def test_key_index_with_invalid_keys(self):
+        with self.assertRaises(ValueError):
+            KeyIndex(self.rows, fields=("id",))
+        with self.assertRaises(KeyError):
+            KeyIndex(self.rows, fields=("missing",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import sys
+import unittest
+
+from slupy.data_wrangler.memory import compute_memory_usage, get_deep_size
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestMemory(unittest.TestCase):
+
+    def test_get_deep_size(self):
+        inner = [1.5, 2.5]
+        obj = {"a": inner, "b": inner}
+        size = get_deep_size(obj)
+        self.assertEqual(
+            size,
+            sum(sys.getsizeof(x) for x in [obj, "a", "b", inner, 1.5, 2.5]),
+        )
+        seen = set()
+        self.assertEqual(get_deep_size(inner, seen=seen), sum(sys.getsizeof(x) for x in [inner, 1.5, 2.5]))
+        self.assertEqual(get_deep_size(inner, seen=seen), 0)
+
+    def test_compute_memory_usage(self):
+        text = "some-text-that-is-shared"
+        rows = [{"text": text, "numbers": [float(idx)]} for idx in range(100)]
+        usage = compute_memory_usage(rows)
+        self.assertFalse(usage.is_estimate)
+        self.assertEqual(usage.by_field["text"], sys.getsizeof("text") + sys.getsizeof(text))
+        self.assertEqual(
+            usage.by_field["numbers"],
+            sys.getsizeof("numbers") + sum(sys.getsizeof(row["numbers"]) + sys.getsizeof(row["numbers"][0]) for row in rows),
+        )
+        self.assertEqual(usage.row_containers, sum(sys.getsizeof(row) for row in rows))
+        self.assertEqual(usage.list_container, sys.getsizeof(rows))
+        self.assertEqual(
+            usage.total,
+            sum(usage.by_field.values()) + usage.row_containers + usage.list_container,
+        )
+
+        usage_shallow = compute_memory_usage(rows, deep=False)
+        self.assertLess(usage_shallow.by_field["numbers"], usage.by_field["numbers"])
+
+        usage_estimated = compute_memory_usage(rows, sample_size=10)
+        self.assertTrue(usage_estimated.is_estimate)
+        self.assertEqual(usage_estimated.by_field["text"], usage.by_field["text"])
+        self.assertAlmostEqual(usage_estimated.by_field["numbers"] / usage.by_field["numbers"], 1, delta=0.05)
+        self.assertEqual(usage_estimated.row_containers, usage.row_containers)
+
+    def test_compute_memory_usage_of_records(self):
+        schema = Schema(("a", "b"))
+        records = [Record(schema, [idx, None]) for idx in range(1000, 1010)]
+        usage = compute_memory_usage(records)
+        self.assertEqual(usage.by_field["b"], sys.getsizeof("b") + sys.getsizeof(None))
+        self.assertGreater(usage.row_containers, sum(sys.getsizeof(record) for record in records))
@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+from slupy.data_wrangler import near_duplicates
+from slupy.data_wrangler.near_duplicates import (
+    MinHasher,
+    compute_jaccard_similarity,
+    compute_lsh_params,
+    find_near_duplicate_groups,
+    get_shingles,
+    normalize_text,
+)
+
+
+class TestNearDuplicates(unittest.TestCase):
+
+    def test_normalize_text(self):
+        self.assertEqual(normalize_text("  Apple iPhone-13,  128GB!! "), "apple iphone 13 128gb")
+        self.assertEqual(normalize_text(""), "")
+
+    def test_get_shingles(self):
+        self.assertEqual(len(get_shingles("abcd", size=3)), 2)
+        self.assertEqual(len(get_shingles("ab", size=3)), 1)
+        self.assertEqual(get_shingles("", size=3), set())
+        self.assertEqual(get_shingles("abab", size=2), get_shingles("aba", size=2))
+
+    def test_compute_jaccard_similarity(self):
+        self.assertEqual(compute_jaccard_similarity({1, 2, 3}, {2, 3, 4}), 0.5)
+        self.assertEqual(compute_jaccard_similarity(set(), set()), 1.0)
+        self.assertEqual(compute_jaccard_similarity({1}, set()), 0.0)
+
+    def test_min_hasher(self):
+        min_hasher = MinHasher(num_perm=256, seed=1)
+        shingles_1 = get_shingles(normalize_text("the quick brown fox jumps over the lazy dog"))
+        shingles_2 = get_shingles(normalize_text("the quick brown fox jumped over the lazy dog"))
+        signature_1 = min_hasher.signature(shingles_1)
+        signature_2 = min_hasher.signature(shingles_2)
+        self.assertEqual(len(signature_1), 256)
+        self.assertEqual(signature_1, MinHasher(num_perm=256, seed=1).signature(shingles_1))
+        estimate = sum(x == y for x, y in zip(signature_1, signature_2)) / 256
+        self.assertAlmostEqual(estimate, compute_jaccard_similarity(shingles_1, shingles_2), delta=0.1)
+
+    def test_compute_lsh_params(self):
+        bands, rows = compute_lsh_params(threshold=0.8, num_perm=128)
+        self.assertLessEqual(bands * rows, 128)
+        # Favouring recall uses more bands (of fewer rows), so that more pairs become candidates
+        bands_for_recall, rows_for_recall = compute_lsh_params(
+            threshold=0.8,
+            num_perm=128,
+            false_positive_weight=0.1,
+            false_negative_weight=0.9,
+        )
+        self.assertLessEqual(rows_for_recall, rows)
+        with self.assertRaises(AssertionError):
+            compute_lsh_params(threshold=1.5, num_perm=128)
+
+    def test_find_near_duplicate_groups(self):
+        texts = [
+            "Apple iPhone 13 (128GB) - Midnight",
+            "Samsung Galaxy S21 Ultra 5G",
+            "apple iphone 13, 128gb  midnight",
+            "Sony WH-1000XM4 Wireless Headphones",
+            "APPLE IPHONE 13 128GB MIDNIGHT!!",
+            "Samsung Galaxy S21 Ultra 5G ",
+            "Apple iPad Air",
+        ]
+        groups = find_near_duplicate_groups(texts, threshold=0.8)
+        self.assertEqual(groups, [[0, 2, 4], [1, 5]])
+        self.assertEqual(find_near_duplicate_groups(texts, threshold=1.0), [[0, 2, 4], [1, 5]])
+        self.assertEqual(find_near_duplicate_groups(texts, threshold=1.0, normalize=False), [])
+        self.assertEqual(find_near_duplicate_groups([], threshold=0.8), [])
+
+    def test_find_near_duplicate_groups_is_transitive(self):
+        texts = [
+            "abcdefghijklmnopqrstuvwxyz",
+            "abcdefghijklmnopqrstuvwxy",
+            "abcdefghijklmnopqrstuvwx",
+        ]
+        groups = find_near_duplicate_groups(texts, threshold=0.9, false_positive_weight=0.1, false_negative_weight=0.9)
+        self.assertEqual(groups, [[0, 1, 2]])
+        # The first and last texts are not similar enough on their own
+        self.assertEqual(find_near_duplicate_groups([texts[0], texts[2]], threshold=0.9), [])
+
+    def test_find_near_duplicate_groups_with_large_bucket(self):
+        base_text = "the quick brown fox jumps over the lazy dog while the cat sleeps on the warm mat " * 3
+        texts = [f"{base_text}{idx:04d}" for idx in range(1000)]
+        find = near_duplicates._DisjointSet.find
+        with mock.patch.object(
+            near_duplicates,
+            "compute_jaccard_similarity",
+            wraps=near_duplicates.compute_jaccard_similarity,
+        ) as compute_jaccard_similarity_, mock.patch.object(
+            near_duplicates._DisjointSet,
+            "find",
+            autospec=True,
+            side_effect=find,
+        ) as find_:
+            groups = find_near_duplicate_groups(texts, threshold=0.8)
+        self.assertEqual(groups, [list(range(1000))])
+        # Each text is verified against one representative (instead of every other text in the bucket), so the work
+        # grows linearly with the size of the bucket
+        self.assertLess(compute_jaccard_similarity_.call_count, 2 * len(texts))
+        self.assertLess(find_.call_count, 50 * len(texts))
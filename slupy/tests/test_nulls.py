@@ -0,0 +1,46 @@
+from itertools import compress
+import unittest
+
+from slupy.data_wrangler.nulls import bitmap_to_keep_mask, compute_null_stats
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestNulls(unittest.TestCase):
+
+    def test_compute_null_stats(self):
+        rows = [
+            {"a": 1, "b": None, "c": "x"},
+            {"a": None, "b": None},
+            {"a": 3, "b": 4, "c": None},
+            {"a": 4, "b": 5, "c": "y"},
+        ]
+        null_stats = compute_null_stats(rows)
+        self.assertEqual(null_stats.num_rows, 4)
+        self.assertEqual(null_stats.get_null_counts(), {"a": 1, "b": 2, "c": 1})
+        self.assertEqual(null_stats.fields, ["a", "b", "c"])
+        self.assertEqual(sorted(null_stats.fields_having_nulls), ["a", "b", "c"])
+        self.assertEqual(null_stats.get_null_indices("b"), [0, 1])
+        self.assertTrue(null_stats.is_field_in_all_rows("a"))
+        self.assertFalse(null_stats.is_field_in_all_rows("c"))
+        self.assertFalse(null_stats.is_field_in_all_rows("d"))
+        self.assertEqual(null_stats.get_bitmap("b"), 0b0011)
+        self.assertEqual(null_stats.get_bitmap("d"), 0)
+        self.assertEqual(null_stats.get_combined_bitmap(["a", "c"]), 0b0110)
+
+    def test_compute_null_stats_of_records(self):
+        schema = Schema(("a", "b"))
+        rows = [Record(schema, [1, None]), Record(schema, [None, None]), Record(schema, [3, 4])]
+        self.assertEqual(compute_null_stats(rows).get_null_counts(), {"a": 1, "b": 2})
+        self.assertEqual(compute_null_stats([]).get_null_counts(), {})
+
+    def test_bitmap_to_keep_mask(self):
+        self.assertEqual(list(bitmap_to_keep_mask(0b0101, num_rows=5)), [0, 1, 0, 1, 1])
+        self.assertEqual(list(compress("abcde", bitmap_to_keep_mask(0b10000, num_rows=5))), ["a", "b", "c", "d"])
+        self.assertEqual(bitmap_to_keep_mask(0, num_rows=0), b"")
+
+    def test_bitmap_of_many_rows(self):
+        rows = [{"a": None if idx % 1000 == 0 else idx} for idx in range(10_000)]
+        null_stats = compute_null_stats(rows)
+        mask = bitmap_to_keep_mask(null_stats.get_bitmap("a"), num_rows=len(rows))
+        self.assertEqual(len(mask), len(rows))
+        self.assertEqual(sum(mask), len(rows) - 10)
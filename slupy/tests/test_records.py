@@ -0,0 +1,56 @@
+import copy
+import pickle
+import unittest
+
+from slupy.data_wrangler.records import Record, Schema
+
+
+class TestRecord(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.schema = Schema(("a", "b", "c"))
+
+    def test_mapping_behaviour(self):
+        record = Record(self.schema, [1, "x", None])
+        self.assertEqual(record["a"], 1)
+        self.assertEqual(record.get("c", 5), None)
+        self.assertEqual(record.get("d", 5), 5)
+        self.assertEqual(list(record), ["a", "b", "c"])
+        self.assertEqual(len(record), 3)
+        self.assertTrue("b" in record)
+        self.assertTrue("d" not in record)
+        self.assertEqual(record, {"a": 1, "b": "x", "c": None})
+        self.assertEqual({"a": 1, "b": "x", "c": None}, record)
+        self.assertEqual({**record}, record.to_dict())
+
+        with self.assertRaises(KeyError):
+            record["d"]
+
+    def test_mutation_shares_schema(self):
+        record_1 = Record(self.schema, [1, 2, 3])
+        record_2 = Record(self.schema, [4, 5, 6])
+        record_1["d"] = 10
+        record_2["d"] = 20
+        self.assertIs(record_1.schema, record_2.schema)
+        self.assertEqual(record_1.to_dict(), {"a": 1, "b": 2, "c": 3, "d": 10})
+
+        record_1.pop("a")
+        record_2.pop("a")
+        self.assertIs(record_1.schema, record_2.schema)
+        self.assertEqual(record_2.to_dict(), {"b": 5, "c": 6, "d": 20})
+
+        record_2["b"] = 50
+        self.assertEqual(record_2["b"], 50)
+        self.assertEqual(record_1.setdefault("e"), None)
+        self.assertEqual(record_1["e"], None)
+
+    def test_copy_and_pickle(self):
+        record = Record(self.schema, [1, [2, 3], None])
+        record_deep_copy = copy.deepcopy(record)
+        self.assertEqual(record, record_deep_copy)
+        self.assertIs(record.schema, record_deep_copy.schema)
+        record_deep_copy["b"].append(4)
+        self.assertEqual(record["b"], [2, 3])
+
+        record_unpickled = pickle.loads(pickle.dumps(record))
+        self.assertEqual(record, record_unpickled)
@@ -0,0 +1,104 @@
+from datetime import date, datetime
+import unittest
+
+from slupy.data_wrangler.aggregations import get_aggregator
+from slupy.data_wrangler.resampling import get_default_origin, resample_rows
+
+
+class TestResampling(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            {"at": datetime(2024, 1, 1, 10, 15), "amount": 10},
+            {"at": datetime(2024, 1, 1, 12, 5), "amount": 5},
+            {"at": None, "amount": 100},
+            {"at": datetime(2024, 1, 1, 10, 45), "amount": 20},
+        ]
+        self.specs = [("total", "amount", get_aggregator("sum")), ("num_rows", "amount", get_aggregator("size"))]
+
+    def test_resample_rows_by_fixed_width_offset(self):
+        result = resample_rows(self.rows, time_field="at", offset_kwargs={"hours": 1}, specs=self.specs)
+        self.assertEqual(
+            result,
+            [
+                {"at": datetime(2024, 1, 1, 10), "total": 30, "num_rows": 2},
+                {"at": datetime(2024, 1, 1, 12), "total": 5, "num_rows": 1},
+            ],
+        )
+        result = resample_rows(
+            self.rows,
+            time_field="at",
+            offset_kwargs={"minutes": 30},
+            specs=self.specs,
+            origin=datetime(2024, 1, 1, 10),
+            include_empty_buckets=True,
+        )
+        self.assertEqual(
+            [(row["at"].strftime("%H:%M"), row["total"], row["num_rows"]) for row in result],
+            [("10:00", 10, 1), ("10:30", 20, 1), ("11:00", 0, 0), ("11:30", 0, 0), ("12:00", 5, 1)],
+        )
+
+    def test_resample_rows_by_calendar_offset(self):
+        rows = [
+            {"day": date(2024, 1, 31)},
+            {"day": date(2024, 3, 30)},
+            {"day": date(2024, 2, 28)},
+            {"day": date(2024, 5, 1)},
+        ]
+        specs = [("num_rows", "day", get_aggregator("size"))]
+        self.assertEqual(
+            resample_rows(rows, time_field="day", offset_kwargs={"months": 1}, specs=specs, include_empty_buckets=True),
+            [
+                {"day": date(2024, 1, 1), "num_rows": 1},
+                {"day": date(2024, 2, 1), "num_rows": 1},
+                {"day": date(2024, 3, 1), "num_rows": 1},
+                {"day": date(2024, 4, 1), "num_rows": 0},
+                {"day": date(2024, 5, 1), "num_rows": 1},
+            ],
+        )
+        # Each boundary is computed from the origin as per `TimeTravel`, so the day of month does not drift
+        self.assertEqual(
+            resample_rows(rows, time_field="day", offset_kwargs={"months": 1}, specs=specs, origin=date(2024, 1, 31)),
+            [
+                {"day": date(2024, 1, 31), "num_rows": 2},
+                {"day": date(2024, 2, 29), "num_rows": 1},
+                {"day": date(2024, 4, 30), "num_rows": 1},
+            ],
+        )
+        self.assertEqual(
+            resample_rows(rows, time_field="day", offset_kwargs={"years": 1}, specs=specs, origin=date(2024, 2, 1)),
+            [{"day": date(2024, 2, 1), "num_rows": 3}],
+        )
+
+    def test_get_default_origin(self):
+        value = datetime(2024, 3, 14, 15, 9, 26, 535897)
+        self.assertEqual(get_default_origin(value, offset_name="years"), datetime(2024, 1, 1))
+        self.assertEqual(get_default_origin(value, offset_name="months"), datetime(2024, 3, 1))
+        self.assertEqual(get_default_origin(value, offset_name="weeks"), datetime(2024, 3, 11))  # Monday
+        self.assertEqual(get_default_origin(value, offset_name="days"), datetime(2024, 3, 14))
+        self.assertEqual(get_default_origin(value, offset_name="hours"), datetime(2024, 3, 14, 15))
+        self.assertEqual(get_default_origin(value, offset_name="minutes"), datetime(2024, 3, 14, 15, 9))
+        self.assertEqual(get_default_origin(value, offset_name="seconds"), datetime(2024, 3, 14, 15, 9, 26))
+        self.assertEqual(get_default_origin(value, offset_name="milliseconds"), datetime(2024, 3, 14, 15, 9, 26, 535000))
+        self.assertEqual(get_default_origin(value, offset_name="microseconds"), value)
+        self.assertEqual(get_default_origin(date(2024, 3, 14), offset_name="months"), date(2024, 3, 1))
+
+    def test_resample_rows_without_times(self):
+        self.assertEqual(resample_rows([], time_field="at", offset_kwargs={"days": 1}, specs=self.specs), [])
+        self.assertEqual(
+            resample_rows([{"at": None, "amount": 1}], time_field="at", offset_kwargs={"days": 1}, specs=self.specs),
+            [],
+        )
+        with self.assertRaises(AssertionError):
+            resample_rows([{"at": date(2024, 1, 1)}], time_field="at", offset_kwargs={"hours": 1}, specs=self.specs)
+
+    def test_resample_rows_with_mixed_types(self):
+        rows = [{"at": date(2024, 1, 1), "amount": 1}, {"at": datetime(2024, 1, 2), "amount": 2}]
+        with self.assertRaises(AssertionError):
+            resample_rows(rows, time_field="at", offset_kwargs={"days": 1}, specs=self.specs)
+        with self.assertRaises(AssertionError):
+            resample_rows(self.rows, time_field="at", offset_kwargs={"days": 1}, specs=self.specs, origin=date(2024, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
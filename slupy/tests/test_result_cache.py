@@ -0,0 +1,68 @@
+import copy
+import pickle
+import unittest
+
+from slupy.data_wrangler.result_cache import ResultCache, cached_result
+
+
+class _Counter:
+
+    def __init__(self) -> None:
+        self._result_cache = ResultCache(maxsize=2)
+        self.version = 0
+        self.num_calls = 0
+
+    def _get_cache_version(self) -> int:
+        return self.version
+
+    @cached_result(copy_result=list)
+    def get_items(self, *, fields: list) -> list:
+        self.num_calls += 1
+        return list(fields)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_get_or_compute(self):
+        cache = ResultCache(maxsize=2)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1, version=0), 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2, version=0), 1)
+        self.assertEqual(cache.get_or_compute("b", lambda: 3, version=0), 3)
+        self.assertEqual(cache.get_or_compute("a", lambda: 4, version=0), 1)  # "a" is now the most recently used
+        self.assertEqual(cache.get_or_compute("c", lambda: 5, version=0), 5)  # evicts "b"
+        self.assertEqual(cache.get_or_compute("b", lambda: 6, version=0), 6)
+        stats = cache.get_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size, stats.maxsize), (2, 4, 2, 2))
+        self.assertEqual(cache.get_or_compute("c", lambda: 7, version=1), 7)  # a new version discards the results
+        self.assertEqual(cache.get_stats().size, 1)
+        with self.assertRaises(AssertionError):
+            ResultCache(maxsize=0)
+
+    def test_copies_are_empty(self):
+        cache = ResultCache(maxsize=3)
+        cache.get_or_compute("a", lambda: 1, version=0)
+        for cache_copy in [copy.copy(cache), copy.deepcopy(cache), pickle.loads(pickle.dumps(cache))]:
+            self.assertEqual(cache_copy.maxsize, 3)
+            self.assertEqual(cache_copy.get_stats().size, 0)
+
+    def test_cached_result(self):
+        obj = _Counter()
+        result = obj.get_items(fields=["a", "b"])
+        result.append("c")  # The caller gets a copy
+        self.assertEqual(obj.get_items(fields=["a", "b"]), ["a", "b"])
+        self.assertEqual(obj.num_calls, 1)
+        obj.get_items(fields=["b", "a"])
+        self.assertEqual(obj.num_calls, 2)
+        obj.version += 1
+        obj.get_items(fields=["a", "b"])
+        self.assertEqual(obj.num_calls, 3)
+        obj.get_items(fields=[{"a"}])  # Unhashable arguments are not cached
+        obj.get_items(fields=[{"a"}])
+        self.assertEqual(obj.num_calls, 5)
+        obj._result_cache = None
+        obj.get_items(fields=["a", "b"])
+        self.assertEqual(obj.num_calls, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+from collections import Counter
+import unittest
+
+from slupy.data_wrangler.sampling import reservoir_sample, stratified_reservoir_sample
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_reservoir_sample(self):
+        sample = reservoir_sample(range(10_000), k=10, seed=1)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(sample, sorted(sample))
+        self.assertEqual(len(set(sample)), 10)
+        self.assertEqual(sample, reservoir_sample(iter(range(10_000)), k=10, seed=1))
+        self.assertNotEqual(sample, reservoir_sample(range(10_000), k=10, seed=2))
+        self.assertEqual(reservoir_sample(range(3), k=5), [0, 1, 2])
+        self.assertEqual(reservoir_sample(range(3), k=0), [])
+
+    def test_reservoir_sample_is_uniform(self):
+        counter = Counter()
+        num_trials = 4000
+        for seed in range(num_trials):
+            counter.update(reservoir_sample(range(10), k=3, seed=seed))
+        expected_count = num_trials * 3 / 10
+        for item in range(10):
+            self.assertAlmostEqual(counter[item] / expected_count, 1, delta=0.1)
+
+    def test_stratified_reservoir_sample(self):
+        sample = stratified_reservoir_sample(range(1000), key=lambda x: x % 3, k=5, seed=1)
+        self.assertEqual(sorted(Counter(x % 3 for x in sample).values()), [5, 5, 5])
+        self.assertEqual(sample, sorted(sample))
+
+        sample = stratified_reservoir_sample(range(1000), key=lambda x: x % 3, k_by_group={0: 2, 2: 1}, seed=1)
+        self.assertEqual(Counter(x % 3 for x in sample), {0: 2, 2: 1})
+
+        with self.assertRaises(AssertionError):
+            stratified_reservoir_sample(range(10), key=lambda x: x, k=1, k_by_group={})
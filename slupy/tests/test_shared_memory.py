@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+from slupy.data_wrangler.shared_memory import attach, load_shared_rows, share_rows
+
+
+def _sum_ids(name):
+    with attach(name) as shared_columns:
+        return sum(shared_columns.get_view("id"))
+
+
+def _attach_and_crash(name):
+    shared_columns = attach(name)
+    shared_columns.get_view("id")
+    os._exit(1)
+
+
+def _wait_until_unlinked(name, *, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            attach(name).close()
+        except FileNotFoundError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestSharedMemory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [{"id": idx, "text": f"text-{idx % 3}", "score": idx / 2 if idx % 4 else None} for idx in range(1000)]
+
+    def test_share_rows(self):
+        with share_rows(self.rows) as segment:
+            self.assertEqual(segment.kind, "columnar")
+            self.assertEqual(segment.num_rows, 1000)
+            self.assertEqual(load_shared_rows(segment.name), self.rows)
+            with attach(segment.name) as shared_columns:
+                self.assertEqual(shared_columns.fields, ["id", "text", "score"])
+                self.assertEqual(shared_columns.get_values("score"), [row["score"] for row in self.rows])
+                view = shared_columns.get_view("id")
+                self.assertEqual(view.tolist(), list(range(1000)))
+                self.assertTrue(view.readonly)
+                with self.assertRaises(ValueError):
+                    shared_columns.get_view("score")  # has nulls
+                with self.assertRaises(KeyError):
+                    shared_columns.get_values("missing")
+            with self.assertRaises(ValueError):
+                view.tolist()  # released once detached
+        self.assertTrue(segment.is_released)
+        with self.assertRaises(FileNotFoundError):
+            attach(segment.name)
+
+    def test_share_rows_having_different_fields(self):
+        rows = [{"a": 1}, {"b": [2]}, {}]
+        with share_rows(rows) as segment:
+            self.assertEqual(segment.kind, "pickle")
+            self.assertEqual(load_shared_rows(segment.name), rows)
+            with attach(segment.name) as shared_columns:
+                self.assertIsNone(shared_columns.fields)
+                with self.assertRaises(ValueError):
+                    shared_columns.get_view("a")
+
+    def test_workers(self):
+        for start_method in multiprocessing.get_all_start_methods():
+            with self.subTest(start_method=start_method), share_rows(self.rows) as segment:
+                context = multiprocessing.get_context(start_method)
+                with context.Pool(2) as pool:
+                    self.assertEqual(pool.map(_sum_ids, [segment.name] * 2), [sum(range(1000))] * 2)
+                # A worker that crashes while attached neither unlinks nor leaks the segment
+                process = context.Process(target=_attach_and_crash, args=(segment.name,))
+                process.start()
+                process.join()
+                self.assertEqual(process.exitcode, 1)
+                self.assertEqual(load_shared_rows(segment.name), self.rows)
+            with self.assertRaises(FileNotFoundError):
+                attach(segment.name)
+
+    def test_segment_is_unlinked_after_owner_crashes(self):
+        code = (
+            "import os\n"
+            "from slupy.data_wrangler.shared_memory import share_rows\n"
+            "segment = share_rows([{'a': 1}])\n"
+            "print(segment.name, flush=True)\n"
+            "os._exit(1)\n"
+        )
+        completed_process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(completed_process.returncode, 1)
+        self.assertTrue(_wait_until_unlinked(completed_process.stdout.strip(), timeout=10))
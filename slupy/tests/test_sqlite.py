@@ -0,0 +1,188 @@
+from collections import Counter
+from datetime import datetime
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.expressions import col
+from slupy.data_wrangler.records import Record, Schema
+from slupy.data_wrangler.sqlite import SQLiteDataset, connect, get_column_kinds, write_rows
+
+
+def _make_rows():
+    return [
+        {
+            "id": idx,
+            "category": ["a", "b", "c", None][idx % 4],
+            "flag": idx % 3 == 0,
+            "amount": idx * 1.5,
+            "tags": [idx] if idx % 5 else None,
+            "mixed": [1, "1", 2.5, None][idx % 4],
+        }
+        for idx in range(40)
+    ]
+
+
+class TestSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tempdir.name, "data.db")
+        self.rows = _make_rows()
+        self.sqlite_dataset = Dataset(self.rows, deep_copy=True).to_sqlite(self.path, "rows")
+
+    def tearDown(self):
+        self.sqlite_dataset.close()
+        self._tempdir.cleanup()
+
+    def test_values_are_read_back_as_written(self):
+        rows = self.rows + [{"id": 40, "created_at": datetime(2020, 1, 1), "amount": float("nan"), "big": 2 ** 70}]
+        sqlite_dataset = Dataset(rows, deep_copy=True).to_sqlite(self.path, "other_rows")
+        rows_read = sqlite_dataset.to_dataset().data
+        self.assertEqual(rows_read[:40], [{**row, "created_at": None, "big": None} for row in self.rows])
+        self.assertEqual(rows_read[40]["created_at"], datetime(2020, 1, 1))
+        self.assertEqual(rows_read[40]["big"], 2 ** 70)
+        self.assertNotEqual(rows_read[40]["amount"], rows_read[40]["amount"])  # NaN
+        self.assertIs(rows_read[0]["flag"], True)
+        self.assertEqual(
+            get_column_kinds(sqlite_dataset._connection.connection, "other_rows"),
+            {
+                "id": "number", "category": "any", "flag": "bool", "amount": "pickle",
+                "tags": "pickle", "mixed": "any", "created_at": "pickle", "big": "pickle",
+            },
+        )
+        self.assertEqual(len(sqlite_dataset), 41)
+        sqlite_dataset.close()
+
+    def test_write_rows(self):
+        with self.assertRaises(ValueError):
+            Dataset(self.rows).to_sqlite(self.path, "rows")
+        Dataset([{"id": 100, "category": "d"}]).to_sqlite(self.path, "rows", if_exists="append").close()
+        self.assertEqual(len(self.sqlite_dataset), 41)
+        with self.assertRaises(ValueError):
+            Dataset([{"id": "text"}]).to_sqlite(self.path, "rows", if_exists="append")
+        with self.assertRaises(KeyError):
+            Dataset([{"other": 1}]).to_sqlite(self.path, "rows", if_exists="append")
+        records = Dataset.from_records([(1, True), (2, False)], fields=["id", "flag"])
+        replaced = records.to_sqlite(self.path, "rows", if_exists="replace", batch_size=1)
+        self.assertEqual(replaced.to_dataset().data, [{"id": 1, "flag": True}, {"id": 2, "flag": False}])
+        replaced.close()
+        connection = connect(self.path)
+        self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 2)  # The pragmas are restored
+        with self.assertRaises(AssertionError):
+            write_rows(connection, "empty", [])
+        connection.close()
+
+    def test_from_sqlite(self):
+        dataset = Dataset.from_sqlite(self.path, "SELECT id, flag FROM rows WHERE id < ?", params=[2])
+        self.assertEqual(dataset.data, [{"id": 0, "flag": True}, {"id": 1, "flag": False}])
+        connection = sqlite3.connect(self.path)
+        connection.execute("CREATE TABLE plain (name TEXT, value INTEGER)")
+        connection.execute("INSERT INTO plain VALUES ('x', 1)")
+        connection.commit()
+        connection.close()
+        self.assertEqual(Dataset.from_sqlite(self.path, "SELECT * FROM plain").data, [{"name": "x", "value": 1}])
+        with SQLiteDataset(self.path, "plain") as plain:
+            self.assertEqual(list(plain.filter_rows(func=col("value") == 1)), [{"name": "x", "value": 1}])
+        with self.assertRaises(ValueError):
+            SQLiteDataset(self.path, "missing")
+
+    def test_filter_rows_matches_dataset(self):
+        dataset = Dataset(self.rows)
+        expressions = [
+            col("category") == "a",
+            col("category") != "a",
+            col("category").is_null(),
+            col("category").isin({"a", None}),
+            ~col("category").isin({"a", "b"}),
+            col("flag") & (col("id") > 10),
+            (col("id") * 2 + 1 >= 41) | (col("category") == "c"),
+            col("id") / 4 == 2.5,
+            -col("id") < -35,
+            col("mixed") == 1,
+            col("mixed") == "1",
+            col("tags") == [6],  # Not translated into SQL (as the field is stored as pickles)
+            (col("id") // 7 == 2) & (col("category") != "b"),  # Partially translated
+        ]
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                self.assertEqual(
+                    self.sqlite_dataset.filter_rows(func=expression).to_dataset().data,
+                    dataset.filter_rows(func=expression).data,
+                )
+        self.assertEqual(
+            self.sqlite_dataset.filter_rows(func=lambda row: row["tags"] is not None and row["tags"][0] > 36).to_dataset().data,
+            [row for row in self.rows if row["tags"] is not None and row["tags"][0] > 36],
+        )
+        sql, params = self.sqlite_dataset.filter_rows(func=(col("category") == "a") & (col("id") > 3)).get_sql()
+        self.assertIn('WHERE ("category" IS ?) AND ("id" > ?)', sql)
+        self.assertEqual(params, ["a", 3])
+        with self.assertRaises(KeyError):
+            self.sqlite_dataset.filter_rows(func=col("missing") == 1)
+        with self.assertRaises(AssertionError):
+            list(self.sqlite_dataset.filter_rows(func=lambda row: 1))
+        with self.assertRaises(ZeroDivisionError):
+            list(self.sqlite_dataset.filter_rows(func=lambda row: row["id"] / 0 > 1))
+
+    def test_order_by_and_keep_fields(self):
+        ordered = self.sqlite_dataset.filter_rows(func=col("category").is_not_null()).order_by(
+            fields=["category", "amount"],
+            ascending=[False, True],
+        )
+        self.assertEqual(
+            ordered.keep_fields(fields=["id", "category"]).to_dataset().data,
+            (
+                Dataset(self.rows)
+                .filter_rows(func=col("category").is_not_null())
+                .order_by(fields=["category", "amount"], ascending=[False, True])
+                .keep_fields(fields=["id", "category"])
+                .data
+            ),
+        )
+        self.assertEqual(ordered.keep_fields(fields=["id"]).fields, ["id"])
+        with self.assertRaises(TypeError):
+            self.sqlite_dataset.order_by(fields=["tags"], ascending=[True])
+        with self.assertRaises(KeyError):
+            self.sqlite_dataset.keep_fields(fields=["missing"])
+        list(ordered)
+        indexes = [name for (name,) in self.sqlite_dataset._connection.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )]
+        self.assertEqual(sorted(indexes), ["slupy_index__rows__category_desc__amount_asc"])
+        self.sqlite_dataset.create_index(fields=["id"])
+        plan = self.sqlite_dataset._connection.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM rows WHERE "id" IS 3'
+        ).fetchall()
+        self.assertIn("slupy_index__rows__id_asc", str(plan))
+
+    def test_drop_duplicates(self):
+        dataset = Dataset(self.rows)
+        for keep in ["first", "last", "none"]:
+            with self.subTest(keep=keep):
+                self.assertEqual(
+                    self.sqlite_dataset.drop_duplicates(subset=["category", "flag"], keep=keep).to_dataset().data,
+                    dataset.drop_duplicates(subset=["category", "flag"], keep=keep).data,
+                )
+        ordered = self.sqlite_dataset.order_by(fields=["id"], ascending=[False]).keep_fields(fields=["id", "category"])
+        self.assertEqual(
+            list(ordered.drop_duplicates(subset=["category"])),
+            [{"id": 39, "category": None}, {"id": 38, "category": "c"}, {"id": 37, "category": "b"}, {"id": 36, "category": "a"}],
+        )
+        self.assertEqual(len(self.sqlite_dataset.keep_fields(fields=["category"]).drop_duplicates()), 4)
+        self.assertEqual(len(self.sqlite_dataset.filter_rows(func=col("id") < 2).drop_duplicates(subset=["flag"])), 2)
+        with self.assertRaises(TypeError):
+            self.sqlite_dataset.drop_duplicates(subset=["tags"])
+
+    def test_value_counts(self):
+        fields = ["id", "category", "flag", "amount", "mixed"]
+        filtered = self.sqlite_dataset.filter_rows(func=col("id") < 30).keep_fields(fields=fields)
+        self.assertEqual(filtered.value_counts(), Dataset(self.rows[:30]).keep_fields(fields=fields).value_counts())
+        with self.assertRaises(TypeError):
+            self.sqlite_dataset.value_counts()  # Lists are unhashable (like with `Dataset.value_counts()`)
+        self.assertEqual(filtered.keep_fields(fields=["flag"]).value_counts(), {"flag": Counter({False: 20, True: 10})})
+
+
+if __name__ == "__main__":
+    unittest.main()
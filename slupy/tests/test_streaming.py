@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+
+from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.expressions import col
+from slupy.data_wrangler.streaming import AsyncDatasetStream
+
+
+async def _generate_rows(num_rows: int, /, *, log: list = None):
+    for idx in range(num_rows):
+        await asyncio.sleep(0)
+        if log is not None:
+            log.append(("produced", idx))
+        yield {"id": idx, "group": idx % 3, "text": f"text-{idx}"}
+
+
+class TestAsyncDatasetStream(unittest.TestCase):
+
+    def test_operations(self):
+        async def double(row):
+            await asyncio.sleep(0)
+            return row["id"] * 2
+
+        stream = (
+            AsyncDatasetStream(_generate_rows(100), chunk_size=7)
+            .filter_rows(func=lambda row: row["id"] % 2 == 0)
+            .filter_rows(func=col("id") < 60)
+            .compute_field(field="doubled", func=double, concurrency=3)
+            .compute_field(field="tripled", func=lambda row: row["id"] * 3)
+            .compute_field(field="quadrupled", func=col("id") * 4)
+            .drop_fields(fields=["text"])
+            .drop_duplicates(subset=["group"])
+        )
+        dataset = asyncio.run(stream.to_dataset())
+        self.assertIsInstance(dataset, Dataset)
+        self.assertEqual(
+            dataset.data,
+            [
+                {"id": 0, "group": 0, "doubled": 0, "tripled": 0, "quadrupled": 0},
+                {"id": 2, "group": 2, "doubled": 4, "tripled": 6, "quadrupled": 8},
+                {"id": 4, "group": 1, "doubled": 8, "tripled": 12, "quadrupled": 16},
+            ],
+        )
+        with self.assertRaises(AssertionError):
+            asyncio.run(stream.to_dataset())  # Already consumed
+
+    def test_regular_iterable_and_deep_copy(self):
+        rows = [{"id": idx} for idx in range(10)]
+        stream = AsyncDatasetStream(rows, chunk_size=3, deep_copy=True).compute_field(field="x", func=lambda row: 1)
+        dataset = asyncio.run(stream.to_dataset())
+        self.assertEqual(len(dataset), 10)
+        self.assertNotIn("x", rows[0])
+        stream = AsyncDatasetStream(rows, chunk_size=3).compute_field(field="x", func=lambda row: 1)
+        asyncio.run(stream.to_dataset())
+        self.assertIn("x", rows[0])
+
+    def test_iteration_and_sink(self):
+        async def collect_rows():
+            return [row["id"] async for row in AsyncDatasetStream(_generate_rows(10), chunk_size=4)]
+
+        self.assertEqual(asyncio.run(collect_rows()), list(range(10)))
+
+        chunks = []
+
+        async def write_chunk(chunk):
+            await asyncio.sleep(0)
+            chunks.append(len(chunk))
+
+        num_rows = asyncio.run(AsyncDatasetStream(_generate_rows(10), chunk_size=4).to_sink(write_chunk))
+        self.assertEqual((num_rows, chunks), (10, [4, 4, 2]))
+        num_rows = asyncio.run(AsyncDatasetStream(_generate_rows(10), chunk_size=4).to_sink(chunks.append))
+        self.assertEqual(num_rows, 10)
+
+    def test_backpressure(self):
+        log = []
+
+        async def slow_sink(chunk):
+            log.append(("consumed", chunk[-1]["id"]))
+            await asyncio.sleep(0.001)
+
+        stream = AsyncDatasetStream(_generate_rows(200, log=log), chunk_size=10, max_pending_chunks=1)
+        asyncio.run(stream.drop_fields(fields=["text"]).to_sink(slow_sink))
+        num_consumed = 0
+        for event, idx in log:
+            if event == "consumed":
+                num_consumed = idx + 1
+            else:
+                # At most 1 chunk per queue (2 queues), plus the chunks being read, transformed and consumed
+                self.assertLess(idx - num_consumed, 10 * 5)
+
+    def test_concurrency(self):
+        num_running = 0
+        max_num_running = 0
+
+        async def fetch(row):
+            nonlocal num_running, max_num_running
+            num_running += 1
+            max_num_running = max(max_num_running, num_running)
+            await asyncio.sleep(0.001)
+            num_running -= 1
+            return row["id"]
+
+        stream = AsyncDatasetStream(_generate_rows(50), chunk_size=20).compute_field(field="x", func=fetch, concurrency=4)
+        dataset = asyncio.run(stream.to_dataset())
+        self.assertEqual(dataset.get_values_by_field(field="x"), list(range(50)))
+        self.assertEqual(max_num_running, 4)
+
+    def test_errors_are_raised(self):
+        def fail(row):
+            if row["id"] == 25:
+                raise ValueError("bad row")
+            return row["id"]
+
+        async def failing_source():
+            yield {"id": 0}
+            raise ConnectionError("source failed")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncDatasetStream(_generate_rows(100), chunk_size=10).compute_field(field="x", func=fail).to_dataset())
+        with self.assertRaises(ConnectionError):
+            asyncio.run(AsyncDatasetStream(failing_source()).drop_fields(fields=["id"]).to_dataset())
+        with self.assertRaises(AssertionError):
+            asyncio.run(AsyncDatasetStream(_generate_rows(10)).filter_rows(func=lambda row: 1).to_dataset())
+
+    def test_consumer_stops_early(self):
+        async def take_first_chunk():
+            stream = AsyncDatasetStream(_generate_rows(1000), chunk_size=10, max_pending_chunks=1)
+            async for chunk in stream.iter_chunks():
+                return chunk
+
+        self.assertEqual(len(asyncio.run(take_first_chunk())), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
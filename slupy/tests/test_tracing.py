@@ -0,0 +1,82 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from slupy.data_wrangler.dataset import Dataset
+from slupy.data_wrangler.tracing import (
+    ChromeTraceSink,
+    InMemorySink,
+    LoggingSink,
+    trace_operations,
+)
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.dataset = Dataset([{"a": idx % 3, "b": None if idx % 4 == 0 else idx} for idx in range(20)])
+
+    def test_in_memory_sink(self):
+        sink = InMemorySink()
+        with trace_operations(sinks=[sink]):
+            self.dataset.drop_nulls().value_counts()
+            self.dataset.has_duplicates(subset=["a"])
+            self.dataset.filter_rows(func=lambda row: row["a"] == 0, inplace=True)
+            with self.assertRaises(KeyError):
+                self.dataset.order_by(fields=["c"], ascending=[True])
+
+        self.dataset.value_counts()  # not traced outside the context
+
+        events_by_operation = {}
+        for event in sink.events:
+            events_by_operation.setdefault(event.operation, []).append(event)
+
+        drop_nulls_event = events_by_operation["Dataset.drop_nulls"][0]
+        self.assertEqual((drop_nulls_event.rows_in, drop_nulls_event.rows_out), (20, 15))
+        self.assertTrue(drop_nulls_event.copied)
+        self.assertEqual(drop_nulls_event.depth, 0)
+        self.assertIsNone(drop_nulls_event.peak_memory_delta)
+        self.assertGreaterEqual(drop_nulls_event.wall_time, 0)
+
+        find_duplicate_indices_event = events_by_operation["Dataset.find_duplicate_indices"][0]
+        self.assertEqual(find_duplicate_indices_event.depth, 1)  # called by `has_duplicates()`
+        self.assertEqual(events_by_operation["Dataset.has_duplicates"][0].depth, 0)
+
+        filter_rows_event = events_by_operation["Dataset.filter_rows"][0]
+        self.assertEqual(filter_rows_event.depth, 0)
+        self.assertFalse(filter_rows_event.copied)
+        self.assertEqual(filter_rows_event.rows_out, 7)
+
+        value_counts_event = events_by_operation["Dataset.value_counts"][0]
+        self.assertIsNone(value_counts_event.rows_out)
+        self.assertIsNone(value_counts_event.copied)
+        self.assertEqual(len(events_by_operation["Dataset.value_counts"]), 1)
+
+        self.assertEqual(events_by_operation["Dataset.order_by"][0].error, "KeyError")
+
+    def test_track_memory(self):
+        sink = InMemorySink()
+        with trace_operations(sinks=[sink], track_memory=True):
+            self.dataset.copy()
+        self.assertGreater(sink.events[0].peak_memory_delta, 0)
+
+    def test_logging_sink(self):
+        with self.assertLogs("slupy.data_wrangler.tracing", level=logging.INFO) as logs:
+            with trace_operations(sinks=[LoggingSink()]):
+                self.dataset.get_unique_fields()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Dataset.get_unique_fields took", logs.output[0])
+
+    def test_chrome_trace_sink(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, "trace.json")
+            with trace_operations(sinks=[ChromeTraceSink(filepath=filepath)]):
+                self.dataset.keep_fields(fields=["a"])
+            with open(filepath, mode="r") as fp:
+                trace = json.load(fp)
+        names = [event["name"] for event in trace["traceEvents"]]
+        self.assertIn("Dataset.keep_fields", names)
+        self.assertIn("Dataset.drop_fields", names)
+        self.assertTrue(all(event["ph"] == "X" for event in trace["traceEvents"]))